@@ -1,7 +1,17 @@
 #!/usr/bin/env bash
-# Default hook: Clean up when conversation is archived
+# Default hook: Move an archived conversation to the cold search tier
 # Runs after a conversation is archived
 
+# Graceful degradation - exit silently if dependencies missing
+if ! command -v cortext &> /dev/null; then
+    exit 0
+fi
+
+# Check if RAG dependencies are available
+if ! python3 -c "import cortext_rag" 2>/dev/null; then
+    exit 0
+fi
+
 # Get conversation path from argument
 CONVERSATION_PATH="$1"
 
@@ -9,7 +19,7 @@ if [ -z "$CONVERSATION_PATH" ]; then
     exit 0
 fi
 
-# Future: Remove from active search index, update stats, etc.
-# For now, this is a placeholder that does nothing
+# Searched only when recent conversations do not answer a query
+cortext rag archive "$CONVERSATION_PATH" 2>/dev/null || true
 
 exit 0
@@ -1,5 +1,6 @@
 """Embed command for RAG pipeline."""
 
+from importlib.util import find_spec
 from pathlib import Path
 
 import typer
@@ -10,12 +11,17 @@ console = Console()
 
 
 def _check_rag_dependencies():
-    """Check if RAG dependencies are installed."""
+    """Check if the RAG dependencies of the workspace's backend are installed."""
+    from cortext_rag.config import RAGConfig
+
     try:
-        import chromadb
-        import fastembed
-        return True
-    except ImportError:
+        required = RAGConfig.load(Path.cwd()).required_packages
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    # find_spec locates the packages without paying for their import
+    if not all(find_spec(name) for name in required):
         console.print("[red]Error:[/red] RAG dependencies not installed")
         console.print("\nInstall with:")
         console.print("  [cyan]pip install 'cortext-workspace[rag]'[/cyan]")
@@ -23,6 +29,7 @@ def _check_rag_dependencies():
         console.print("\nOr install all optional dependencies:")
         console.print("  [cyan]pip install 'cortext-workspace[all]'[/cyan]")
         raise typer.Exit(1)
+    return True
 
 
 def embed_command(
@@ -30,6 +37,12 @@ def embed_command(
     all_workspace: bool = typer.Option(
         False, "--all", help="Embed entire workspace"
     ),
+    plan: bool = typer.Option(
+        False, "--plan", help="Show what would be embedded and estimated cost"
+    ),
+    json_output: bool = typer.Option(
+        False, "--json", help="Print the --plan result as JSON"
+    ),
 ) -> None:
     """Embed documents for semantic search.
 
@@ -40,10 +53,8 @@ def embed_command(
         cortext embed ./brainstorm/2025-11/
         cortext embed ./docs/research.pdf
         cortext embed --all
+        cortext embed --all --plan
     """
-    _check_rag_dependencies()
-    from cortext_rag import mcp_tools
-
     if not path and not all_workspace:
         console.print(
             "[red]Error:[/red] Specify a path or use --all for workspace-wide embedding"
@@ -60,6 +71,16 @@ def embed_command(
         )
         raise typer.Exit(1)
 
+    if plan:
+        # Planning only parses files: no embedding model or vector store
+        from cortext_rag.planner import plan_path
+
+        _show_plan(plan_path(path, str(workspace_path)), json_output)
+        return
+
+    _check_rag_dependencies()
+    from cortext_rag import mcp_tools
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -76,17 +97,62 @@ def embed_command(
         console.print(f"[red]Error:[/red] {result['error']}")
         raise typer.Exit(1)
 
+    if result.get("queued") and not result.get("total_files"):
+        console.print(
+            "\n[green]✓[/green] Another embedding job is running; "
+            "it will embed these files before it finishes"
+        )
+        return
+
     # Show results
     embedded = result.get("embedded", 0)
     skipped = result.get("skipped", 0)
-    total = result.get("total_files", embedded + skipped)
+    total = result.get("total_files", embedded + skipped + result.get("shared", 0))
 
     console.print(f"\n[green]✓[/green] Embedding complete")
     console.print(f"  Files embedded: {embedded}")
     console.print(f"  Files skipped (unchanged): {skipped}")
+    if result.get("shared"):
+        console.print(f"  Files deduplicated (identical content): {result['shared']}")
     console.print(f"  Total files processed: {total}")
 
     if result.get("errors"):
         console.print(f"\n[yellow]Warnings:[/yellow]")
         for error in result["errors"]:
             console.print(f"  • {error}")
+
+
+def _show_plan(result: dict, json_output: bool) -> None:
+    """Display an embedding plan."""
+    if "error" in result:
+        console.print(f"[red]Error:[/red] {result['error']}")
+        raise typer.Exit(1)
+
+    if json_output:
+        import json
+
+        print(json.dumps(result, indent=2))
+        return
+
+    console.print("\n[bold]Embedding Plan[/bold]\n")
+    console.print(f"  New: {len(result['new'])}")
+    console.print(f"  Modified: {len(result['modified'])}")
+    console.print(f"  Unchanged: {result['unchanged']}")
+    console.print(f"  Deleted: {len(result['deleted'])}")
+    console.print(f"  Renamed: {len(result['renamed'])}")
+    if result["duplicates"]:
+        console.print(f"  Identical to embedded content: {len(result['duplicates'])}")
+
+    console.print(f"\n  Estimated chunks to embed: {result['estimated_chunks']}")
+    seconds = result["estimated_seconds"]
+    if seconds is None:
+        console.print(
+            "  Estimated time: [dim]unknown (no throughput recorded yet)[/dim]"
+        )
+    else:
+        console.print(f"  Estimated time: {seconds:.1f}s")
+
+    if result.get("errors"):
+        console.print(f"\n[yellow]Warnings:[/yellow]")
+        for error in result["errors"]:
+            console.print(f"  • {error}")
@@ -1,6 +1,8 @@
 """RAG status and management commands."""
 
+from importlib.util import find_spec
 from pathlib import Path
+from typing import Optional
 
 import typer
 from rich.console import Console
@@ -12,12 +14,17 @@ app = typer.Typer(help="RAG pipeline management commands")
 
 
 def _check_rag_dependencies():
-    """Check if RAG dependencies are installed."""
+    """Check if the RAG dependencies of the workspace's backend are installed."""
+    from cortext_rag.config import RAGConfig
+
     try:
-        import chromadb
-        import fastembed
-        return True
-    except ImportError:
+        required = RAGConfig.load(Path.cwd()).required_packages
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    # find_spec locates the packages without paying for their import
+    if not all(find_spec(name) for name in required):
         console.print("[red]Error:[/red] RAG dependencies not installed")
         console.print("\nInstall with:")
         console.print("  [cyan]pip install 'cortext-workspace[rag]'[/cyan]")
@@ -25,6 +32,7 @@ def _check_rag_dependencies():
         console.print("\nOr install all optional dependencies:")
         console.print("  [cyan]pip install 'cortext-workspace[all]'[/cyan]")
         raise typer.Exit(1)
+    return True
 
 
 @app.command("status")
@@ -64,10 +72,60 @@ def rag_status() -> None:
 
     table.add_row("Total Documents", str(result["num_documents"]))
     table.add_row("Total Chunks", str(result["total_chunks"]))
+    table.add_row("Backend", f"{result['backend']} ({result['distance']})")
     table.add_row("Database Path", result["db_path"])
+    for shard, count in (result.get("shards") or {}).items():
+        table.add_row(f"  Shard {shard}", f"{count} chunks")
+    tiers = result.get("tiers")
+    if tiers:
+        cutoff = str(tiers["hot_cutoff"])
+        table.add_row(
+            "Tiers",
+            f"{tiers['hot']} hot, {tiers['cold']} cold "
+            f"(hot from {cutoff[:4]}-{cutoff[4:6]}-{cutoff[6:]})",
+        )
+    for collection, ann in (result.get("ann") or {}).items():
+        state = "in use" if ann["active"] else "below threshold"
+        if ann["stale"]:
+            state += ", needs re-clustering"
+        table.add_row(
+            f"  IVF {collection}", f"{ann['lists']} lists, {ann['count']} chunks ({state})"
+        )
+
+    table.add_row("Keyword Index", f"{result['lexical_chunks']} chunks")
+    table.add_row("Document Vectors", str(result["document_vectors"]))
+    projection = result.get("projection")
+    if projection:
+        recall = (
+            f", recall@10 {projection['recall']:.0%}"
+            if projection.get("recall") is not None
+            else ""
+        )
+        table.add_row(
+            "Projection",
+            f"{projection['method']} {projection['source_dim']} → "
+            f"{projection['dim']} dims{recall}",
+        )
 
     console.print(table)
 
+    if result["lexical_chunks"] < result["total_chunks"]:
+        console.print(
+            "\n[yellow]The keyword index is incomplete.[/yellow] "
+            "Run [cyan]cortext rag reindex[/cyan] to build it for hybrid search."
+        )
+    if result["document_vectors"] < result["num_documents"]:
+        console.print(
+            "\n[yellow]Some documents have no document vector.[/yellow] "
+            "Run [cyan]cortext rag reindex[/cyan] to compute them for similar-document lookups."
+        )
+
+    if result.get("needs_reindex"):
+        console.print(
+            "\n[yellow]Index settings differ from the workspace config.[/yellow] "
+            "Run [cyan]cortext rag reindex[/cyan] to apply them."
+        )
+
     # Show recent embeddings
     if result.get("recent_embeddings"):
         console.print("\n[bold]Recent Embeddings[/bold]\n")
@@ -91,3 +149,379 @@ def rag_status() -> None:
     else:
         console.print("\n[yellow]No embeddings found.[/yellow]")
         console.print("Run [cyan]cortext embed --all[/cyan] to embed workspace.")
+
+
+@app.command("reindex")
+def rag_reindex(
+    conversation_type: Optional[str] = typer.Option(
+        None, "--type", "-t", help="Only rebuild this type's shard"
+    ),
+) -> None:
+    """Rebuild the vector index with the current RAG settings.
+
+    Applies changes to the distance space and HNSW parameters to an existing
+    store. Stored vectors are copied, so nothing is re-embedded. With
+    shard_by_type enabled, --type rebuilds a single shard.
+
+    Examples:
+        cortext rag reindex
+        cortext rag reindex --type debug
+    """
+    _check_rag_dependencies()
+    from cortext_rag import mcp_tools
+
+    workspace_path = Path.cwd()
+
+    # Check for valid workspace
+    if not (workspace_path / ".workspace" / "registry.json").exists():
+        console.print(
+            "[red]Error:[/red] Not in a Cortext workspace. "
+            "Run [cyan]cortext init[/cyan] first."
+        )
+        raise typer.Exit(1)
+
+    with console.status("Reindexing vector store..."):
+        result = mcp_tools.reindex_store(str(workspace_path), conversation_type)
+
+    if "error" in result:
+        console.print(f"[red]Error:[/red] {result['error']}")
+        raise typer.Exit(1)
+
+    console.print(
+        f"[green]✓[/green] Reindexed {result['reindexed']} chunks "
+        f"({result['backend']}, {result['distance']}) in {result['seconds']}s"
+    )
+
+
+@app.command("build-ann")
+def rag_build_ann(
+    conversation_type: Optional[str] = typer.Option(
+        None, "--type", "-t", help="Only train this type's shard"
+    ),
+    if_stale: bool = typer.Option(
+        False,
+        "--if-stale",
+        help="Only train large shards whose index is missing or has drifted",
+    ),
+) -> None:
+    """Train the IVF approximate search index.
+
+    Clusters the stored vectors and writes posting lists to disk. Searches
+    use the index once a shard holds at least ann_threshold chunks, and
+    embedding runs keep it up to date. Run it again (or periodically with
+    --if-stale) to re-cluster after the workspace has grown.
+
+    Examples:
+        cortext rag build-ann
+        cortext rag build-ann --if-stale
+    """
+    _check_rag_dependencies()
+    from cortext_rag import mcp_tools
+
+    workspace_path = Path.cwd()
+
+    # Check for valid workspace
+    if not (workspace_path / ".workspace" / "registry.json").exists():
+        console.print(
+            "[red]Error:[/red] Not in a Cortext workspace. "
+            "Run [cyan]cortext init[/cyan] first."
+        )
+        raise typer.Exit(1)
+
+    with console.status("Training IVF index..."):
+        result = mcp_tools.build_ann_index(
+            str(workspace_path), conversation_type, stale_only=if_stale
+        )
+
+    if "error" in result:
+        console.print(f"[red]Error:[/red] {result['error']}")
+        raise typer.Exit(1)
+
+    if not result["built"]:
+        console.print("[green]✓[/green] IVF indexes are up to date")
+        return
+
+    for collection, count in result["built"].items():
+        console.print(f"[green]✓[/green] Indexed {count} chunks of {collection}")
+    console.print(
+        f"  Done in {result['seconds']}s. Used for searches from "
+        f"{result['threshold']} chunks per collection."
+    )
+
+
+@app.command("archive")
+def rag_archive(
+    path: Path = typer.Argument(..., help="Archived conversation directory or file"),
+) -> None:
+    """Move an archived conversation to the cold tier.
+
+    With tiering enabled, cold chunks are searched only when the recent
+    results are weak or a date filter reaches back far enough. The path is
+    remembered, so the conversation stays cold when it is embedded again.
+    Runs from the conversation:archive hook.
+
+    Examples:
+        cortext rag archive debug/2024-03-02/login-timeout
+    """
+    _check_rag_dependencies()
+    from cortext_rag import mcp_tools
+
+    workspace_path = Path.cwd()
+
+    # Check for valid workspace
+    if not (workspace_path / ".workspace" / "registry.json").exists():
+        console.print(
+            "[red]Error:[/red] Not in a Cortext workspace. "
+            "Run [cyan]cortext init[/cyan] first."
+        )
+        raise typer.Exit(1)
+
+    result = mcp_tools.archive_conversation(str(path), str(workspace_path))
+
+    if "error" in result:
+        console.print(f"[red]Error:[/red] {result['error']}")
+        raise typer.Exit(1)
+
+    console.print(f"[green]✓[/green] Archived {result['archived']} documents")
+    if not result["tiering"]:
+        console.print(
+            "  Tiering is off: chunks are marked archived but stay searched. "
+            'Set [cyan]"tiering": true[/cyan] to move them to the cold tier.'
+        )
+
+
+@app.command("retier")
+def rag_retier() -> None:
+    """Move chunks between the hot and cold tiers.
+
+    Conversations older than hot_days move to the cold tier. Run it
+    periodically (e.g. daily) and after changing tiering or hot_days.
+
+    Examples:
+        cortext rag retier
+    """
+    _check_rag_dependencies()
+    from cortext_rag import mcp_tools
+
+    workspace_path = Path.cwd()
+
+    # Check for valid workspace
+    if not (workspace_path / ".workspace" / "registry.json").exists():
+        console.print(
+            "[red]Error:[/red] Not in a Cortext workspace. "
+            "Run [cyan]cortext init[/cyan] first."
+        )
+        raise typer.Exit(1)
+
+    with console.status("Moving chunks between tiers..."):
+        result = mcp_tools.retier_store(str(workspace_path))
+
+    if "error" in result:
+        console.print(f"[red]Error:[/red] {result['error']}")
+        raise typer.Exit(1)
+
+    console.print(f"[green]✓[/green] Moved {result['moved']} chunks in {result['seconds']}s")
+    if result["tiers"]:
+        console.print(
+            f"  Hot: {result['tiers']['hot']} chunks, cold: {result['tiers']['cold']} chunks"
+        )
+
+
+@app.command("project")
+def rag_project(
+    dim: Optional[int] = typer.Option(
+        None, "--dim", "-d", help="Dimension of the projected vectors"
+    ),
+    method: str = typer.Option(
+        "pca", "--method", "-m", help="Projection method: pca or random"
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Only report the recall impact"
+    ),
+    remove: bool = typer.Option(
+        False, "--remove", help="Drop the projection (requires re-embedding)"
+    ),
+) -> None:
+    """Reduce stored vectors to fewer dimensions.
+
+    Fits a projection (PCA by default) on the workspace's own vectors,
+    reports how many exact top-10 neighbors it keeps, and rewrites the
+    store with the reduced vectors. Nothing is re-embedded: new chunks and
+    search queries are projected with the same matrix.
+
+    Examples:
+        cortext rag project --dim 128 --dry-run
+        cortext rag project --dim 128
+        cortext rag project --remove
+    """
+    _check_rag_dependencies()
+    from cortext_rag import mcp_tools
+
+    workspace_path = Path.cwd()
+
+    # Check for valid workspace
+    if not (workspace_path / ".workspace" / "registry.json").exists():
+        console.print(
+            "[red]Error:[/red] Not in a Cortext workspace. "
+            "Run [cyan]cortext init[/cyan] first."
+        )
+        raise typer.Exit(1)
+
+    if not remove and dim is None:
+        console.print("[red]Error:[/red] Specify --dim (or --remove)")
+        raise typer.Exit(1)
+
+    with console.status("Fitting projection..."):
+        result = mcp_tools.project_store(
+            str(workspace_path), dim=dim, method=method, dry_run=dry_run, remove=remove
+        )
+
+    if "error" in result:
+        console.print(f"[red]Error:[/red] {result['error']}")
+        raise typer.Exit(1)
+
+    if remove:
+        console.print(
+            "[green]✓[/green] Projection removed and store cleared. "
+            "Run [cyan]cortext embed --all[/cyan] to re-embed the workspace."
+        )
+        return
+
+    recall = "-" if result["recall"] is None else f"{result['recall']:.1%}"
+    table = Table(show_header=False, box=None)
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value")
+    table.add_row("Method", result["method"])
+    table.add_row("Dimensions", f"{result['stored_dim']} → {result['dim']}")
+    table.add_row(
+        "Vector size",
+        f"{_format_size(4 * result['stored_dim'])} → {_format_size(4 * result['dim'])}",
+    )
+    table.add_row(
+        "Recall@10",
+        f"{recall} (over {result['held_out']} of {result['sample']} sampled vectors, "
+        "held out of the fit)",
+    )
+    console.print(table)
+
+    if dry_run:
+        console.print("\nRun again without [cyan]--dry-run[/cyan] to apply it.")
+        return
+
+    console.print(
+        f"\n[green]✓[/green] Projected {result['rewritten']} chunks "
+        f"in {result['seconds']}s"
+    )
+
+
+def _format_size(num_bytes: int) -> str:
+    """Format a byte count for display."""
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def _format_latency(ms: Optional[float]) -> str:
+    """Format a search latency for display."""
+    return "-" if ms is None else f"{ms:.1f} ms"
+
+
+@app.command("compact")
+def rag_compact(
+    repair: bool = typer.Option(
+        False, "--repair", help="Fix differences found by the integrity check"
+    ),
+    json_output: bool = typer.Option(
+        False, "--json", help="Print the report as JSON"
+    ),
+) -> None:
+    """Compact the vector store and check its integrity.
+
+    Rebuilds every collection from its live vectors with a fresh index,
+    reclaims space left by deleted chunks, and compares the store with the
+    embedding status records. Searches keep working while it runs.
+
+    With --repair, orphaned chunks are deleted and documents that are missing
+    or incomplete in the store are marked for the next embedding run.
+
+    Examples:
+        cortext rag compact
+        cortext rag compact --repair
+        cortext rag compact --json
+    """
+    _check_rag_dependencies()
+    from cortext_rag import mcp_tools
+
+    workspace_path = Path.cwd()
+
+    # Check for valid workspace
+    if not (workspace_path / ".workspace" / "registry.json").exists():
+        console.print(
+            "[red]Error:[/red] Not in a Cortext workspace. "
+            "Run [cyan]cortext init[/cyan] first."
+        )
+        raise typer.Exit(1)
+
+    with console.status("Compacting vector store..."):
+        result = mcp_tools.compact_store(str(workspace_path), repair=repair)
+
+    if "error" in result:
+        console.print(f"[red]Error:[/red] {result['error']}")
+        raise typer.Exit(1)
+
+    if json_output:
+        import json
+
+        print(json.dumps(result, indent=2))
+        return
+
+    console.print(
+        f"[green]✓[/green] Compacted {result['chunks']} chunks "
+        f"({result['backend']}) in {result['seconds']}s\n"
+    )
+
+    table = Table()
+    table.add_column("", style="cyan")
+    table.add_column("Before", justify="right")
+    table.add_column("After", justify="right")
+    table.add_row(
+        "Disk usage",
+        _format_size(result["size_before"]),
+        _format_size(result["size_after"]),
+    )
+    table.add_row(
+        "Search latency (median)",
+        _format_latency(result["latency_before_ms"]),
+        _format_latency(result["latency_after_ms"]),
+    )
+    console.print(table)
+
+    integrity = result["integrity"]
+    if integrity["ok"]:
+        console.print("\n[green]✓[/green] Store matches the embedding status records")
+        return
+
+    console.print("\n[yellow]Integrity check found differences:[/yellow]")
+    for path in integrity["missing"]:
+        console.print(f"  • Missing from store: {path}")
+    for item in integrity["mismatched"]:
+        console.print(
+            f"  • {item['path']}: {item['stored']} chunks stored, "
+            f"{item['expected']} expected"
+        )
+    for path in integrity["orphaned"]:
+        console.print(f"  • Stored without status record: {path}")
+    for path in integrity["dangling"]:
+        console.print(f"  • Duplicate of a document no longer embedded: {path}")
+    if result["repaired"]:
+        console.print(
+            "\n[green]✓[/green] Repaired. Run [cyan]cortext embed --all[/cyan] "
+            "to re-embed the affected documents."
+        )
+    else:
+        console.print(
+            "\nRun [cyan]cortext rag compact --repair[/cyan] to fix them."
+        )
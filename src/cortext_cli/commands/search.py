@@ -1,5 +1,6 @@
 """Search command with semantic search support."""
 
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Optional
 
@@ -10,12 +11,17 @@ console = Console()
 
 
 def _check_rag_dependencies():
-    """Check if RAG dependencies are installed."""
+    """Check if the RAG dependencies of the workspace's backend are installed."""
+    from cortext_rag.config import RAGConfig
+
     try:
-        import chromadb
-        import fastembed
-        return True
-    except ImportError:
+        required = RAGConfig.load(Path.cwd()).required_packages
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    # find_spec locates the packages without paying for their import
+    if not all(find_spec(name) for name in required):
         console.print("[red]Error:[/red] RAG dependencies not installed")
         console.print("\nInstall with:")
         console.print("  [cyan]pip install 'cortext-workspace[rag]'[/cyan]")
@@ -23,6 +29,7 @@ def _check_rag_dependencies():
         console.print("\nOr install all optional dependencies:")
         console.print("  [cyan]pip install 'cortext-workspace[all]'[/cyan]")
         raise typer.Exit(1)
+    return True
 
 
 def search_command(
@@ -30,23 +37,50 @@ def search_command(
     semantic: bool = typer.Option(
         False, "--semantic", "-s", help="Use semantic search (requires RAG)"
     ),
+    hybrid: bool = typer.Option(
+        False,
+        "--hybrid",
+        help="Combine semantic and BM25 keyword search (requires RAG)",
+    ),
+    rerank: Optional[bool] = typer.Option(
+        None,
+        "--rerank/--no-rerank",
+        help="Reorder semantic results with a local cross-encoder (default: workspace setting)",
+    ),
     conversation_type: Optional[str] = typer.Option(
         None, "--type", "-t", help="Filter by conversation type"
     ),
     date_range: Optional[str] = typer.Option(
-        None, "--date", "-d", help="Filter by date (YYYY-MM or YYYY-MM-DD)"
+        None, "--date", "-d", help="Filter by date (YYYY, YYYY-MM or YYYY-MM-DD)"
+    ),
+    date_from: Optional[str] = typer.Option(
+        None, "--from", help="Only conversations on or after this date (semantic)"
+    ),
+    date_to: Optional[str] = typer.Option(
+        None, "--to", help="Only conversations on or before this date (semantic)"
     ),
     limit: int = typer.Option(10, "--limit", "-n", help="Maximum results"),
+    timeout_ms: Optional[int] = typer.Option(
+        None,
+        "--timeout-ms",
+        help="Show keyword matches if semantic results take longer (semantic)",
+    ),
 ) -> None:
     """Search workspace conversations.
 
-    By default uses keyword search (ripgrep). Use --semantic for meaning-based search.
+    By default uses keyword search (ripgrep). Use --semantic for meaning-based
+    search, or --hybrid to also rank exact terms such as ticket IDs, function
+    names and error codes.
 
     Examples:
         cortext search "authentication"
         cortext search "login security" --semantic
         cortext search "api design" --semantic --type plan
         cortext search "refactoring" --semantic --date 2025-11
+        cortext search "caching" --semantic --from 2025-09 --to 2025-11-15
+        cortext search "PROJ-1234 timeout" --hybrid --type debug
+        cortext search "who decided on the cache TTL" --semantic --rerank
+        cortext search "token refresh" --semantic --timeout-ms 500
     """
     workspace_path = Path.cwd()
 
@@ -58,9 +92,18 @@ def search_command(
         )
         raise typer.Exit(1)
 
-    if semantic:
+    if semantic or hybrid:
         _semantic_search(
-            query, workspace_path, conversation_type, date_range, limit
+            query,
+            workspace_path,
+            conversation_type,
+            date_range,
+            limit,
+            date_from=date_from,
+            date_to=date_to,
+            mode="hybrid" if hybrid else "semantic",
+            rerank=rerank,
+            timeout_ms=timeout_ms,
         )
     else:
         _keyword_search(query, workspace_path, conversation_type, limit)
@@ -72,8 +115,13 @@ def _semantic_search(
     conversation_type: Optional[str],
     date_range: Optional[str],
     limit: int,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    mode: str = "semantic",
+    rerank: Optional[bool] = None,
+    timeout_ms: Optional[int] = None,
 ) -> None:
-    """Perform semantic search using RAG pipeline."""
+    """Perform semantic (or hybrid) search using RAG pipeline."""
     _check_rag_dependencies()
     from cortext_rag import mcp_tools
 
@@ -83,6 +131,11 @@ def _semantic_search(
         n_results=limit,
         conversation_type=conversation_type,
         date_range=date_range,
+        date_from=date_from,
+        date_to=date_to,
+        mode=mode,
+        rerank=rerank,
+        timeout_ms=timeout_ms,
     )
 
     if "error" in result:
@@ -90,7 +143,13 @@ def _semantic_search(
         raise typer.Exit(1)
 
     # Display results
-    console.print(f"\n[bold]Semantic Search:[/bold] {query}\n")
+    title = "Hybrid Search" if mode == "hybrid" else "Semantic Search"
+    console.print(f"\n[bold]{title}:[/bold] {query}\n")
+    if result["degraded"]:
+        console.print(
+            f"[yellow]Semantic results took longer than {timeout_ms} ms; "
+            "showing keyword matches.[/yellow]\n"
+        )
 
     if not result["results"]:
         console.print("[yellow]No results found.[/yellow]")
@@ -101,13 +160,18 @@ def _semantic_search(
         return
 
     for i, item in enumerate(result["results"], 1):
-        score_pct = int(item["score"] * 100)
+        # Keyword matches carry unbounded BM25 scores
+        score = (
+            f"{item['score']:.2f} (BM25)"
+            if result["degraded"]
+            else f"{int(item['score'] * 100)}%"
+        )
         text = item["text"]
         if len(text) > 200:
             text = text[:197] + "..."
 
         console.print(f"[cyan]{i}.[/cyan] [bold]{item['conversation']}[/bold]")
-        console.print(f"   Score: {score_pct}%")
+        console.print(f"   Score: {score}")
         console.print(f"   {text}")
         console.print(f"   [dim]{item['source_path']}[/dim]\n")
 
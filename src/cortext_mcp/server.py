@@ -255,12 +255,104 @@ class CortextMCPServer:
                         },
                         "date_range": {
                             "type": "string",
-                            "description": "Filter by date range (YYYY-MM or YYYY-MM-DD format)",
+                            "description": "Filter by date range (YYYY, YYYY-MM or YYYY-MM-DD format)",
+                        },
+                        "date_from": {
+                            "type": "string",
+                            "description": "Only conversations on or after this date (YYYY, YYYY-MM or YYYY-MM-DD)",
+                        },
+                        "date_to": {
+                            "type": "string",
+                            "description": "Only conversations on or before this date (YYYY, YYYY-MM or YYYY-MM-DD)",
+                        },
+                        "mode": {
+                            "type": "string",
+                            "enum": ["semantic", "hybrid"],
+                            "description": "hybrid also matches exact keywords (ticket IDs, function names, error codes) and fuses both rankings",
+                            "default": "semantic",
+                        },
+                        "group_by": {
+                            "type": "string",
+                            "enum": ["document"],
+                            "description": "Return n_results distinct documents, each with its best chunks, instead of raw chunk hits",
+                        },
+                        "aggregate": {
+                            "type": "string",
+                            "enum": ["max", "softmax"],
+                            "description": "How chunk scores combine into a document score when grouping (softmax averages near-best chunks, never above the best)",
+                            "default": "max",
+                        },
+                        "rerank": {
+                            "type": "boolean",
+                            "description": "Reorder the top results with a local cross-encoder (slower, more precise; defaults to the workspace setting)",
+                        },
+                        "diversity": {
+                            "type": "number",
+                            "description": "0 to 1: skip near-duplicate chunks in favour of broader coverage (maximal marginal relevance; not with group_by)",
+                            "default": 0,
+                        },
+                        "timeout_ms": {
+                            "type": "number",
+                            "description": "Deadline in milliseconds: if semantic results are not ready (e.g. the model is still loading), keyword matches are returned with degraded: true",
+                        },
+                        "expand": {
+                            "type": "number",
+                            "description": "Also return each hit merged with up to N neighboring chunks before and after it (context), instead of reading the whole file",
+                            "default": 0,
                         },
                     },
                     "required": ["query"],
                 },
             },
+            {
+                "name": "search_many",
+                "description": "Semantic search for several queries in one call (related phrasings or aspects of a task), with optional fused ranking",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "queries": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Search query texts",
+                        },
+                        "workspace_path": {
+                            "type": "string",
+                            "description": "Optional workspace root path",
+                        },
+                        "n_results": {
+                            "type": "number",
+                            "description": "Maximum number of results per query",
+                            "default": 10,
+                        },
+                        "conversation_type": {
+                            "type": "string",
+                            "description": "Filter by conversation type (e.g., brainstorm, debug, plan)",
+                        },
+                        "date_range": {
+                            "type": "string",
+                            "description": "Filter by date range (YYYY, YYYY-MM or YYYY-MM-DD format)",
+                        },
+                        "date_from": {
+                            "type": "string",
+                            "description": "Only conversations on or after this date (YYYY, YYYY-MM or YYYY-MM-DD)",
+                        },
+                        "date_to": {
+                            "type": "string",
+                            "description": "Only conversations on or before this date (YYYY, YYYY-MM or YYYY-MM-DD)",
+                        },
+                        "fuse": {
+                            "type": "boolean",
+                            "description": "Also return one ranking merged across all queries",
+                            "default": False,
+                        },
+                        "timeout_ms": {
+                            "type": "number",
+                            "description": "Deadline in milliseconds: if semantic results are not ready (e.g. the model is still loading), keyword matches are returned per query with degraded: true",
+                        },
+                    },
+                    "required": ["queries"],
+                },
+            },
             {
                 "name": "get_similar",
                 "description": "Find documents similar to a given source document",
@@ -314,6 +406,8 @@ class CortextMCPServer:
             return self._call_rag_tool(mcp_tools.embed_workspace, arguments)
         elif tool_name == "search_semantic" and RAG_AVAILABLE:
             return self._call_rag_tool(mcp_tools.search_semantic, arguments)
+        elif tool_name == "search_many" and RAG_AVAILABLE:
+            return self._call_rag_tool(mcp_tools.search_many, arguments)
         elif tool_name == "get_similar" and RAG_AVAILABLE:
             return self._call_rag_tool(mcp_tools.get_similar, arguments)
         elif tool_name == "get_embedding_status" and RAG_AVAILABLE:
@@ -0,0 +1,396 @@
+"""Inverted-file (IVF) approximate nearest-neighbor index.
+
+Spherical k-means centroids partition a collection's vectors into posting
+lists stored on disk::
+
+    <db_path>/ivf/<collection>/
+        manifest.json           # generation, dimension, list sizes
+        g000003/
+            centroids.npy       # float32 (nlist, dim), normalized
+            list-000042.npz     # vectors and ids of one posting list
+
+A search scores the centroids, loads only the ``nprobe`` closest lists and
+ranks their vectors exactly, so memory and time scale with the probed lists
+rather than the collection. Added vectors join the list of their nearest
+centroid and replace earlier entries with the same id. Centroids only change
+when the index is trained again, which writes a new generation directory and
+switches the manifest to it atomically.
+"""
+
+import json
+import math
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import numpy as np
+
+from .backends.numpy_flat import normalize
+
+# Training sample per centroid, and overall cap on the sample
+SAMPLE_PER_LIST = 64
+MAX_SAMPLE = 200_000
+
+# k-means iterations when training
+TRAIN_ITERATIONS = 10
+
+# Retrain once the collection grew or shrank by this fraction since training
+RETRAIN_DRIFT = 0.5
+
+# Rows assigned to centroids per block
+ASSIGN_BLOCK_ROWS = 8192
+
+# Batches of (ids, vectors) fed to training
+Batches = Callable[[], Iterable[tuple[list[str], np.ndarray]]]
+
+
+def default_nlist(count: int) -> int:
+    """Number of posting lists for a collection size (about 4 * sqrt(n))."""
+    return max(1, min(count, int(4 * math.sqrt(count))))
+
+
+def _nearest(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Index of the most similar centroid for each row."""
+    assignments = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), ASSIGN_BLOCK_ROWS):
+        block = vectors[start : start + ASSIGN_BLOCK_ROWS]
+        assignments[start : start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return assignments
+
+
+def spherical_kmeans(
+    vectors: np.ndarray, k: int, iterations: int = TRAIN_ITERATIONS, seed: int = 0
+) -> np.ndarray:
+    """Cluster normalized vectors by cosine similarity.
+
+    Args:
+        vectors: Normalized float32 rows
+        k: Number of clusters
+        iterations: Assignment/update rounds
+        seed: Random seed for initialization
+
+    Returns:
+        Normalized centroids, shape (k, dim)
+    """
+    rng = np.random.default_rng(seed)
+    k = min(k, len(vectors))
+    centroids = vectors[rng.choice(len(vectors), k, replace=False)].copy()
+
+    for _ in range(iterations):
+        assignments = _nearest(vectors, centroids)
+        order = np.argsort(assignments, kind="stable")
+        counts = np.bincount(assignments, minlength=k)
+        sums = np.zeros_like(centroids)
+        filled = counts > 0
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[filled]
+        sums[filled] = np.add.reduceat(vectors[order], starts, axis=0)
+        # Restart empty clusters from random points
+        empty = ~filled
+        if empty.any():
+            sums[empty] = vectors[rng.choice(len(vectors), int(empty.sum()))]
+        centroids = normalize(sums).astype(np.float32)
+
+    return centroids
+
+
+def _save_atomic(path: Path, save: Callable[[Path], None]) -> None:
+    """Write a file through a temporary path and rename it into place."""
+    tmp_file = path.parent / f".tmp-{uuid.uuid4().hex}{path.suffix}"
+    save(tmp_file)
+    os.replace(tmp_file, path)
+
+
+class IVFIndex:
+    """On-disk IVF index over one collection."""
+
+    def __init__(self, path: Path):
+        """Initialize index.
+
+        Args:
+            path: Directory of the index (created by train())
+        """
+        self.path = Path(path)
+        self.manifest_file = self.path / "manifest.json"
+        self._manifest = None
+        self._manifest_key = None
+        self._centroids = None
+        self._id_lists: dict[str, int] | None = None
+
+    # Manifest handling
+
+    def _load_manifest(self) -> dict[str, Any] | None:
+        """Load the manifest, re-reading it only when it changed on disk."""
+        try:
+            stat = self.manifest_file.stat()
+        except FileNotFoundError:
+            self._manifest = self._manifest_key = self._centroids = None
+            self._id_lists = None
+            return None
+
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if key != self._manifest_key:
+            manifest = json.loads(self.manifest_file.read_text())
+            if self._manifest is None or manifest["generation"] != self._manifest["generation"]:
+                self._centroids = None
+            # Changed by another writer: the id map may be out of date
+            self._id_lists = None
+            self._manifest = manifest
+            self._manifest_key = key
+        return self._manifest
+
+    def _save_manifest(self, manifest: dict[str, Any]) -> None:
+        _save_atomic(
+            self.manifest_file, lambda tmp: tmp.write_text(json.dumps(manifest))
+        )
+        stat = self.manifest_file.stat()
+        self._manifest = manifest
+        self._manifest_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    @property
+    def exists(self) -> bool:
+        """Whether the index has been trained."""
+        return self._load_manifest() is not None
+
+    @property
+    def count(self) -> int:
+        """Number of indexed vectors."""
+        manifest = self._load_manifest()
+        return sum(manifest["sizes"]) if manifest else 0
+
+    @property
+    def stale(self) -> bool:
+        """Whether the collection drifted enough since training to retrain."""
+        manifest = self._load_manifest()
+        if manifest is None:
+            return False
+        trained = max(manifest["trained_count"], 1)
+        return abs(self.count - trained) > trained * RETRAIN_DRIFT
+
+    def info(self) -> dict[str, Any]:
+        """Summary of the index for status output."""
+        manifest = self._load_manifest()
+        return {
+            "lists": len(manifest["sizes"]),
+            "count": self.count,
+            "trained_count": manifest["trained_count"],
+            "stale": self.stale,
+        }
+
+    def _generation_dir(self, manifest: dict[str, Any]) -> Path:
+        return self.path / manifest["generation"]
+
+    def _centroids_for(self, manifest: dict[str, Any]) -> np.ndarray:
+        if self._centroids is None:
+            self._centroids = np.load(self._generation_dir(manifest) / "centroids.npy")
+        return self._centroids
+
+    def _list_file(self, manifest: dict[str, Any], number: int) -> Path:
+        return self._generation_dir(manifest) / f"list-{number:06d}.npz"
+
+    def _load_list(self, manifest: dict[str, Any], number: int) -> tuple[np.ndarray, list[str]]:
+        """Vectors and ids of a posting list."""
+        if not manifest["sizes"][number]:
+            return np.zeros((0, manifest["dim"]), dtype=np.float32), []
+        with np.load(self._list_file(manifest, number)) as data:
+            return data["vectors"], data["ids"].tolist()
+
+    def _save_list(
+        self, manifest: dict[str, Any], number: int, vectors: np.ndarray, ids: list[str]
+    ) -> None:
+        list_file = self._list_file(manifest, number)
+        _save_atomic(
+            list_file,
+            lambda tmp: np.savez(
+                tmp, vectors=vectors.astype(np.float32), ids=np.array(ids, dtype=str)
+            ),
+        )
+        manifest["sizes"][number] = len(ids)
+
+    # Training
+
+    def train(self, batches: Batches, count: int, nlist: int = 0) -> int:
+        """Cluster the collection and write fresh posting lists.
+
+        Args:
+            batches: Callable returning an iterable of (ids, vectors) batches
+                covering the collection; it is called twice
+            count: Number of vectors in the collection
+            nlist: Number of posting lists (0 = default_nlist(count))
+
+        Returns:
+            Number of vectors indexed
+        """
+        nlist = nlist or default_nlist(count)
+        rng = np.random.default_rng(0)
+        fraction = min(1.0, min(MAX_SAMPLE, nlist * SAMPLE_PER_LIST) / max(count, 1))
+
+        # Pass 1: sample vectors for k-means
+        sample = []
+        for _, vectors in batches():
+            vectors = normalize(np.asarray(vectors, dtype=np.float32))
+            keep = rng.random(len(vectors)) < fraction
+            sample.append(vectors[keep] if fraction < 1.0 else vectors)
+        sample = np.concatenate(sample) if sample else np.zeros((0, 0), np.float32)
+        if len(sample) == 0:
+            self.clear()
+            return 0
+        centroids = spherical_kmeans(sample, nlist)
+
+        previous = self._load_manifest()
+        generation = int(previous["generation"][1:]) + 1 if previous else 1
+        manifest = {
+            "generation": f"g{generation:06d}",
+            "dim": int(centroids.shape[1]),
+            "sizes": [0] * len(centroids),
+            "trained_count": 0,
+        }
+        generation_dir = self._generation_dir(manifest)
+        shutil.rmtree(generation_dir, ignore_errors=True)
+        generation_dir.mkdir(parents=True)
+        np.save(generation_dir / "centroids.npy", centroids)
+
+        # Pass 2: assign every vector to its list
+        lists: dict[int, tuple[list[np.ndarray], list[str]]] = {}
+        for ids, vectors in batches():
+            vectors = normalize(np.asarray(vectors, dtype=np.float32))
+            assignments = _nearest(vectors, centroids)
+            for number in np.unique(assignments):
+                rows = np.flatnonzero(assignments == number)
+                entry = lists.setdefault(int(number), ([], []))
+                entry[0].append(vectors[rows])
+                entry[1].extend(ids[row] for row in rows)
+        for number, (vectors, ids) in lists.items():
+            self._save_list(manifest, number, np.concatenate(vectors), ids)
+
+        manifest["trained_count"] = sum(manifest["sizes"])
+        self._save_manifest(manifest)
+        self._centroids = centroids
+        self._id_lists = {
+            id_: number for number, (_, ids) in lists.items() for id_ in ids
+        }
+
+        # Readers still on an old generation retry with the new manifest
+        for child in self.path.iterdir():
+            if child.is_dir() and child.name != manifest["generation"]:
+                shutil.rmtree(child, ignore_errors=True)
+        return manifest["trained_count"]
+
+    # Incremental updates
+
+    def _id_index(self, manifest: dict[str, Any]) -> dict[str, int]:
+        """Map every indexed id to its posting list (built on first write)."""
+        if self._id_lists is None:
+            self._id_lists = {
+                id_: number
+                for number in range(len(manifest["sizes"]))
+                for id_ in self._load_list(manifest, number)[1]
+            }
+        return self._id_lists
+
+    def _update(
+        self,
+        remove: Iterable[str],
+        add: dict[int, tuple[np.ndarray, list[str]]] = None,
+    ) -> None:
+        """Rewrite the posting lists touched by removals and additions."""
+        manifest = self._load_manifest()
+        manifest = {**manifest, "sizes": list(manifest["sizes"])}
+        id_lists = self._id_index(manifest)
+        add = add or {}
+
+        removed: dict[int, set[str]] = {}
+        for id_ in remove:
+            number = id_lists.pop(id_, None)
+            if number is not None:
+                removed.setdefault(number, set()).add(id_)
+
+        for number in set(removed) | set(add):
+            vectors, ids = self._load_list(manifest, number)
+            if number in removed:
+                keep = [i for i, id_ in enumerate(ids) if id_ not in removed[number]]
+                vectors, ids = vectors[keep], [ids[i] for i in keep]
+            if number in add:
+                new_vectors, new_ids = add[number]
+                vectors = np.concatenate([vectors, new_vectors])
+                ids = ids + new_ids
+                id_lists.update((id_, number) for id_ in new_ids)
+            self._save_list(manifest, number, vectors, ids)
+
+        self._save_manifest(manifest)
+
+    def add(self, ids: list[str], embeddings: list[list[float]]) -> None:
+        """Add vectors to their nearest lists, replacing existing ids."""
+        manifest = self._load_manifest()
+        if manifest is None or not ids:
+            return
+        vectors = normalize(np.asarray(embeddings, dtype=np.float32))
+        assignments = _nearest(vectors, self._centroids_for(manifest))
+        add = {}
+        for number in np.unique(assignments):
+            rows = np.flatnonzero(assignments == number)
+            add[int(number)] = (vectors[rows], [ids[row] for row in rows])
+        self._update(ids, add)
+
+    def remove(self, ids: list[str]) -> None:
+        """Remove vectors by id (unknown ids are ignored)."""
+        if ids and self._load_manifest() is not None:
+            self._update(ids)
+
+    def clear(self) -> None:
+        """Delete the index."""
+        shutil.rmtree(self.path, ignore_errors=True)
+        self._load_manifest()
+
+    # Search
+
+    def search(
+        self, query: list[float], limit: int, nprobe: int
+    ) -> list[tuple[str, float]]:
+        """Rank the vectors of the nprobe lists closest to a query.
+
+        Args:
+            query: Query vector
+            limit: Maximum number of results
+            nprobe: Number of posting lists to scan
+
+        Returns:
+            List of (id, cosine similarity), best first
+        """
+        for attempt in range(2):
+            manifest = self._load_manifest()
+            if manifest is None:
+                return []
+            try:
+                return self._search(manifest, query, limit, nprobe)
+            except FileNotFoundError:
+                # Retrained meanwhile: reload the new generation once
+                self._manifest_key = None
+                if attempt:
+                    raise
+        return []
+
+    def _search(
+        self, manifest: dict[str, Any], query: list[float], limit: int, nprobe: int
+    ) -> list[tuple[str, float]]:
+        query_vector = normalize(np.asarray(query, dtype=np.float32))
+        centroids = self._centroids_for(manifest)
+        nprobe = min(nprobe, len(centroids))
+        probed = np.argpartition(-(centroids @ query_vector), nprobe - 1)[:nprobe]
+
+        all_ids: list[str] = []
+        all_scores = []
+        for number in probed:
+            vectors, ids = self._load_list(manifest, int(number))
+            if ids:
+                all_ids.extend(ids)
+                all_scores.append(vectors @ query_vector)
+        if not all_ids:
+            return []
+
+        scores = np.concatenate(all_scores)
+        k = min(limit, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(all_ids[i], float(scores[i])) for i in top]
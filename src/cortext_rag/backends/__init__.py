@@ -0,0 +1,130 @@
+"""Vector storage backends behind VectorStore.
+
+Each backend instance manages one named collection of vectors with ids,
+documents and metadata. Backends are looked up by the ``backend`` setting of
+the workspace RAG configuration:
+
+- ``chroma``: ChromaDB persistent client (HNSW index, configurable space)
+- ``numpy``: memory-mapped float32 matrices with exact search
+"""
+
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Callable, Protocol
+
+# Backend name -> ("module:Class", directory under .workspace/embeddings)
+BACKENDS = {
+    "chroma": ("chroma:ChromaBackend", "chroma"),
+    "numpy": ("numpy_flat:NumpyBackend", "vectors"),
+}
+
+# Backend name -> packages it needs besides the embedding stack
+BACKEND_PACKAGES = {
+    "chroma": ("chromadb",),
+    "numpy": (),
+}
+
+
+class VectorBackend(Protocol):
+    """Protocol for vector storage backends.
+
+    ``get`` and ``query`` return Chroma-shaped dictionaries; ``query`` reports
+    similarity ``scores`` (higher is more similar) instead of distances.
+    """
+
+    def add(
+        self,
+        ids: list[str],
+        embeddings: list[list[float]],
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        """Add vectors with their documents and metadata, replacing existing ids."""
+        ...
+
+    def delete(self, ids: list[str] = None, where: dict[str, Any] = None) -> None:
+        """Delete vectors by id or metadata filter."""
+        ...
+
+    def get(
+        self,
+        ids: list[str] = None,
+        where: dict[str, Any] = None,
+        include: list[str] = None,
+        limit: int = None,
+        offset: int = None,
+    ) -> dict[str, Any]:
+        """Fetch stored entries by id or metadata filter, optionally paged."""
+        ...
+
+    def query(
+        self,
+        query_embeddings: list[list[float]],
+        n_results: int = 10,
+        where: dict[str, Any] = None,
+        include: list[str] = None,
+    ) -> dict[str, Any]:
+        """Nearest-neighbor search for one or more query vectors."""
+        ...
+
+    def count(self) -> int:
+        """Number of stored vectors."""
+        ...
+
+    def rebuild(self, transform: Callable[[Any], Any] = None) -> int:
+        """Rewrite the index with the current settings; return vectors kept.
+
+        ``transform`` maps a float32 array of stored vectors to new vectors.
+        """
+        ...
+
+    def swap_in(self, other: "VectorBackend") -> None:
+        """Replace all stored vectors with those of another collection.
+
+        Readers see either the previous or the new vectors; ``other`` (a
+        collection of the same backend) is consumed.
+        """
+        ...
+
+    def vacuum(self) -> None:
+        """Reclaim disk space left by deleted vectors and interrupted writes."""
+        ...
+
+    def clear(self) -> None:
+        """Remove all stored vectors."""
+        ...
+
+
+def backend_path(workspace_path: Path, name: str) -> Path:
+    """Directory holding a backend's data for a workspace."""
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown vector store backend: {name}. "
+            f"Supported: {', '.join(BACKENDS)}"
+        )
+    return Path(workspace_path) / ".workspace" / "embeddings" / BACKENDS[name][1]
+
+
+def create_backend(name: str, db_path: Path, collection_name: str, **options):
+    """Create a backend instance for one collection.
+
+    Args:
+        name: Backend name (see BACKENDS)
+        db_path: Directory holding the backend's data
+        collection_name: Name of the collection to open
+        **options: Backend-specific settings
+
+    Returns:
+        VectorBackend instance
+    """
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown vector store backend: {name}. "
+            f"Supported: {', '.join(BACKENDS)}"
+        )
+    module_name, _, class_name = BACKENDS[name][0].partition(":")
+    module = import_module(f"{__name__}.{module_name}")
+    return getattr(module, class_name)(db_path, collection_name, **options)
+
+
+__all__ = ["BACKENDS", "VectorBackend", "backend_path", "create_backend"]
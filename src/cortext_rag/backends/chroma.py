@@ -0,0 +1,372 @@
+"""ChromaDB vector storage backend."""
+
+import shutil
+import sqlite3
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from .numpy_flat import normalize
+
+# Vectors copied per batch when rebuilding a collection
+REBUILD_BATCH_SIZE = 1000
+
+# Seconds to wait for other connections while vacuuming the database
+VACUUM_TIMEOUT = 30.0
+
+
+def _to_list(vector) -> list[float]:
+    """Convert a vector returned by Chroma (often a NumPy array) to a list."""
+    return vector.tolist() if hasattr(vector, "tolist") else list(vector)
+
+
+def _normalized(vectors: list[list[float]]) -> list[list[float]]:
+    return normalize(np.asarray(vectors, dtype=np.float32)).tolist()
+
+
+class ChromaBackend:
+    """Store vectors in a ChromaDB persistent collection."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        collection_name: str,
+        space: str = "cosine",
+        hnsw_m: int = 16,
+        construction_ef: int = 100,
+        search_ef: int = 100,
+    ):
+        """Initialize backend.
+
+        Args:
+            db_path: Directory of the Chroma persistent client
+            collection_name: Name of the collection to open
+            space: Distance space for new collections ("cosine", "ip" or "l2")
+            hnsw_m: HNSW graph degree for new collections
+            construction_ef: HNSW candidate list size while building
+            search_ef: HNSW candidate list size while searching
+        """
+        self.db_path = Path(db_path)
+        self.collection_name = collection_name
+        self.index_metadata = {
+            "hnsw:space": space,
+            "hnsw:M": hnsw_m,
+            "hnsw:construction_ef": construction_ef,
+            "hnsw:search_ef": search_ef,
+        }
+        self._client = None
+        self._collection = None
+
+    def _ensure_client(self) -> None:
+        """Ensure ChromaDB client is initialized."""
+        if self._client is not None:
+            return
+
+        try:
+            import chromadb
+        except ImportError:
+            raise ImportError(
+                "chromadb not installed. "
+                "Install with: pip install cortext-workspace[rag]"
+            )
+
+        # Create database directory
+        self.db_path.mkdir(parents=True, exist_ok=True)
+
+        # Initialize persistent client
+        self._client = chromadb.PersistentClient(path=str(self.db_path))
+        self._open_collection()
+
+    def _open_collection(self) -> None:
+        """Open the named collection, creating it if the store is new.
+
+        While a rebuild is between its renames (or was interrupted there),
+        only the previous copy exists. Readers use it as is and the next
+        write restores it (see _recover_rebuild).
+        """
+        try:
+            self._collection = self._client.get_collection(self.collection_name)
+            return
+        except Exception:
+            pass
+        try:
+            self._collection = self._client.get_collection(self._previous_name)
+        except Exception:
+            self._collection = self._client.get_or_create_collection(
+                name=self.collection_name,
+                metadata=self._collection_metadata(),
+            )
+
+    def _recover_rebuild(self) -> None:
+        """Finish the collection swap of a rebuild that was interrupted.
+
+        Runs before every write. Writers hold the workspace write lease, so
+        no other process can be in the middle of a swap.
+        """
+        self._ensure_client()
+        try:
+            previous = self._client.get_collection(self._previous_name)
+        except Exception:
+            return
+        try:
+            self._client.get_collection(self.collection_name)
+        except Exception:
+            # Swapped out but the rebuilt copy was not renamed: restore
+            previous.modify(name=self.collection_name)
+        else:
+            self._delete_collection(self._previous_name)
+        self._open_collection()
+
+    def _delete_collection(self, name: str) -> None:
+        """Delete a collection that another process may already have deleted."""
+        try:
+            self._client.delete_collection(name)
+        except Exception:
+            pass
+
+    @property
+    def _previous_name(self) -> str:
+        return f"{self.collection_name}__previous"
+
+    def _collection_metadata(self) -> dict[str, Any]:
+        return {
+            "description": "Cortext workspace document chunks",
+            **self.index_metadata,
+        }
+
+    @property
+    def collection(self):
+        """Get the ChromaDB collection."""
+        self._ensure_client()
+        return self._collection
+
+    def _call(self, method: str, **kwargs) -> Any:
+        """Call a collection method, following a rebuild swapped in meanwhile.
+
+        A rebuild in another process replaces the collection under the same
+        name; the open handle then points at the deleted copy.
+        """
+        collection = self.collection
+        try:
+            return getattr(collection, method)(**kwargs)
+        except Exception:
+            self._open_collection()
+            if self._collection.id == collection.id:
+                raise
+            return getattr(self._collection, method)(**kwargs)
+
+    @property
+    def space(self) -> str:
+        """Distance space of the open collection.
+
+        Collections created before the space was configurable use L2.
+        """
+        return (self.collection.metadata or {}).get("hnsw:space", "l2")
+
+    @property
+    def needs_rebuild(self) -> bool:
+        """Whether the open collection differs from the configured settings."""
+        metadata = self.collection.metadata or {}
+        return any(
+            metadata.get(key, "l2" if key == "hnsw:space" else None) != value
+            for key, value in self.index_metadata.items()
+        )
+
+    @staticmethod
+    def _score(distance: float, space: str) -> float:
+        """Convert a Chroma distance into a similarity score."""
+        if space == "l2":
+            # Lower distance = more similar
+            return 1.0 / (1.0 + distance)
+        # Cosine and inner-product distances are 1 - similarity
+        return 1.0 - distance
+
+    def add(
+        self,
+        ids: list[str],
+        embeddings: list[list[float]],
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        """Add vectors with their documents and metadata, replacing existing ids."""
+        self._recover_rebuild()
+        self._call(
+            "upsert",
+            ids=ids,
+            embeddings=_normalized(embeddings),
+            documents=documents,
+            metadatas=metadatas,
+        )
+
+    def delete(self, ids: list[str] = None, where: dict[str, Any] = None) -> None:
+        """Delete vectors by id or metadata filter."""
+        self._recover_rebuild()
+        if ids is None or where:
+            # Resolve matching ids first so ids and filter apply together
+            ids = self._call("get", ids=ids, where=where, include=[])["ids"]
+        if ids:
+            self._call("delete", ids=ids)
+
+    def get(
+        self,
+        ids: list[str] = None,
+        where: dict[str, Any] = None,
+        include: list[str] = None,
+        limit: int = None,
+        offset: int = None,
+    ) -> dict[str, Any]:
+        """Fetch stored entries by id or metadata filter."""
+        results = self._call(
+            "get",
+            ids=ids,
+            where=where,
+            include=include if include is not None else ["documents", "metadatas"],
+            limit=limit,
+            offset=offset,
+        )
+        if results.get("embeddings") is not None:
+            results["embeddings"] = [_to_list(e) for e in results["embeddings"]]
+        return results
+
+    def query(
+        self,
+        query_embeddings: list[list[float]],
+        n_results: int = 10,
+        where: dict[str, Any] = None,
+        include: list[str] = None,
+    ) -> dict[str, Any]:
+        """Nearest-neighbor search for one or more query vectors."""
+        include = include if include is not None else ["documents", "metadatas"]
+        results = self._call(
+            "query",
+            query_embeddings=_normalized(query_embeddings),
+            n_results=n_results,
+            where=where,
+            include=[*include, "distances"],
+        )
+
+        space = self.space
+        results["scores"] = [
+            [self._score(distance, space) for distance in distances]
+            for distances in results.pop("distances")
+        ]
+        if results.get("embeddings") is not None:
+            results["embeddings"] = [
+                [_to_list(e) for e in embeddings] for embeddings in results["embeddings"]
+            ]
+        return results
+
+    def count(self) -> int:
+        """Number of stored vectors."""
+        return self._call("count")
+
+    def rebuild(
+        self,
+        batch_size: int = REBUILD_BATCH_SIZE,
+        transform: Callable[[np.ndarray], np.ndarray] = None,
+    ) -> int:
+        """Copy all vectors into a collection with the configured settings.
+
+        The copy is built next to the live collection and swapped in by
+        renaming, so an interrupted rebuild leaves the original untouched.
+
+        Args:
+            batch_size: Vectors copied per batch
+            transform: Function applied to the stored vectors, which may
+                change their dimension (e.g. a projection)
+
+        Returns:
+            Number of vectors copied
+        """
+        self._recover_rebuild()
+        building_name = f"{self.collection_name}__rebuild"
+
+        # Leftover of an interrupted rebuild
+        self._delete_collection(building_name)
+
+        target = self._client.create_collection(
+            name=building_name,
+            metadata=self._collection_metadata(),
+        )
+
+        copied = 0
+        while True:
+            batch = self._collection.get(
+                include=["embeddings", "documents", "metadatas"],
+                limit=batch_size,
+                offset=copied,
+            )
+            if not batch["ids"]:
+                break
+            embeddings = [_to_list(e) for e in batch["embeddings"]]
+            if transform is not None:
+                embeddings = transform(np.asarray(embeddings, dtype=np.float32)).tolist()
+            target.add(
+                ids=batch["ids"],
+                embeddings=_normalized(embeddings),
+                documents=batch["documents"],
+                metadatas=batch["metadatas"],
+            )
+            copied += len(batch["ids"])
+
+        self._swap(target)
+        return copied
+
+    def _swap(self, target) -> None:
+        """Put a collection in place of the live one by renaming both."""
+        self._collection.modify(name=self._previous_name)
+        target.modify(name=self.collection_name)
+        self._delete_collection(self._previous_name)
+        self._collection = target
+
+    def swap_in(self, other: "ChromaBackend") -> None:
+        """Replace all stored vectors with another collection's.
+
+        The other collection is renamed into place like a rebuilt copy (see
+        rebuild) and no longer exists under its own name.
+        """
+        self._recover_rebuild()
+        self._swap(self._client.get_collection(other.collection_name))
+        other._collection = None
+
+    def vacuum(self) -> None:
+        """Reclaim disk space left by deleted vectors and collections.
+
+        Covers the whole client database, shared by all collections in
+        db_path: removes HNSW segment directories of deleted collections and
+        rewrites the SQLite file without free pages. Callers must hold the
+        workspace write lease; readers only wait for the final rewrite.
+        """
+        self._recover_rebuild()
+        database = self.db_path / "chroma.sqlite3"
+        if not database.exists():
+            return
+
+        connection = sqlite3.connect(database, timeout=VACUUM_TIMEOUT)
+        try:
+            live_segments = {
+                row[0] for row in connection.execute("SELECT id FROM segments")
+            }
+            for child in self.db_path.iterdir():
+                # Segment directories are named by segment id (a UUID)
+                if (
+                    child.is_dir()
+                    and len(child.name) == 36
+                    and child.name.count("-") == 4
+                    and child.name not in live_segments
+                ):
+                    shutil.rmtree(child, ignore_errors=True)
+            connection.execute("VACUUM")
+        finally:
+            connection.close()
+
+    def clear(self) -> None:
+        """Remove all stored vectors."""
+        self._recover_rebuild()
+        # Delete and recreate collection
+        self._client.delete_collection(self.collection_name)
+        self._collection = self._client.create_collection(
+            name=self.collection_name,
+            metadata=self._collection_metadata(),
+        )
@@ -0,0 +1,729 @@
+"""Memory-mapped NumPy vector storage backend.
+
+A collection is a directory of immutable segments plus a manifest::
+
+    <collection>/
+        manifest.json       # segments, deleted rows, dimension
+        seg-000001/
+            vectors.npy     # float32 (rows, dim), L2-normalized
+            meta.json       # ids and metadata, row-aligned
+            documents.bin   # UTF-8 documents, concatenated
+            offsets.npy     # int64 (rows + 1) byte offsets into documents.bin
+
+Writes add a segment or mark rows deleted and then atomically replace the
+manifest, so readers always see a consistent snapshot. Segments a write
+drops (merged or cleared) stay on disk for ``RETIRE_GRACE`` seconds, so
+readers still working from the previous manifest can finish. Vectors are opened
+with mmap, which lets several processes share the page cache, or read into
+memory for small, frequently searched collections (the store's hot tier).
+Search is exact: one matrix product per segment followed by argpartition.
+
+With quantization enabled, each segment also gets a compact side index,
+written with the segment (under the writer's lease) next to its vectors::
+
+    binary.npy          # uint8 (rows, dim / 8), packed sign bits
+    int8.npy            # int8 (rows, dim), rows scaled to [-127, 127]
+    int8_scale.npy      # float32 (rows,) per-row scale
+
+Queries then scan the codes to pick ``oversample * n_results`` candidates
+and rerank only those with the float32 vectors. Segments written before
+quantization was enabled have no side index until they are merged or
+rebuilt; searches encode them in memory meanwhile and never write to disk.
+"""
+
+import json
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from ..filters import compile_where
+
+# Merge small segments once a collection has more than this many
+MAX_SEGMENTS = 8
+
+# Seconds a segment dropped from the manifest stays on disk for readers of
+# the previous manifest
+RETIRE_GRACE = 5.0
+
+# Cached filter masks per backend
+MASK_CACHE_SIZE = 32
+
+# Rows scored per block when scanning quantized codes (keeps the decoded
+# block in CPU cache)
+QUANT_BLOCK_ROWS = 1024
+
+# Set bits of every byte value, for Hamming distances on NumPy < 2.0
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows, leaving zero vectors untouched."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class Segment:
+    """One immutable block of vectors with their ids, metadata and text."""
+
+    def __init__(self, path: Path, in_memory: bool = False):
+        self.path = path
+        self.in_memory = in_memory
+        self._vectors = None
+        self._ids = None
+        self._metadatas = None
+        self._offsets = None
+        self._codes: dict[str, tuple[np.ndarray, np.ndarray | None]] = {}
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """Row-normalized vectors (memory-mapped unless held in memory)."""
+        if self._vectors is None:
+            self._vectors = np.load(
+                self.path / "vectors.npy", mmap_mode=None if self.in_memory else "r"
+            )
+        return self._vectors
+
+    @property
+    def ids(self) -> list[str]:
+        """Row-aligned ids."""
+        if self._ids is None:
+            self._load_meta()
+        return self._ids
+
+    @property
+    def metadatas(self) -> list[dict[str, Any]]:
+        """Row-aligned metadata."""
+        if self._metadatas is None:
+            self._load_meta()
+        return self._metadatas
+
+    def _load_meta(self) -> None:
+        meta = json.loads((self.path / "meta.json").read_text())
+        self._ids = meta["ids"]
+        self._metadatas = meta["metadatas"]
+
+    def documents(self, rows: list[int]) -> list[str]:
+        """Read the documents of the given rows."""
+        if self._offsets is None:
+            self._offsets = np.load(self.path / "offsets.npy")
+        documents = []
+        with open(self.path / "documents.bin", "rb") as f:
+            for row in rows:
+                start, end = self._offsets[row], self._offsets[row + 1]
+                f.seek(start)
+                documents.append(f.read(end - start).decode("utf-8"))
+        return documents
+
+    def codes(self, quantization: str) -> tuple[np.ndarray, np.ndarray | None]:
+        """Quantized copy of the vectors, loaded on first use.
+
+        Segments written without this side index are encoded in memory;
+        only writers save codes (see write).
+
+        Args:
+            quantization: "binary" (sign bits) or "int8" (scaled rows)
+
+        Returns:
+            Tuple of (codes, per-row scales or None)
+        """
+        if quantization not in self._codes:
+            codes_file = self.path / f"{quantization}.npy"
+            scale_file = self.path / f"{quantization}_scale.npy"
+            if codes_file.exists():
+                self._codes[quantization] = (
+                    np.load(codes_file, mmap_mode="r"),
+                    np.load(scale_file) if scale_file.exists() else None,
+                )
+            else:
+                self._codes[quantization] = _quantize(
+                    np.asarray(self.vectors), quantization
+                )
+        return self._codes[quantization]
+
+    def approximate_scores(
+        self, quantization: str, query: np.ndarray, rows: np.ndarray = None
+    ) -> np.ndarray:
+        """Score rows against a normalized query using the quantized codes.
+
+        Higher is more similar. Binary scores are negated Hamming distances,
+        int8 scores approximate the cosine similarity.
+
+        Args:
+            quantization: "binary" or "int8"
+            query: Normalized query vector
+            rows: Row indices to score (default: all rows)
+
+        Returns:
+            float32 scores aligned with rows
+        """
+        codes, scales = self.codes(quantization)
+        count = codes.shape[0] if rows is None else len(rows)
+        scores = np.empty(count, dtype=np.float32)
+        query_bits = np.packbits(query > 0) if quantization == "binary" else None
+
+        for start in range(0, count, QUANT_BLOCK_ROWS):
+            end = min(start + QUANT_BLOCK_ROWS, count)
+            block_rows = slice(start, end) if rows is None else rows[start:end]
+            block = codes[block_rows]
+            if query_bits is not None:
+                scores[start:end] = -_hamming(block, query_bits)
+            else:
+                scores[start:end] = (block.astype(np.float32) @ query) * scales[block_rows]
+        return scores
+
+    @classmethod
+    def write(
+        cls,
+        path: Path,
+        ids: list[str],
+        vectors: np.ndarray,
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+        quantization: str = "none",
+    ) -> "Segment":
+        """Write a new segment directory atomically.
+
+        Args:
+            path: Segment directory to create
+            ids: Row ids
+            vectors: Normalized float32 vectors
+            documents: Row documents
+            metadatas: Row metadata
+            quantization: Side index saved with the vectors: "none",
+                "binary" or "int8"
+        """
+        tmp_path = path.parent / f".tmp-{uuid.uuid4().hex}"
+        tmp_path.mkdir(parents=True)
+
+        np.save(tmp_path / "vectors.npy", np.ascontiguousarray(vectors, dtype=np.float32))
+        (tmp_path / "meta.json").write_text(
+            json.dumps({"ids": ids, "metadatas": metadatas})
+        )
+
+        encoded = [(doc or "").encode("utf-8") for doc in documents]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(e) for e in encoded], out=offsets[1:])
+        np.save(tmp_path / "offsets.npy", offsets)
+        (tmp_path / "documents.bin").write_bytes(b"".join(encoded))
+
+        if quantization != "none":
+            codes, scales = _quantize(np.asarray(vectors, dtype=np.float32), quantization)
+            np.save(tmp_path / f"{quantization}.npy", codes)
+            if scales is not None:
+                np.save(tmp_path / f"{quantization}_scale.npy", scales)
+
+        os.rename(tmp_path, path)
+        return cls(path)
+
+
+def _quantize(vectors: np.ndarray, quantization: str) -> tuple[np.ndarray, np.ndarray | None]:
+    """Encode normalized vectors as sign bits or int8 rows with scales."""
+    if quantization == "binary":
+        return np.packbits(vectors > 0, axis=1), None
+    scales = np.abs(vectors).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    codes = np.round(vectors / scales[:, None]).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def _hamming(codes: np.ndarray, query_bits: np.ndarray) -> np.ndarray:
+    """Hamming distances between packed sign codes and a query's code."""
+    if hasattr(np, "bitwise_count") and codes.shape[1] % 8 == 0:
+        # 64 bits at a time
+        words = np.ascontiguousarray(codes).view(np.uint64)
+        return np.bitwise_count(words ^ query_bits.view(np.uint64)).sum(
+            axis=1, dtype=np.int32
+        )
+    return _POPCOUNT[codes ^ query_bits].sum(axis=1, dtype=np.int32)
+
+
+class NumpyBackend:
+    """Store vectors as memory-mapped NumPy segments with exact search."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        collection_name: str,
+        quantization: str = "none",
+        oversample: int = 8,
+        in_memory: bool = False,
+    ):
+        """Initialize backend.
+
+        Args:
+            db_path: Directory holding all collections
+            collection_name: Name of the collection to open
+            quantization: Prefilter side index: "none", "binary" or "int8"
+            oversample: Candidates reranked per requested result when quantized
+            in_memory: Read vectors into memory instead of mapping them
+        """
+        self.quantization = quantization
+        self.oversample = max(1, oversample)
+        self.in_memory = in_memory
+        self.path = Path(db_path) / collection_name
+        self.manifest_file = self.path / "manifest.json"
+        self._manifest = None
+        self._manifest_key = None
+        self._segments: dict[str, Segment] = {}
+        self._id_index = None
+        self._mask_cache: dict[tuple[str, str], np.ndarray] = {}
+
+    # Manifest handling
+
+    def _load_manifest(self) -> dict[str, Any]:
+        """Load the manifest, re-reading it only when it changed on disk."""
+        try:
+            stat = self.manifest_file.stat()
+        except FileNotFoundError:
+            self._manifest = {
+                "dim": None,
+                "segments": [],
+                "deleted": {},
+                "retired": {},
+                "next_segment": 1,
+            }
+            self._manifest_key = None
+            self._id_index = None
+            return self._manifest
+
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if key != self._manifest_key:
+            self._manifest = {"retired": {}, **json.loads(self.manifest_file.read_text())}
+            self._manifest_key = key
+            self._id_index = None
+        return self._manifest
+
+    def _save_manifest(self, manifest: dict[str, Any]) -> None:
+        """Atomically replace the manifest."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.path / f".manifest-{uuid.uuid4().hex}.json"
+        tmp_file.write_text(json.dumps(manifest))
+        os.replace(tmp_file, self.manifest_file)
+        self._manifest_key = None
+        self._id_index = None
+
+    def _segment(self, name: str) -> Segment:
+        segment = self._segments.get(name)
+        if segment is None:
+            segment = Segment(self.path / name, self.in_memory)
+            self._segments[name] = segment
+        return segment
+
+    def _live_rows(self, manifest: dict[str, Any], name: str, rows: int) -> np.ndarray:
+        """Boolean mask of rows in a segment that are not deleted."""
+        mask = np.ones(rows, dtype=bool)
+        deleted = manifest["deleted"].get(name)
+        if deleted:
+            mask[deleted] = False
+        return mask
+
+    def _filter_mask(self, name: str, segment: Segment, where: dict[str, Any]) -> np.ndarray:
+        """Boolean mask of segment rows matching a where filter (cached)."""
+        key = (name, json.dumps(where, sort_keys=True))
+        mask = self._mask_cache.get(key)
+        if mask is None:
+            predicate = compile_where(where)
+            mask = np.fromiter(
+                (predicate(m) for m in segment.metadatas),
+                dtype=bool,
+                count=len(segment.metadatas),
+            )
+            if len(self._mask_cache) >= MASK_CACHE_SIZE:
+                self._mask_cache.pop(next(iter(self._mask_cache)))
+            self._mask_cache[key] = mask
+        return mask
+
+    def _rows(
+        self, manifest: dict[str, Any], where: dict[str, Any] = None
+    ) -> list[tuple[str, Segment, np.ndarray]]:
+        """Live (and matching) rows of every segment."""
+        selected = []
+        for entry in manifest["segments"]:
+            name = entry["name"]
+            segment = self._segment(name)
+            mask = self._live_rows(manifest, name, entry["rows"])
+            if where:
+                mask &= self._filter_mask(name, segment, where)
+            selected.append((name, segment, mask))
+        return selected
+
+    def _locate(self, manifest: dict[str, Any], ids: list[str]) -> list[tuple[str, int]]:
+        """Find the (segment, row) of each live id, skipping unknown ids."""
+        if self._id_index is None:
+            index = {}
+            for name, segment, mask in self._rows(manifest):
+                for row in np.flatnonzero(mask):
+                    index[segment.ids[row]] = (name, int(row))
+            self._id_index = index
+        return [self._id_index[i] for i in ids if i in self._id_index]
+
+    def _mark_deleted(self, manifest: dict[str, Any], locations: list[tuple[str, int]]) -> None:
+        for name, row in locations:
+            manifest["deleted"].setdefault(name, []).append(row)
+        for name in {name for name, _ in locations}:
+            manifest["deleted"][name] = sorted(set(manifest["deleted"][name]))
+
+    # Backend API
+
+    def add(
+        self,
+        ids: list[str],
+        embeddings: list[list[float]],
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        """Add vectors as a new segment, replacing existing ids."""
+        if not ids:
+            return
+
+        vectors = normalize(np.asarray(embeddings, dtype=np.float32))
+        manifest = dict(self._load_manifest())
+        manifest["segments"] = list(manifest["segments"])
+        manifest["deleted"] = dict(manifest["deleted"])
+        manifest["retired"] = dict(manifest["retired"])
+
+        if manifest["dim"] is None:
+            manifest["dim"] = int(vectors.shape[1])
+        elif vectors.shape[1] != manifest["dim"]:
+            raise ValueError(
+                f"Embedding dimension {vectors.shape[1]} does not match "
+                f"collection dimension {manifest['dim']}"
+            )
+
+        self._mark_deleted(manifest, self._locate(manifest, ids))
+
+        name = f"seg-{manifest['next_segment']:06d}"
+        manifest["next_segment"] += 1
+        Segment.write(
+            self.path / name, ids, vectors, documents, metadatas, self.quantization
+        )
+        manifest["segments"].append({"name": name, "rows": len(ids)})
+
+        if len(manifest["segments"]) > MAX_SEGMENTS:
+            # Fold the smallest segments together to keep search overhead flat
+            by_size = sorted(manifest["segments"], key=lambda e: e["rows"])
+            self._merge(manifest, by_size[: len(by_size) - MAX_SEGMENTS // 2])
+
+        self._remove_unreferenced(manifest)
+        self._save_manifest(manifest)
+
+    def _merge(
+        self,
+        manifest: dict[str, Any],
+        entries: list[dict[str, Any]],
+        transform: Callable[[np.ndarray], np.ndarray] = None,
+    ) -> None:
+        """Replace segments with one segment holding their live rows."""
+        ids, vectors, documents, metadatas = [], [], [], []
+        for entry in entries:
+            name = entry["name"]
+            segment = self._segment(name)
+            rows = np.flatnonzero(self._live_rows(manifest, name, entry["rows"]))
+            ids.extend(segment.ids[r] for r in rows)
+            metadatas.extend(segment.metadatas[r] for r in rows)
+            documents.extend(segment.documents(rows.tolist()))
+            vectors.append(np.asarray(segment.vectors[rows]))
+
+        merged_names = {entry["name"] for entry in entries}
+        manifest["segments"] = [
+            e for e in manifest["segments"] if e["name"] not in merged_names
+        ]
+        retired_at = time.time()
+        for name in merged_names:
+            manifest["deleted"].pop(name, None)
+            manifest["retired"][name] = retired_at
+
+        if ids:
+            vectors = np.concatenate(vectors)
+            if transform is not None:
+                vectors = normalize(np.asarray(transform(vectors), dtype=np.float32))
+                manifest["dim"] = int(vectors.shape[1])
+            name = f"seg-{manifest['next_segment']:06d}"
+            manifest["next_segment"] += 1
+            Segment.write(
+                self.path / name, ids, vectors, documents, metadatas, self.quantization
+            )
+            manifest["segments"].append({"name": name, "rows": len(ids)})
+
+    def rebuild(self, transform: Callable[[np.ndarray], np.ndarray] = None) -> int:
+        """Merge all segments into one, dropping deleted rows.
+
+        Args:
+            transform: Function applied to the stored vectors, which may
+                change their dimension (e.g. a projection)
+
+        Returns:
+            Number of vectors kept
+        """
+        manifest = self._load_manifest()
+        manifest = {
+            **manifest,
+            "deleted": dict(manifest["deleted"]),
+            "retired": dict(manifest["retired"]),
+        }
+        if transform is not None:
+            manifest["dim"] = None
+        self._merge(manifest, list(manifest["segments"]), transform)
+        self._remove_unreferenced(manifest)
+        self._save_manifest(manifest)
+        self._mask_cache.clear()
+        return sum(entry["rows"] for entry in manifest["segments"])
+
+    def _remove_unreferenced(self, manifest: dict[str, Any]) -> None:
+        """Delete segment directories no longer listed in the manifest.
+
+        Segments retired less than RETIRE_GRACE seconds ago are kept for
+        readers of the previous manifest. Retired segments that are gone
+        are dropped from the manifest (saved by the caller); failures (e.g.
+        open files on Windows) are left for later.
+        """
+        if not self.path.exists():
+            return
+        referenced = {entry["name"] for entry in manifest["segments"]}
+        retired = manifest["retired"]
+        now = time.time()
+        for child in self.path.iterdir():
+            if not (child.is_dir() and child.name.startswith("seg-")):
+                continue
+            if child.name in referenced:
+                continue
+            if now - retired.get(child.name, 0.0) < RETIRE_GRACE:
+                continue
+            shutil.rmtree(child, ignore_errors=True)
+            self._segments.pop(child.name, None)
+        for name in list(retired):
+            if not (self.path / name).exists():
+                del retired[name]
+
+    def vacuum(self) -> None:
+        """Remove retired segments and files left behind by interrupted writes.
+
+        Waits until the grace period of the most recently retired segment
+        has passed. Callers must hold the workspace write lease, since a
+        running writer's temporary files look the same as abandoned ones.
+        """
+        if not self.path.exists():
+            return
+        manifest = self._load_manifest()
+        if manifest["retired"]:
+            wait = max(manifest["retired"].values()) + RETIRE_GRACE - time.time()
+            if wait > 0:
+                time.sleep(wait)
+        manifest = {**manifest, "retired": dict(manifest["retired"])}
+        self._remove_unreferenced(manifest)
+        if manifest["retired"] != self._load_manifest()["retired"]:
+            self._save_manifest(manifest)
+        for child in self.path.iterdir():
+            if child.name.startswith(".tmp-"):
+                shutil.rmtree(child, ignore_errors=True)
+            elif child.name.startswith(".manifest-"):
+                child.unlink(missing_ok=True)
+
+    def swap_in(self, other: "NumpyBackend") -> None:
+        """Replace all stored vectors with another collection's in one step.
+
+        The other collection's segments are moved into this one and listed
+        in a new manifest, so readers see the previous vectors until the
+        manifest is replaced. The other collection is removed.
+        """
+        source = other._load_manifest()
+        manifest = self._load_manifest()
+        self.path.mkdir(parents=True, exist_ok=True)
+        retired_at = time.time()
+        swapped = {
+            "dim": source["dim"],
+            "segments": [],
+            "deleted": {},
+            "retired": {
+                **manifest["retired"],
+                **{entry["name"]: retired_at for entry in manifest["segments"]},
+            },
+            "next_segment": manifest["next_segment"],
+        }
+        for entry in source["segments"]:
+            name = f"seg-{swapped['next_segment']:06d}"
+            swapped["next_segment"] += 1
+            os.rename(other.path / entry["name"], self.path / name)
+            swapped["segments"].append({"name": name, "rows": entry["rows"]})
+            if entry["name"] in source["deleted"]:
+                swapped["deleted"][name] = source["deleted"][entry["name"]]
+        self._remove_unreferenced(swapped)
+        self._save_manifest(swapped)
+        self._mask_cache.clear()
+        shutil.rmtree(other.path, ignore_errors=True)
+
+    def delete(self, ids: list[str] = None, where: dict[str, Any] = None) -> None:
+        """Delete vectors by id or metadata filter."""
+        manifest = dict(self._load_manifest())
+        manifest["deleted"] = {k: list(v) for k, v in manifest["deleted"].items()}
+
+        locations = self._select(manifest, ids, where)
+        if locations:
+            self._mark_deleted(manifest, locations)
+            self._save_manifest(manifest)
+
+    def get(
+        self,
+        ids: list[str] = None,
+        where: dict[str, Any] = None,
+        include: list[str] = None,
+        limit: int = None,
+        offset: int = None,
+    ) -> dict[str, Any]:
+        """Fetch stored entries by id or metadata filter.
+
+        Returned embeddings are the stored (normalized) vectors.
+        """
+        include = include if include is not None else ["documents", "metadatas"]
+        locations = self._select(self._load_manifest(), ids, where)
+
+        start = offset or 0
+        end = None if limit is None else start + limit
+        return self._collect(locations[start:end], include)
+
+    def _select(
+        self, manifest: dict[str, Any], ids: list[str] | None, where: dict[str, Any]
+    ) -> list[tuple[str, int]]:
+        """Locate live rows matching both the ids (if given) and the filter."""
+        if ids is not None:
+            predicate = compile_where(where)
+            return [
+                (name, row)
+                for name, row in self._locate(manifest, ids)
+                if predicate(self._segment(name).metadatas[row])
+            ]
+        return [
+            (name, int(row))
+            for name, _, mask in self._rows(manifest, where)
+            for row in np.flatnonzero(mask)
+        ]
+
+    def _collect(
+        self, locations: list[tuple[str, int]], include: list[str]
+    ) -> dict[str, Any]:
+        """Build a Chroma-shaped result for (segment, row) locations."""
+        result: dict[str, Any] = {
+            "ids": [self._segment(name).ids[row] for name, row in locations]
+        }
+        if "metadatas" in include:
+            result["metadatas"] = [
+                self._segment(name).metadatas[row] for name, row in locations
+            ]
+        if "embeddings" in include:
+            result["embeddings"] = [
+                self._segment(name).vectors[row].tolist() for name, row in locations
+            ]
+        if "documents" in include:
+            documents = {}
+            by_segment: dict[str, list[int]] = {}
+            for name, row in locations:
+                by_segment.setdefault(name, []).append(row)
+            for name, rows in by_segment.items():
+                for row, doc in zip(rows, self._segment(name).documents(rows)):
+                    documents[(name, row)] = doc
+            result["documents"] = [documents[loc] for loc in locations]
+        return result
+
+    def query(
+        self,
+        query_embeddings: list[list[float]],
+        n_results: int = 10,
+        where: dict[str, Any] = None,
+        include: list[str] = None,
+    ) -> dict[str, Any]:
+        """Exact cosine-similarity search for one or more query vectors."""
+        include = include if include is not None else ["documents", "metadatas"]
+        manifest = self._load_manifest()
+        queries = normalize(np.asarray(query_embeddings, dtype=np.float32))
+        if queries.ndim == 1:
+            queries = queries[None, :]
+
+        # Best candidates of every segment, per query
+        candidates: list[list[tuple[float, str, int]]] = [[] for _ in queries]
+        for name, segment, mask in self._rows(manifest, where):
+            if not mask.any():
+                continue
+            rows = None if mask.all() else np.flatnonzero(mask)
+            num_rows = len(mask) if rows is None else len(rows)
+            if self.quantization != "none" and num_rows > n_results * self.oversample:
+                for q, query in enumerate(queries):
+                    for score, row in self._prefiltered(segment, rows, query, n_results):
+                        candidates[q].append((score, name, row))
+                continue
+
+            vectors = segment.vectors if rows is None else segment.vectors[rows]
+            scores = vectors @ queries.T
+
+            k = min(n_results, scores.shape[0])
+            top = np.argpartition(-scores, k - 1, axis=0)[:k]
+            for q in range(len(queries)):
+                for idx in top[:, q]:
+                    row = int(idx) if rows is None else int(rows[idx])
+                    candidates[q].append((float(scores[idx, q]), name, row))
+
+        result: dict[str, Any] = {"ids": [], "scores": []}
+        for key in ("documents", "metadatas", "embeddings"):
+            if key in include:
+                result[key] = []
+
+        for per_query in candidates:
+            best = sorted(per_query, key=lambda c: c[0], reverse=True)[:n_results]
+            collected = self._collect([(name, row) for _, name, row in best], include)
+            result["scores"].append([score for score, _, _ in best])
+            for key, values in collected.items():
+                result[key].append(values)
+
+        return result
+
+    def _prefiltered(
+        self, segment: Segment, rows: np.ndarray | None, query: np.ndarray, n_results: int
+    ) -> list[tuple[float, int]]:
+        """Search a segment via its quantized codes, reranking in float32.
+
+        Only the candidate rows of the memory-mapped vectors are read.
+
+        Returns:
+            List of (exact score, row) for the best n_results rows
+        """
+        approximate = segment.approximate_scores(self.quantization, query, rows)
+        count = n_results * self.oversample
+        best = np.argpartition(-approximate, count - 1)[:count]
+        candidates = np.sort(best if rows is None else rows[best])
+
+        scores = segment.vectors[candidates] @ query
+        k = min(n_results, len(candidates))
+        top = np.argpartition(-scores, k - 1)[:k]
+        return [(float(scores[i]), int(candidates[i])) for i in top]
+
+    def count(self) -> int:
+        """Number of stored vectors."""
+        manifest = self._load_manifest()
+        return sum(entry["rows"] for entry in manifest["segments"]) - sum(
+            len(rows) for rows in manifest["deleted"].values()
+        )
+
+    def clear(self) -> None:
+        """Remove all stored vectors."""
+        manifest = self._load_manifest()
+        if not self.path.exists():
+            return
+        retired_at = time.time()
+        cleared = {
+            "dim": None,
+            "segments": [],
+            "deleted": {},
+            "retired": {
+                **manifest["retired"],
+                **{entry["name"]: retired_at for entry in manifest["segments"]},
+            },
+            "next_segment": manifest["next_segment"],
+        }
+        self._remove_unreferenced(cleared)
+        self._save_manifest(cleared)
+        self._mask_cache.clear()
@@ -0,0 +1,179 @@
+"""Caches for repeated searches.
+
+Agents send the same queries again and again, within a session and across
+sessions. Two caches avoid repeating the work:
+
+- ``QueryEmbeddingCache``: query embeddings per model, in an LRU table of
+  ``.workspace/embeddings/query_cache.sqlite3`` shared by all processes
+- ``ResultCache``: finished search results in process memory (the MCP
+  server is long-lived), keyed by the query, its parameters and the store's
+  index generation
+
+Every write to the vector store bumps its generation (see
+VectorStore.generation), so results cached under an older generation are
+never returned again.
+"""
+
+import copy
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+QUERY_CACHE_FILE = "query_cache.sqlite3"
+
+# Seconds to wait for another process's write to the query cache
+CONNECT_TIMEOUT = 5.0
+
+# Searches kept by the in-process result cache
+RESULT_CACHE_SIZE = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS queries (
+    model TEXT NOT NULL,
+    query TEXT NOT NULL,
+    embedding BLOB NOT NULL,
+    used INTEGER NOT NULL,
+    PRIMARY KEY (model, query)
+);
+CREATE INDEX IF NOT EXISTS queries_used ON queries (used);
+"""
+
+
+class QueryEmbeddingCache:
+    """Persistent LRU cache of query embeddings."""
+
+    def __init__(self, workspace_path: Path, capacity: int):
+        """Initialize cache.
+
+        Args:
+            workspace_path: Path to workspace root
+            capacity: Maximum number of cached queries (0 disables the cache)
+        """
+        self.path = Path(workspace_path) / ".workspace" / "embeddings" / QUERY_CACHE_FILE
+        self.capacity = capacity
+        self._connection: sqlite3.Connection | None = None
+        # Hybrid searches embed queries on worker threads
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path, timeout=CONNECT_TIMEOUT, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            # A lost update only costs a re-embedding
+            connection.execute("PRAGMA synchronous=OFF")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    @staticmethod
+    def _tick(connection: sqlite3.Connection) -> int:
+        """Next value of the recency counter."""
+        row = connection.execute("SELECT coalesce(max(used), 0) + 1 FROM queries")
+        return row.fetchone()[0]
+
+    def get_many(self, model: str, queries: list[str]) -> dict[str, list[float]]:
+        """Look up cached embeddings, marking them recently used.
+
+        Args:
+            model: Embedding model name
+            queries: Query texts
+
+        Returns:
+            Dictionary of query -> embedding for the cached queries
+        """
+        if not self.capacity or not queries or not self.path.exists():
+            return {}
+        found = {}
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                tick = self._tick(connection)
+                for query in dict.fromkeys(queries):
+                    row = connection.execute(
+                        "SELECT embedding FROM queries WHERE model = ? AND query = ?",
+                        (model, query),
+                    ).fetchone()
+                    if row is None:
+                        continue
+                    found[query] = np.frombuffer(row[0], dtype=np.float32).tolist()
+                    connection.execute(
+                        "UPDATE queries SET used = ? WHERE model = ? AND query = ?",
+                        (tick, model, query),
+                    )
+        return found
+
+    def put_many(self, model: str, embeddings: dict[str, list[float]]) -> None:
+        """Cache embeddings, evicting the least recently used beyond capacity.
+
+        Args:
+            model: Embedding model name
+            embeddings: Dictionary of query -> embedding
+        """
+        if not self.capacity or not embeddings:
+            return
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                tick = self._tick(connection)
+                connection.executemany(
+                    "INSERT OR REPLACE INTO queries (model, query, embedding, used) "
+                    "VALUES (?, ?, ?, ?)",
+                    [
+                        (model, query, np.asarray(embedding, np.float32).tobytes(), tick)
+                        for query, embedding in embeddings.items()
+                    ],
+                )
+                connection.execute(
+                    "DELETE FROM queries WHERE rowid NOT IN "
+                    "(SELECT rowid FROM queries ORDER BY used DESC LIMIT ?)",
+                    (self.capacity,),
+                )
+
+
+class ResultCache:
+    """In-process LRU cache of search results."""
+
+    def __init__(self, capacity: int = RESULT_CACHE_SIZE):
+        """Initialize cache.
+
+        Args:
+            capacity: Maximum number of cached searches
+        """
+        self.capacity = capacity
+        self._entries: OrderedDict[Any, list] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> list | None:
+        """Copy of the cached results for a key, if any."""
+        with self._lock:
+            results = self._entries.get(key)
+            if results is None:
+                return None
+            self._entries.move_to_end(key)
+        # Callers may annotate their results
+        return copy.deepcopy(results)
+
+    def put(self, key: Any, results: list) -> None:
+        """Cache results (a copy) for a key."""
+        results = copy.deepcopy(results)
+        with self._lock:
+            self._entries[key] = results
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by all retrievers of the process
+RESULT_CACHE = ResultCache()
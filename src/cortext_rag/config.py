@@ -0,0 +1,153 @@
+"""Workspace-level RAG configuration.
+
+Settings live under the optional ``"rag"`` key of ``.workspace/registry.json``.
+Unknown keys are ignored and missing keys fall back to the defaults below, so
+workspaces without a ``"rag"`` section behave exactly as before.
+"""
+
+import json
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any
+
+from .backends import BACKEND_PACKAGES, BACKENDS
+from .embedder import DEFAULT_RERANK_MODEL
+
+SAMPLING_POLICIES = ("head", "spread", "skip")
+DISTANCE_SPACES = ("cosine", "ip", "l2")
+QUANTIZATIONS = ("none", "binary", "int8")
+
+# Packages every RAG command needs, whatever the vector store backend
+CORE_PACKAGES = ("fastembed", "numpy")
+
+
+@dataclass
+class RAGConfig:
+    """Tunable settings for indexing and retrieval."""
+
+    # Text/markdown files larger than this (bytes) are streamed in blocks
+    stream_threshold: int = 8 * 1024 * 1024
+    # Per-file size cap in bytes (0 = unlimited)
+    max_file_size: int = 0
+    # What to index from files over the cap: "head", "spread" or "skip"
+    sampling: str = "head"
+    # Drop navigation, header, footer and similar chrome from HTML pages
+    html_remove_boilerplate: bool = False
+    # Vector store backend: "chroma" or "numpy"
+    backend: str = "chroma"
+    # Similarity space of new collections: "cosine", "ip" or "l2"
+    distance: str = "cosine"
+    # Seconds a writer waits for another process's write lease
+    lease_timeout: float = 30.0
+    # Store each conversation type in its own collection
+    shard_by_type: bool = False
+    # HNSW graph degree, build-time and query-time candidate list sizes.
+    # Changing these (or distance) on an existing store needs `cortext rag reindex`
+    hnsw_m: int = 16
+    hnsw_construction_ef: int = 100
+    hnsw_search_ef: int = 100
+    # Quantized prefilter of the numpy backend: "none", "binary" or "int8"
+    quantization: str = "none"
+    # Candidates reranked at full precision per requested result
+    quantization_oversample: int = 8
+    # Store a short preview of text-file chunks and read their full text from
+    # the workspace files when they are returned by a search
+    lazy_text: bool = True
+    # Search a shard's IVF index (see `cortext rag build-ann`) from this size
+    ann_threshold: int = 200_000
+    # IVF posting lists (0 = about 4 * sqrt(chunks)) and lists scanned per query
+    ivf_nlist: int = 0
+    ivf_nprobe: int = 16
+    # Rerank search results with a local cross-encoder: candidates scored
+    # per query and the time budget (ms) after which the partial order is kept
+    rerank: bool = False
+    rerank_model: str = DEFAULT_RERANK_MODEL
+    rerank_candidates: int = 30
+    rerank_budget_ms: int = 250
+    # Query embeddings kept in the workspace's persistent LRU cache (0 = off),
+    # and whether this process caches search results per index generation
+    query_cache_size: int = 2048
+    result_cache: bool = True
+    # Split the store into a hot tier (recent conversations, searched first)
+    # and a cold tier (older or archived ones, see `cortext rag archive`).
+    # Conversations dated more than hot_days ago are cold; the cold tier is
+    # searched when the hot results score below cold_min_score or the date
+    # filter reaches past the hot window. Changes apply after `cortext rag retier`
+    tiering: bool = False
+    hot_days: int = 90
+    cold_min_score: float = 0.5
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RAGConfig":
+        """Create from dictionary, ignoring unknown keys."""
+        known = {f.name for f in fields(cls)}
+        config = cls(**{k: v for k, v in data.items() if k in known})
+        if config.sampling not in SAMPLING_POLICIES:
+            raise ValueError(
+                f"Invalid sampling policy: {config.sampling}. "
+                f"Supported: {', '.join(SAMPLING_POLICIES)}"
+            )
+        if config.backend not in BACKENDS:
+            raise ValueError(
+                f"Invalid vector store backend: {config.backend}. "
+                f"Supported: {', '.join(BACKENDS)}"
+            )
+        if config.distance not in DISTANCE_SPACES:
+            raise ValueError(
+                f"Invalid distance space: {config.distance}. "
+                f"Supported: {', '.join(DISTANCE_SPACES)}"
+            )
+        if config.quantization not in QUANTIZATIONS:
+            raise ValueError(
+                f"Invalid quantization: {config.quantization}. "
+                f"Supported: {', '.join(QUANTIZATIONS)}"
+            )
+        return config
+
+    @property
+    def required_packages(self) -> tuple[str, ...]:
+        """Packages needed to embed and search with these settings."""
+        return CORE_PACKAGES + BACKEND_PACKAGES[self.backend]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for storage."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    @classmethod
+    def load(cls, workspace_path: Path = None) -> "RAGConfig":
+        """Load configuration from the workspace registry.
+
+        Args:
+            workspace_path: Path to workspace root
+
+        Returns:
+            RAGConfig with workspace overrides applied
+        """
+        workspace_path = Path(workspace_path or Path.cwd())
+        registry_path = workspace_path / ".workspace" / "registry.json"
+        try:
+            registry = json.loads(registry_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls()
+        return cls.from_dict(registry.get("rag") or {})
+
+
+def load_conversation_types(workspace_path: Path = None) -> dict[str, str]:
+    """Map conversation type names to their folders from the workspace registry.
+
+    Args:
+        workspace_path: Path to workspace root
+
+    Returns:
+        Dictionary of type name -> folder (empty without a registry)
+    """
+    workspace_path = Path(workspace_path or Path.cwd())
+    registry_path = workspace_path / ".workspace" / "registry.json"
+    try:
+        registry = json.loads(registry_path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return {
+        type_name: type_config.get("folder", type_name)
+        for type_name, type_config in registry.get("conversation_types", {}).items()
+    }
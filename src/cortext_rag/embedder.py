@@ -1,10 +1,31 @@
 """Embedding generation using fastembed."""
 
+import threading
+import time
 from typing import Any
 
 
+# Default cross-encoder for reranking search results
+DEFAULT_RERANK_MODEL = "Xenova/ms-marco-MiniLM-L-6-v2"
+
+# Query-document pairs scored per cross-encoder call; the rerank time budget
+# is checked between batches
+RERANK_BATCH_SIZE = 8
+
+# Embedding models and cross-encoders loaded in this process, keyed by
+# ("embedding" | "rerank", model name) and shared by all Embedder instances
+# (the MCP server creates one per call)
+_MODELS: dict[tuple[str, str], Any] = {}
+_MODELS_LOCK = threading.Lock()
+
+
 class Embedder:
-    """Generate embeddings using fastembed (lightweight, no PyTorch)."""
+    """Generate embeddings using fastembed (lightweight, no PyTorch).
+
+    Optionally also scores query-document pairs with a fastembed
+    cross-encoder (see rerank), loaded on first use like the embedding model.
+    Both are loaded once per process.
+    """
 
     # Model name mapping for convenience
     MODEL_ALIASES = {
@@ -16,12 +37,20 @@ class Embedder:
         "sentence-transformers/all-MiniLM-L6-v2": 384,
     }
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        rerank_model: str = DEFAULT_RERANK_MODEL,
+    ):
         """Initialize embedder with lazy model loading."""
         # Support both short and full names
         self._model_name = self.MODEL_ALIASES.get(model_name, model_name)
         self._model = None
+        self._rerank_model_name = rerank_model
+        self._reranker = None
         self._embedding_dim = self.MODEL_DIMENSIONS.get(self._model_name)
+        # Seconds spent loading the model (None until loaded)
+        self.load_seconds: float | None = None
 
     @property
     def model_name(self) -> str:
@@ -40,9 +69,17 @@ class Embedder:
         if self._model is not None:
             return
 
-        from fastembed import TextEmbedding
+        # Concurrent first uses wait for one load
+        with _MODELS_LOCK:
+            model = _MODELS.get(("embedding", self._model_name))
+            if model is None:
+                from fastembed import TextEmbedding
 
-        self._model = TextEmbedding(model_name=self._model_name)
+                start = time.perf_counter()
+                model = TextEmbedding(model_name=self._model_name)
+                self.load_seconds = time.perf_counter() - start
+                _MODELS[("embedding", self._model_name)] = model
+        self._model = model
 
         # If dimension not known, get it from a test embedding
         if self._embedding_dim is None:
@@ -81,6 +118,54 @@ class Embedder:
         """
         return self.embed([text])[0]
 
+    def _load_reranker(self) -> None:
+        """Load the cross-encoder lazily on first use."""
+        if self._reranker is not None:
+            return
+
+        with _MODELS_LOCK:
+            reranker = _MODELS.get(("rerank", self._rerank_model_name))
+            if reranker is None:
+                from fastembed.rerank.cross_encoder import TextCrossEncoder
+
+                reranker = TextCrossEncoder(model_name=self._rerank_model_name)
+                _MODELS[("rerank", self._rerank_model_name)] = reranker
+        self._reranker = reranker
+
+    def rerank(
+        self, query: str, texts: list[str], budget_seconds: float = None
+    ) -> list[float]:
+        """Score texts against a query with the cross-encoder.
+
+        Texts are scored in order, RERANK_BATCH_SIZE at a time. Once the
+        budget is spent no further batch is started, so the scores may
+        cover only a prefix of texts. Loading the model on the process's
+        first rerank counts against the budget.
+
+        Args:
+            query: Query text
+            texts: Candidate texts, most promising first
+            budget_seconds: Time limit for scoring (None = no limit)
+
+        Returns:
+            Relevance scores (higher is better) of the first len(scores) texts
+        """
+        if not texts:
+            return []
+
+        deadline = None if budget_seconds is None else time.perf_counter() + budget_seconds
+        self._load_reranker()
+        scores: list[float] = []
+        for start in range(0, len(texts), RERANK_BATCH_SIZE):
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            batch = texts[start : start + RERANK_BATCH_SIZE]
+            scores.extend(
+                float(score)
+                for score in self._reranker.rerank(query, batch, batch_size=len(batch))
+            )
+        return scores
+
     def get_metadata(self) -> dict[str, Any]:
         """Get model metadata."""
         return {
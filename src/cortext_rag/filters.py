@@ -0,0 +1,83 @@
+"""Evaluation of Chroma-style ``where`` filters on metadata dicts.
+
+Used by backends that store metadata themselves. Supports equality shorthand
+(``{"field": value}``), the comparison operators ``$eq``, ``$ne``, ``$gt``,
+``$gte``, ``$lt``, ``$lte``, ``$in``, ``$nin`` and ``$contains``, and the
+logical combinators ``$and`` and ``$or``.
+"""
+
+from typing import Any, Callable
+
+Predicate = Callable[[dict[str, Any]], bool]
+
+OPERATORS = frozenset(
+    {"$eq", "$ne", "$gt", "$gte", "$lt", "$lte", "$in", "$nin", "$contains"}
+)
+
+_MISSING = object()
+
+
+def _compare(op: str, value: Any, operand: Any) -> bool:
+    if op == "$eq":
+        return value == operand
+    if op == "$ne":
+        return value != operand
+    if op == "$in":
+        return value in operand
+    if op == "$nin":
+        return value not in operand
+    if value is _MISSING:
+        return False
+    if op == "$contains":
+        return isinstance(value, str) and operand in value
+    try:
+        if op == "$gt":
+            return value > operand
+        if op == "$gte":
+            return value >= operand
+        if op == "$lt":
+            return value < operand
+        if op == "$lte":
+            return value <= operand
+    except TypeError:
+        return False
+    return False
+
+
+def compile_where(where: dict[str, Any] | None) -> Predicate:
+    """Compile a where filter into a predicate over metadata dicts.
+
+    Args:
+        where: Chroma-style filter, or None to match everything
+
+    Returns:
+        Function returning True for matching metadata
+    """
+    if not where:
+        return lambda metadata: True
+
+    predicates: list[Predicate] = []
+    for key, condition in where.items():
+        if key == "$and":
+            parts = [compile_where(c) for c in condition]
+            predicates.append(lambda m, parts=parts: all(p(m) for p in parts))
+        elif key == "$or":
+            parts = [compile_where(c) for c in condition]
+            predicates.append(lambda m, parts=parts: any(p(m) for p in parts))
+        elif isinstance(condition, dict):
+            for op, operand in condition.items():
+                if op not in OPERATORS:
+                    raise ValueError(f"Unsupported filter operator: {op}")
+                predicates.append(
+                    lambda m, key=key, op=op, operand=operand: _compare(
+                        op, m.get(key, _MISSING), operand
+                    )
+                )
+        else:
+            predicates.append(
+                lambda m, key=key, operand=condition: m.get(key, _MISSING) == operand
+            )
+
+    if len(predicates) == 1:
+        return predicates[0]
+    return lambda metadata: all(p(metadata) for p in predicates)
@@ -0,0 +1,135 @@
+"""Chunk text read from workspace files on demand.
+
+Chunks of text formats (markdown, plain text) are exact word ranges of their
+source file. The indexer records where each chunk lies in the file::
+
+    byte_start, byte_end    # byte range of the chunk's words
+    text_hash               # hash of the chunk text
+
+With ``lazy_text`` enabled the store then keeps only a short preview of each
+chunk, and searches read the full text of the final results from the files.
+If a file changed since it was embedded, the range no longer hashes to
+``text_hash`` and the stored preview is returned instead.
+"""
+
+import hashlib
+import re
+from pathlib import Path
+
+from .models import Chunk
+
+# Characters of chunk text kept in the store when the text is read lazily
+PREVIEW_CHARS = 200
+
+_WORD = re.compile(r"\S+")
+
+
+def text_hash(text: str) -> str:
+    """Short hash identifying a chunk's text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def is_lazy(metadata: dict) -> bool:
+    """Whether a chunk's text can be read back from its source file."""
+    return "text_hash" in metadata and "byte_start" in metadata
+
+
+def add_byte_offsets(chunks: list[Chunk], raw: bytes, body_offset: int) -> bool:
+    """Record the file byte range and text hash of each chunk.
+
+    Chunks must be word ranges (``start_word``/``end_word``) of the text
+    that starts at body_offset in the file.
+
+    Args:
+        chunks: Chunks of the document
+        raw: File contents from body_offset on
+        body_offset: Byte offset of the chunked text in the file
+
+    Returns:
+        False (and chunks untouched) if the words do not line up with the
+        file, e.g. for undecodable bytes
+    """
+    try:
+        body = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return False
+
+    spans = [match.span() for match in _WORD.finditer(body)]
+    if not chunks or chunks[-1].metadata.get("end_word", 0) > len(spans):
+        return False
+
+    bounds = {}
+    for chunk in chunks:
+        start, end = chunk.metadata["start_word"], chunk.metadata["end_word"]
+        bounds[chunk.chunk_index] = (spans[start][0], spans[end - 1][1])
+
+    last_start, last_end = bounds[chunks[-1].chunk_index]
+    if " ".join(body[last_start:last_end].split()) != chunks[-1].text:
+        return False
+
+    # Character positions to byte positions, in one pass over the text
+    if body.isascii():
+        to_byte = {pos: pos for pair in bounds.values() for pos in pair}
+    else:
+        to_byte = {}
+        position = byte = 0
+        for pos in sorted({pos for pair in bounds.values() for pos in pair}):
+            byte += len(body[position:pos].encode("utf-8"))
+            position = pos
+            to_byte[pos] = byte
+
+    for chunk in chunks:
+        start, end = bounds[chunk.chunk_index]
+        chunk.metadata["byte_start"] = body_offset + to_byte[start]
+        chunk.metadata["byte_end"] = body_offset + to_byte[end]
+        chunk.metadata["text_hash"] = text_hash(chunk.text)
+    return True
+
+
+def preview(text: str) -> str:
+    """Stored stand-in for a chunk whose text is read lazily."""
+    return text[:PREVIEW_CHARS]
+
+
+def _matching_text(raw: bytes, expected_hash: str) -> str | None:
+    """Chunk text of a byte range, if it still hashes as expected.
+
+    Streamed chunks split the raw bytes and in-memory chunks the decoded
+    text; the two only differ around non-ASCII whitespace.
+    """
+    text = b" ".join(raw.split()).decode("utf-8", errors="replace")
+    if text_hash(text) == expected_hash:
+        return text
+    text = " ".join(raw.decode("utf-8", errors="replace").split())
+    if text_hash(text) == expected_hash:
+        return text
+    return None
+
+
+def hydrate(chunks: list[Chunk]) -> None:
+    """Replace stored previews with the chunk text from the source files.
+
+    Each file is opened once and only the chunks' byte ranges are read.
+    Chunks whose range no longer matches their hash keep the stored text.
+
+    Args:
+        chunks: Chunks built from search results (updated in place)
+    """
+    by_source: dict[str, list[Chunk]] = {}
+    for chunk in chunks:
+        if is_lazy(chunk.metadata) and text_hash(chunk.text) != chunk.metadata["text_hash"]:
+            by_source.setdefault(chunk.source_path, []).append(chunk)
+
+    for source_path, source_chunks in by_source.items():
+        try:
+            with Path(source_path).open("rb") as f:
+                for chunk in source_chunks:
+                    start = int(chunk.metadata["byte_start"])
+                    f.seek(start)
+                    raw = f.read(int(chunk.metadata["byte_end"]) - start)
+                    text = _matching_text(raw, chunk.metadata["text_hash"])
+                    if text is not None:
+                        chunk.text = text
+        except OSError:
+            # Moved or deleted since embedding: keep the previews
+            continue
@@ -2,12 +2,40 @@
 
 import hashlib
 import json
+import math
+import os
+import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
+from .config import RAGConfig, load_conversation_types
+from .hydration import add_byte_offsets, text_hash
+from .locking import write_text_atomic
 from .models import Chunk, Document, EmbeddingStatus
-from .parsers import get_parser
+from .parsers import get_parser, supported_extensions
+
+# Read size for streamed documents
+STREAM_BLOCK_SIZE = 1024 * 1024
+
+# Number of evenly spaced windows read by the "spread" sampling policy
+SPREAD_WINDOWS = 16
+
+# Version of the structured fields produced by filter_fields(); bump it when
+# they change so chunks stored by older versions are backfilled
+FILTER_FIELDS_VERSION = 1
+
+DATE_PATTERN = re.compile(r"^(\d{4})-(\d{2})-(\d{2})")
+
+# Words of streamed blocks (the same split as bytes.split())
+BYTE_WORD_PATTERN = re.compile(rb"\S+")
+BYTE_SPACE_PATTERN = re.compile(rb"\s")
+BYTE_TRAILING_WORD_PATTERN = re.compile(rb"\S*\Z")
+
+# Bytes per chunk token: a streamed run without whitespace longer than a
+# chunk (minified or base64 data) is split into words of this many bytes
+# per token, so the carried partial word stays small
+BYTES_PER_TOKEN = 4
 
 
 class Indexer:
@@ -18,6 +46,7 @@ class Indexer:
         workspace_path: Path = None,
         chunk_size: int = 512,
         chunk_overlap: int = 50,
+        config: RAGConfig = None,
     ):
         """Initialize indexer.
 
@@ -25,13 +54,16 @@ class Indexer:
             workspace_path: Path to workspace root
             chunk_size: Target chunk size in tokens (approximate)
             chunk_overlap: Overlap between chunks in tokens
+            config: RAG settings (default: loaded from workspace registry)
         """
         self.workspace_path = Path(workspace_path or Path.cwd())
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.config = config or RAGConfig.load(self.workspace_path)
         self.status_file = (
             self.workspace_path / ".workspace" / "embeddings" / "status.json"
         )
+        self._type_folders = None
 
     def parse_document(self, path: Path) -> Document:
         """Parse a document file.
@@ -42,7 +74,27 @@ class Indexer:
         Returns:
             Document with parsed content and metadata
         """
-        parser = get_parser(path)
+        parser = get_parser(path, self.config)
+        file_size = path.stat().st_size
+        streamable = hasattr(parser, "stream_info")
+        over_cap = bool(self.config.max_file_size) and (
+            file_size > self.config.max_file_size
+        )
+
+        if over_cap and (self.config.sampling == "skip" or not streamable):
+            # Formats that cannot be sampled are skipped when over the cap
+            return Document(
+                path=path,
+                content="",
+                content_hash=self._compute_hash(f"skipped:{file_size}"),
+                doc_type=path.suffix.lower(),
+                metadata={"file_name": path.name, "skipped": "max_file_size"},
+                fields=self.filter_fields(path, {}),
+            )
+
+        if streamable and (file_size > self.config.stream_threshold or over_cap):
+            return self._parse_streamed(path, parser, file_size)
+
         content, metadata = parser.parse(path)
         content_hash = self._compute_hash(content)
 
@@ -52,13 +104,282 @@ class Indexer:
             content_hash=content_hash,
             doc_type=path.suffix.lower(),
             metadata=metadata,
+            fields=self.filter_fields(path, metadata),
         )
 
         # Generate chunks
         doc.chunks = self._chunk_content(content, str(path))
+        if streamable and doc.chunks:
+            # Text formats: chunks can be read back from the file on demand
+            body_offset, _ = parser.stream_info(path)
+            with path.open("rb") as f:
+                f.seek(body_offset)
+                add_byte_offsets(doc.chunks, f.read(), body_offset)
+        for chunk in doc.chunks:
+            chunk.metadata.update(doc.fields)
 
         return doc
 
+    def filter_fields(self, path: Path, metadata: dict[str, Any]) -> dict[str, Any]:
+        """Extract the structured fields stored with every chunk for filtering.
+
+        The conversation type comes from the registry folder the file lives
+        in, the date (as an integer yyyymmdd) and conversation ID from the
+        ``<type>/YYYY-MM-DD/<id>/`` layout, falling back to a frontmatter
+        ``date``. Frontmatter ``status`` and ``tags`` are included when
+        present; each tag also becomes a boolean ``tag_<name>`` field so it
+        can be matched by equality.
+
+        Args:
+            path: Path to document
+            metadata: Metadata returned by the parser
+
+        Returns:
+            Dictionary of fields (missing fields are omitted)
+        """
+        fields: dict[str, Any] = {"doc_type": path.suffix.lower().lstrip(".")}
+
+        try:
+            parts = path.relative_to(self.workspace_path).parts
+        except ValueError:
+            parts = path.parts
+
+        for type_name, folder_parts in self.type_folders.items():
+            if parts[: len(folder_parts)] == folder_parts:
+                fields["conversation_type"] = type_name
+                parts = parts[len(folder_parts) :]
+                break
+
+        # Directories only: the file name itself is not a conversation ID
+        for i, part in enumerate(parts[:-1]):
+            if DATE_PATTERN.match(part):
+                fields["conversation_date"] = _date_to_int(part)
+                if i + 1 < len(parts) - 1:
+                    fields["conversation_id"] = parts[i + 1]
+                break
+        else:
+            date = str(metadata.get("date", ""))
+            if DATE_PATTERN.match(date):
+                fields["conversation_date"] = _date_to_int(date)
+
+        if metadata.get("status"):
+            fields["status"] = str(metadata["status"]).strip().lower()
+
+        tags = _parse_tags(metadata.get("tags"))
+        if tags:
+            fields["tags"] = ",".join(tags)
+            for tag in tags:
+                fields[f"tag_{tag}"] = True
+
+        return fields
+
+    @property
+    def type_folders(self) -> dict[str, tuple[str, ...]]:
+        """Conversation type -> folder path parts, from the registry."""
+        if self._type_folders is None:
+            folders = {
+                type_name: Path(folder).parts
+                for type_name, folder in load_conversation_types(
+                    self.workspace_path
+                ).items()
+            }
+            # Most specific folder first, in case folders are nested
+            self._type_folders = dict(
+                sorted(folders.items(), key=lambda item: len(item[1]), reverse=True)
+            )
+        return self._type_folders
+
+    def _parse_streamed(self, path: Path, parser, file_size: int) -> Document:
+        """Describe a large document without loading it into memory.
+
+        One buffered pass computes the content hash and word count; chunks
+        are produced later by iter_chunks().
+
+        Args:
+            path: Path to document
+            parser: Parser providing stream_info()
+            file_size: Size of the file in bytes
+
+        Returns:
+            Streamed Document with byte ranges and chunk count
+        """
+        body_offset, metadata = parser.stream_info(path)
+        byte_ranges = self._sample_ranges(body_offset, file_size)
+
+        hasher = hashlib.sha256()
+        num_words = 0
+        for _, block in self._iter_blocks(path, byte_ranges):
+            hasher.update(block)
+            num_words += len(block.split())
+
+        if byte_ranges != [(body_offset, file_size)]:
+            metadata["sampled"] = self.config.sampling
+
+        return Document(
+            path=path,
+            content="",
+            content_hash=hasher.hexdigest(),
+            doc_type=path.suffix.lower(),
+            metadata=metadata,
+            fields=self.filter_fields(path, metadata),
+            byte_ranges=byte_ranges,
+            streamed_chunks=self._count_chunks(num_words),
+        )
+
+    def _sample_ranges(self, start: int, file_size: int) -> list[tuple[int, int]]:
+        """Pick the byte ranges of a file to index under the size cap."""
+        cap = self.config.max_file_size
+        if not cap or file_size - start <= cap:
+            return [(start, file_size)]
+
+        if self.config.sampling == "spread":
+            window = cap // SPREAD_WINDOWS
+            stride = (file_size - start) // SPREAD_WINDOWS
+            return [
+                (start + i * stride, start + i * stride + window)
+                for i in range(SPREAD_WINDOWS)
+            ]
+
+        return [(start, start + cap)]
+
+    def _iter_blocks(
+        self, path: Path, byte_ranges: list[tuple[int, int]]
+    ) -> Iterator[tuple[int, bytes]]:
+        """Read byte ranges in buffered blocks that end on whitespace.
+
+        A word cut by a block boundary is carried into the next block, and
+        words cut by the edges of a sampled range are dropped. Runs without
+        whitespace longer than a chunk are split into chunk-sized words.
+
+        Args:
+            path: Path to file
+            byte_ranges: (start, end) byte offsets to read
+
+        Yields:
+            Tuples of (file offset of the block, raw bytes)
+        """
+        max_word = self.chunk_size * BYTES_PER_TOKEN
+        with path.open("rb") as f:
+            for start, end in byte_ranges:
+                skip_partial = False
+                if start > 0:
+                    f.seek(start - 1)
+                    skip_partial = not f.read(1).isspace()
+                f.seek(start)
+
+                carry = b""
+                remaining = end - start
+                while remaining > 0:
+                    block = f.read(min(STREAM_BLOCK_SIZE, remaining))
+                    if not block:
+                        break
+                    remaining -= len(block)
+                    block_end = f.tell()
+
+                    if skip_partial:
+                        space = BYTE_SPACE_PATTERN.search(block)
+                        skip_partial = space is None
+                        block = b"" if space is None else block[space.start() :]
+
+                    block = carry + block
+                    cut = BYTE_TRAILING_WORD_PATTERN.search(block).start()
+                    carry = block[cut:]
+                    if cut:
+                        yield block_end - len(block), block[:cut]
+                    while len(carry) > max_word:
+                        # Split at a UTF-8 character boundary
+                        split = max_word
+                        while split and carry[split] & 0xC0 == 0x80:
+                            split -= 1
+                        split = split or max_word
+                        yield block_end - len(carry), carry[:split]
+                        carry = carry[split:]
+
+                # Drop a word cut by the end of a sampled range
+                next_byte = f.read(1) if remaining == 0 else b""
+                if carry and (not next_byte or next_byte.isspace()):
+                    yield block_end - len(carry), carry
+
+    def iter_chunks(self, doc: Document) -> Iterator[Chunk]:
+        """Iterate over a document's chunks.
+
+        Streamed documents are chunked incrementally from their byte ranges,
+        so peak memory stays flat regardless of file size.
+
+        Args:
+            doc: Parsed document
+
+        Yields:
+            Chunk objects in order
+        """
+        if not doc.is_streamed:
+            yield from doc.chunks
+            return
+
+        words_per_chunk = int(self.chunk_size / 1.3)
+        overlap_words = int(self.chunk_overlap / 1.3)
+        step = words_per_chunk - overlap_words
+        source_path = str(doc.path)
+
+        # Chunks spanning sampled windows are not contiguous in the file
+        contiguous = len(doc.byte_ranges) == 1
+
+        def make_chunk(
+            words: list[bytes], spans: list[tuple[int, int]], index: int, start: int
+        ) -> Chunk:
+            text = b" ".join(words).decode("utf-8", errors="replace")
+            metadata = {"start_word": start, "end_word": start + len(words)}
+            # Words split out of a long run are not separated in the file,
+            # so the text cannot be read back from its byte range
+            split = any(
+                previous[1] == following[0] for previous, following in zip(spans, spans[1:])
+            )
+            if contiguous and not split:
+                metadata["byte_start"] = spans[0][0]
+                metadata["byte_end"] = spans[-1][1]
+                metadata["text_hash"] = text_hash(text)
+            return Chunk(
+                text=text,
+                source_path=source_path,
+                chunk_index=index,
+                total_chunks=doc.streamed_chunks,
+                metadata={**metadata, **doc.fields},
+            )
+
+        buffer: list[bytes] = []
+        spans: list[tuple[int, int]] = []
+        index = 0
+        start_word = 0
+        for offset, block in self._iter_blocks(doc.path, doc.byte_ranges):
+            for match in BYTE_WORD_PATTERN.finditer(block):
+                buffer.append(match.group())
+                spans.append((offset + match.start(), offset + match.end()))
+            pos = 0
+            while len(buffer) - pos >= words_per_chunk:
+                end = pos + words_per_chunk
+                yield make_chunk(buffer[pos:end], spans[pos:end], index, start_word)
+                index += 1
+                pos += step
+                start_word += step
+            del buffer[:pos]
+            del spans[:pos]
+
+        # Trailing words not covered by the last full chunk's overlap
+        if buffer and (index == 0 or len(buffer) > overlap_words):
+            yield make_chunk(buffer, spans, index, start_word)
+
+    def _count_chunks(self, num_words: int) -> int:
+        """Number of chunks _chunk_content() produces for a word count."""
+        words_per_chunk = int(self.chunk_size / 1.3)
+        overlap_words = int(self.chunk_overlap / 1.3)
+        if num_words == 0:
+            return 0
+        if num_words <= words_per_chunk:
+            return 1
+        return 1 + math.ceil(
+            (num_words - words_per_chunk) / (words_per_chunk - overlap_words)
+        )
+
     def _chunk_content(self, content: str, source_path: str) -> list[Chunk]:
         """Split content into overlapping chunks.
 
@@ -128,10 +449,108 @@ class Indexer:
         status = self.get_status(str(doc.path))
         if status is None:
             return True
-        return status.content_hash != doc.content_hash
+        return status.content_hash != doc.content_hash or self.projection_outdated(status)
+
+    def find_shared(self, doc: Document) -> str | None:
+        """Find another path whose stored chunks hold identical content.
+
+        Args:
+            doc: Document about to be embedded
+
+        Returns:
+            Source path owning the chunks, or None if the content is new
+        """
+        source_path = str(doc.path)
+        for path, data in self._load_all_status().items():
+            if (
+                path != source_path
+                and data["content_hash"] == doc.content_hash
+                and not data.get("shared_with")
+                and data["num_chunks"] > 0
+            ):
+                return path
+        return None
+
+    def get_aliases(self) -> dict[str, list[str]]:
+        """Map each path owning shared chunks to the paths reusing them."""
+        aliases: dict[str, list[str]] = {}
+        for path, data in self._load_all_status().items():
+            owner = data.get("shared_with")
+            if owner:
+                aliases.setdefault(owner, []).append(path)
+        return aliases
+
+    def get_alias_fields(self) -> dict[str, tuple[str, dict[str, Any]]]:
+        """Map each path reusing another's chunks to (owner, its own fields).
+
+        Searches match a copy's filters against these fields, since its
+        owner's chunks carry the owner's type and date. Statuses recorded
+        before the fields were kept fall back to the fields of the path.
+        """
+        alias_fields = {}
+        for path, data in self._load_all_status().items():
+            owner = data.get("shared_with")
+            if owner:
+                fields = data.get("fields")
+                if fields is None:
+                    fields = self.filter_fields(Path(path), {})
+                alias_fields[path] = (owner, fields)
+        return alias_fields
+
+    def is_unchanged_on_disk(self, path: Path) -> bool:
+        """Check whether a file's size and mtime match its embedding status.
+
+        A match means the file can be skipped without parsing it; a mismatch
+        only means the content hash has to be checked.
+
+        Args:
+            path: Path to document
+
+        Returns:
+            True if the file is known and untouched since it was embedded
+            and its stored chunks carry the current filter fields and
+            projection
+        """
+        status = self.get_status(str(path))
+        return (
+            self.stat_matches(status, path)
+            and not self.fields_outdated(status)
+            and not self.projection_outdated(status)
+        )
+
+    @staticmethod
+    def fields_outdated(status: EmbeddingStatus | None) -> bool:
+        """Whether stored chunks predate the current filter fields."""
+        return status is not None and status.fields_version != FILTER_FIELDS_VERSION
+
+    def projection_outdated(self, status: EmbeddingStatus | None) -> bool:
+        """Whether stored vectors were projected with another projection."""
+        return status is not None and status.projection != self._projection_version()
+
+    def _projection_version(self) -> str | None:
+        """Version of the workspace's applied projection (None without one)."""
+        # Imported here so parsing and planning work without NumPy
+        from .projection import current_version
+
+        return current_version(self.workspace_path)
+
+    @staticmethod
+    def stat_matches(status: EmbeddingStatus | None, path: Path) -> bool:
+        """Compare an embedding status against the file's current stat."""
+        if status is None or status.file_size is None:
+            return False
+        stat = path.stat()
+        return (
+            status.file_size == stat.st_size
+            and status.file_mtime_ns == stat.st_mtime_ns
+        )
 
     def update_status(
-        self, doc: Document, model_name: str, embedding_dim: int
+        self,
+        doc: Document,
+        model_name: str,
+        embedding_dim: int,
+        shared_with: str = None,
     ) -> None:
         """Update embedding status for document.
 
@@ -139,18 +558,26 @@ class Indexer:
             doc: Document that was embedded
             model_name: Name of embedding model used
             embedding_dim: Dimension of embeddings
+            shared_with: Path whose chunks are reused for identical content
         """
         # Load existing status
         all_status = self._load_all_status()
+        stat = doc.path.stat()
 
         # Update with new status
         status = EmbeddingStatus(
             source_path=str(doc.path),
             content_hash=doc.content_hash,
-            num_chunks=len(doc.chunks),
+            num_chunks=doc.num_chunks,
             embedded_at=datetime.now(),
             model_name=model_name,
             embedding_dim=embedding_dim,
+            shared_with=shared_with,
+            file_size=stat.st_size,
+            file_mtime_ns=stat.st_mtime_ns,
+            fields_version=FILTER_FIELDS_VERSION,
+            projection=self._projection_version(),
+            fields=doc.fields if shared_with else None,
         )
 
         all_status[str(doc.path)] = status.to_dict()
@@ -190,8 +617,41 @@ class Indexer:
 
     def _save_all_status(self, status: dict[str, Any]) -> None:
         """Save all status to file."""
-        self.status_file.parent.mkdir(parents=True, exist_ok=True)
-        self.status_file.write_text(json.dumps(status, indent=2))
+        # Replaced atomically so concurrent readers never see a partial file
+        write_text_atomic(self.status_file, json.dumps(status, indent=2))
+
+    def reassign_aliases(self, source_path: str, new_owner: str) -> None:
+        """Point paths sharing source_path's chunks at a new owner.
+
+        The new owner itself stops being an alias.
+
+        Args:
+            source_path: Path that currently owns the shared chunks
+            new_owner: Alias path that takes over the chunks
+        """
+        all_status = self._load_all_status()
+        for path, data in all_status.items():
+            if data.get("shared_with") == source_path:
+                if path == new_owner:
+                    data.pop("shared_with")
+                    data.pop("fields", None)
+                else:
+                    data["shared_with"] = new_owner
+        self._save_all_status(all_status)
+
+    def set_projection(self, version: str | None) -> None:
+        """Record that all stored vectors now use a projection version.
+
+        Args:
+            version: Projection version (None = unprojected)
+        """
+        all_status = self._load_all_status()
+        for data in all_status.values():
+            if version:
+                data["projection"] = version
+            else:
+                data.pop("projection", None)
+        self._save_all_status(all_status)
 
     def remove_status(self, source_path: str) -> None:
         """Remove embedding status for a document."""
@@ -213,15 +673,45 @@ class Indexer:
             List of document paths
         """
         if extensions is None:
-            extensions = [".md", ".txt", ".pdf", ".docx", ".html", ".htm"]
+            extensions = supported_extensions()
 
         if path.is_file():
             if path.suffix.lower() in extensions:
                 return [path]
             return []
 
+        # Single directory walk regardless of how many formats are registered.
+        # Hidden directories (.git, .ipynb_checkpoints, ...) hold copies and
+        # tool state, not conversations, and are not descended into.
+        wanted = set(extensions)
         documents = []
-        for ext in extensions:
-            documents.extend(path.rglob(f"*{ext}"))
+        for root, dirs, files in os.walk(path):
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            documents.extend(
+                Path(root) / name
+                for name in files
+                if Path(name).suffix.lower() in wanted
+            )
 
         return sorted(documents)
+
+
+def _date_to_int(value: str) -> int:
+    """Convert a YYYY-MM-DD prefix to an integer yyyymmdd."""
+    year, month, day = DATE_PATTERN.match(value).groups()
+    return int(f"{year}{month}{day}")
+
+
+def _parse_tags(value: Any) -> list[str]:
+    """Parse frontmatter tags given as "[a, b]", "a, b" or a list."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.strip().strip("[]").split(",")
+    tags = []
+    for tag in value:
+        tag = str(tag).strip().strip("'\"").lstrip("#").lower()
+        tag = re.sub(r"[^\w-]+", "_", tag)
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
@@ -0,0 +1,271 @@
+"""Local BM25 keyword index over chunk text.
+
+Vector search matches meaning but often misses exact identifiers: ticket IDs,
+function names, error codes. The lexical index keeps an SQLite FTS5 table of
+chunk terms next to the vector store (``<db_path>/lexical.sqlite3``), filled
+by the same embedding pass, and ranks matches with BM25.
+
+Identifiers are indexed whole and by their parts, so ``PROJ-1234`` matches
+``proj-1234``, ``proj`` and ``1234`` and ``getUserById`` also matches
+``user``. Whole-identifier matches are rarer and therefore score higher.
+"""
+
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable
+
+LEXICAL_FILE = "lexical.sqlite3"
+
+# Seconds to wait for a writer's transaction
+CONNECT_TIMEOUT = 30.0
+
+# Words, with identifiers joined by - . : / kept together
+_TOKEN = re.compile(r"\w+(?:[-.:/]\w+)*")
+# Parts of an identifier: camelCase humps, upper-case runs and numbers
+_PART = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+
+# Suffix of the side tables a rebuild fills before renaming them into place
+REBUILD_SUFFIX = "_rebuild"
+
+# FTS5 must keep the joined identifiers as single tokens
+_TABLES = """
+CREATE TABLE IF NOT EXISTS entries{suffix} (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT UNIQUE NOT NULL,
+    source_path TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS terms{suffix} USING fts5(
+    tokens, tokenize = "unicode61 remove_diacritics 0 tokenchars '-_.:/'"
+);
+"""
+_SCHEMA = _TABLES.format(suffix="") + (
+    "CREATE INDEX IF NOT EXISTS entries_source ON entries (source_path);\n"
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase terms, adding the parts of identifiers.
+
+    Args:
+        text: Chunk text or query
+
+    Returns:
+        Terms in order of appearance (identifiers followed by their parts)
+    """
+    terms = []
+    for match in _TOKEN.finditer(text):
+        token = match.group()
+        terms.append(token.lower())
+        parts = _PART.findall(token)
+        if len(parts) > 1:
+            terms.extend(part.lower() for part in parts)
+    return terms
+
+
+class LexicalIndex:
+    """BM25 index of chunk terms in an SQLite FTS5 table."""
+
+    def __init__(self, db_path: Path):
+        """Initialize index.
+
+        Args:
+            db_path: Directory of the vector store (the file is created there
+                on first write)
+        """
+        self.path = Path(db_path) / LEXICAL_FILE
+        self._connection: sqlite3.Connection | None = None
+        # Searches may run on worker threads next to vector searches
+        self._lock = threading.Lock()
+
+    @property
+    def exists(self) -> bool:
+        """Whether the index has been created."""
+        return self.path.exists()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path, timeout=CONNECT_TIMEOUT, check_same_thread=False
+            )
+            # Readers keep working while a writer holds a transaction
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def add(self, ids: list[str], source_paths: list[str], texts: list[str]) -> None:
+        """Index chunk texts, replacing entries with the same ids.
+
+        Args:
+            ids: Chunk ids
+            source_paths: Source path of each chunk
+            texts: Full chunk texts
+        """
+        if not ids:
+            return
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                self._insert(connection, ids, source_paths, texts)
+
+    @classmethod
+    def _insert(
+        cls,
+        connection: sqlite3.Connection,
+        ids: list[str],
+        source_paths: list[str],
+        texts: list[str],
+        suffix: str = "",
+    ) -> None:
+        """Index chunk texts in the live (or suffixed side) tables."""
+        cls._delete_ids(connection, ids, suffix)
+        for id_, source_path, text in zip(ids, source_paths, texts):
+            rowid = connection.execute(
+                f"INSERT INTO entries{suffix} (id, source_path) VALUES (?, ?)",
+                (id_, source_path),
+            ).lastrowid
+            connection.execute(
+                f"INSERT INTO terms{suffix} (rowid, tokens) VALUES (?, ?)",
+                (rowid, " ".join(tokenize(text))),
+            )
+
+    @staticmethod
+    def _delete_ids(connection: sqlite3.Connection, ids: list[str], suffix: str = "") -> None:
+        rowids = [
+            (row[0],)
+            for id_ in ids
+            for row in connection.execute(
+                f"SELECT rowid FROM entries{suffix} WHERE id = ?", (id_,)
+            )
+        ]
+        connection.executemany(f"DELETE FROM terms{suffix} WHERE rowid = ?", rowids)
+        connection.executemany(f"DELETE FROM entries{suffix} WHERE rowid = ?", rowids)
+
+    def rebuild(self, batches: Iterable[tuple[list[str], list[str], list[str]]]) -> int:
+        """Replace all entries with freshly indexed chunks.
+
+        The chunks are indexed into side tables that are renamed into place
+        in one transaction, so searches keep using the previous entries
+        until the rebuild is complete.
+
+        Args:
+            batches: Iterable of (ids, source paths, full texts) batches
+
+        Returns:
+            Number of chunks indexed
+        """
+        with self._lock:
+            connection = self._connect()
+            # Leftover of an interrupted rebuild
+            connection.execute(f"DROP TABLE IF EXISTS entries{REBUILD_SUFFIX}")
+            connection.execute(f"DROP TABLE IF EXISTS terms{REBUILD_SUFFIX}")
+            connection.executescript(_TABLES.format(suffix=REBUILD_SUFFIX))
+
+        indexed = 0
+        for ids, source_paths, texts in batches:
+            with self._lock:
+                connection = self._connect()
+                with connection:
+                    self._insert(connection, ids, source_paths, texts, REBUILD_SUFFIX)
+            indexed += len(ids)
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.execute("DROP TABLE entries")
+                connection.execute("DROP TABLE terms")
+                connection.execute(f"ALTER TABLE entries{REBUILD_SUFFIX} RENAME TO entries")
+                connection.execute(f"ALTER TABLE terms{REBUILD_SUFFIX} RENAME TO terms")
+                connection.execute("CREATE INDEX entries_source ON entries (source_path)")
+        return indexed
+
+    def delete(self, ids: list[str]) -> None:
+        """Remove chunks by id."""
+        if not ids or not self.exists:
+            return
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                self._delete_ids(connection, ids)
+
+    def rename_source(self, source_path: str, new_source_path: str) -> None:
+        """Move a source's chunks to another path (see VectorStore.reassign_source).
+
+        Chunk ids ``<source_path>::<index>`` are renamed to match.
+        """
+        if not self.exists:
+            return
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "DELETE FROM terms WHERE rowid IN "
+                    "(SELECT rowid FROM entries WHERE source_path = ?)",
+                    (new_source_path,),
+                )
+                connection.execute(
+                    "DELETE FROM entries WHERE source_path = ?", (new_source_path,)
+                )
+                connection.execute(
+                    "UPDATE entries SET id = ? || substr(id, ?), source_path = ? "
+                    "WHERE source_path = ?",
+                    (new_source_path, len(source_path) + 1, new_source_path, source_path),
+                )
+
+    def search(self, query: str, limit: int) -> list[tuple[str, float]]:
+        """Rank chunks by BM25 relevance to a query.
+
+        Args:
+            query: Query text
+            limit: Maximum number of results
+
+        Returns:
+            List of (chunk id, BM25 score), best first (empty without a
+            matching term)
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self.exists:
+            return []
+        match = " OR ".join(f'"{term}"' for term in terms)
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT entries.id, bm25(terms) FROM terms "
+                "JOIN entries ON entries.rowid = terms.rowid "
+                "WHERE terms MATCH ? ORDER BY bm25(terms) LIMIT ?",
+                (match, limit),
+            ).fetchall()
+        # FTS5 reports BM25 negated (lower is better)
+        return [(id_, -score) for id_, score in rows]
+
+    def count(self) -> int:
+        """Number of indexed chunks."""
+        if not self.exists:
+            return 0
+        with self._lock:
+            return self._connect().execute("SELECT count(*) FROM entries").fetchone()[0]
+
+    def optimize(self) -> None:
+        """Merge the index's b-trees and reclaim free pages."""
+        if not self.exists:
+            return
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("INSERT INTO terms (terms) VALUES ('optimize')")
+            connection.execute("VACUUM")
+            # Fold the write-ahead log back into the database file
+            connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        if not self.exists:
+            return
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM terms")
+                connection.execute("DELETE FROM entries")
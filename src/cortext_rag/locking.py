@@ -0,0 +1,194 @@
+"""Cross-process coordination for writes to the embedding store.
+
+Hooks, MCP servers and manual ``cortext embed`` runs may all write to the
+same workspace. Writers take a workspace-level lease (an advisory lock on
+``.workspace/embeddings/write.lock``). A writer that finds the lease taken
+can append its paths to a queue file instead; the lease holder drains the
+queue before releasing, so handed-off work is never lost. Readers never take
+the lease: status and manifest files are replaced atomically.
+"""
+
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Seconds between attempts while waiting for the lease
+POLL_INTERVAL = 0.1
+
+
+class LeaseTimeout(Exception):
+    """Raised when the write lease could not be acquired in time."""
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """Write a file so readers see either the old or the new content."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    tmp_path.write_text(text)
+    os.replace(tmp_path, path)
+
+
+def _try_lock(fd: int) -> bool:
+    """Take an exclusive lock on a file without waiting."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _lock(fd: int) -> None:
+    """Take an exclusive lock on a file, waiting as long as needed."""
+    while not _try_lock(fd):
+        time.sleep(POLL_INTERVAL / 10)
+
+
+def _unlock(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+class WriteLease:
+    """Workspace-level single-writer lease with a hand-off queue.
+
+    Example:
+        lease = WriteLease(workspace_path)
+        if lease.acquire(handoff=paths):
+            try:
+                for batch in lease.batches(paths):
+                    ...  # write
+            finally:
+                lease.release()
+    """
+
+    def __init__(self, workspace_path: Path, timeout: float = 30.0):
+        """Initialize lease.
+
+        Args:
+            workspace_path: Path to workspace root
+            timeout: Seconds to wait in acquire() when not handing off
+        """
+        embeddings_dir = Path(workspace_path) / ".workspace" / "embeddings"
+        self.lock_file = embeddings_dir / "write.lock"
+        self.queue_file = embeddings_dir / "queue"
+        self.queue_lock_file = embeddings_dir / "queue.lock"
+        self.timeout = timeout
+        self._fd: int | None = None
+
+    @property
+    def held(self) -> bool:
+        """Whether this instance holds the lease."""
+        return self._fd is not None
+
+    def _open(self, path: Path) -> int:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    @contextmanager
+    def _queue_locked(self) -> Iterator[None]:
+        """Serialize access to the queue file."""
+        fd = self._open(self.queue_lock_file)
+        _lock(fd)
+        try:
+            yield
+        finally:
+            _unlock(fd)
+            os.close(fd)
+
+    def _try_acquire(self) -> bool:
+        fd = self._open(self.lock_file)
+        if _try_lock(fd):
+            self._fd = fd
+            return True
+        os.close(fd)
+        return False
+
+    def acquire(self, handoff: list[str] = None) -> bool:
+        """Take the write lease.
+
+        Args:
+            handoff: Paths to queue for the current holder if the lease is
+                taken. Without them, waits up to the timeout instead.
+
+        Returns:
+            True if the lease is now held, False if the paths were queued
+
+        Raises:
+            LeaseTimeout: If waiting without handoff paths timed out
+        """
+        if self.held:
+            return True
+
+        deadline = time.monotonic() + self.timeout
+        while True:
+            # Checked under the queue lock so the holder cannot release
+            # between our attempt and the enqueue
+            with self._queue_locked():
+                if self._try_acquire():
+                    return True
+                if handoff:
+                    with self.queue_file.open("a", encoding="utf-8") as f:
+                        f.writelines(f"{path}\n" for path in handoff)
+                    return False
+
+            if time.monotonic() >= deadline:
+                raise LeaseTimeout(
+                    f"Another process is writing to the embedding store "
+                    f"(waited {self.timeout:g}s for {self.lock_file})"
+                )
+            time.sleep(POLL_INTERVAL)
+
+    def _drain_queue(self) -> list[str]:
+        """Take all queued paths (caller holds the queue lock)."""
+        try:
+            lines = self.queue_file.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return []
+        self.queue_file.unlink()
+        return list(dict.fromkeys(line for line in lines if line))
+
+    def batches(self, paths: list[str]) -> Iterator[list[str]]:
+        """Yield the holder's paths, then paths queued by other writers.
+
+        The lease is released once the queue is empty.
+
+        Args:
+            paths: Paths the holder came to write
+
+        Yields:
+            Lists of paths to process
+        """
+        with self._queue_locked():
+            pending = list(dict.fromkeys([*paths, *self._drain_queue()]))
+
+        while pending:
+            yield pending
+            with self._queue_locked():
+                pending = self._drain_queue()
+                if not pending:
+                    # Released under the queue lock: later writers either get
+                    # the lease or see it held and queue for us
+                    self.release()
+
+    def release(self) -> None:
+        """Release the lease if held."""
+        if self._fd is None:
+            return
+        _unlock(self._fd)
+        os.close(self._fd)
+        self._fd = None
@@ -0,0 +1,220 @@
+"""Store compaction and integrity checks.
+
+Re-embedding deletes and re-adds chunks, which leaves dead weight behind:
+tombstones in Chroma's HNSW graphs and free pages in its SQLite file, or
+deleted rows in NumPy segments. Compaction rebuilds every collection from its
+live vectors, vacuums the files, and measures disk usage and query latency
+before and after. The integrity check compares the store against the
+embedding status records that drive change detection.
+"""
+
+import statistics
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .indexer import Indexer
+from .store import VectorStore
+
+# Stored vectors replayed as queries when measuring search latency
+LATENCY_PROBES = 20
+LATENCY_RESULTS = 10
+
+
+@dataclass
+class IntegrityReport:
+    """Differences between the vector store and the embedding status records."""
+
+    # Embedded according to status, but no chunks in the store
+    missing: list[str] = field(default_factory=list)
+    # Stored chunk count differs from the status record
+    mismatched: list[dict[str, Any]] = field(default_factory=list)
+    # Chunks stored for paths without a status record of their own
+    orphaned: list[str] = field(default_factory=list)
+    # Deduplicated paths whose owner is no longer embedded
+    dangling: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Whether store and status records agree."""
+        return not (self.missing or self.mismatched or self.orphaned or self.dangling)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON output."""
+        return {
+            "ok": self.ok,
+            "missing": self.missing,
+            "mismatched": self.mismatched,
+            "orphaned": self.orphaned,
+            "dangling": self.dangling,
+        }
+
+
+@dataclass
+class CompactionReport:
+    """Outcome of a compaction run."""
+
+    chunks: int
+    seconds: float
+    size_before: int
+    size_after: int
+    # Median search latency in milliseconds (None for an empty store)
+    latency_before_ms: float | None
+    latency_after_ms: float | None
+    integrity: IntegrityReport
+    # Whether the integrity problems were repaired
+    repaired: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON output."""
+        return {
+            "chunks": self.chunks,
+            "seconds": round(self.seconds, 2),
+            "size_before": self.size_before,
+            "size_after": self.size_after,
+            "latency_before_ms": _round(self.latency_before_ms),
+            "latency_after_ms": _round(self.latency_after_ms),
+            "integrity": self.integrity.to_dict(),
+            "repaired": self.repaired,
+        }
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(value, 2)
+
+
+def disk_usage(path: Path) -> int:
+    """Total size in bytes of the files under a directory."""
+    path = Path(path)
+    if not path.exists():
+        return 0
+    total = 0
+    for child in path.rglob("*"):
+        try:
+            if child.is_file():
+                total += child.stat().st_size
+        except FileNotFoundError:
+            # Removed by a concurrent writer while walking
+            continue
+    return total
+
+
+def measure_latency(store: VectorStore, probes: list[list[float]]) -> float | None:
+    """Median search latency in milliseconds over probe query vectors.
+
+    One untimed query runs first, so index loading is not counted.
+
+    Args:
+        store: Vector store to search
+        probes: Query vectors
+
+    Returns:
+        Median latency, or None without probes
+    """
+    if not probes:
+        return None
+
+    store.search(probes[0], n_results=LATENCY_RESULTS)
+    timings = []
+    for probe in probes:
+        start = time.perf_counter()
+        store.search(probe, n_results=LATENCY_RESULTS)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def check_integrity(indexer: Indexer, store: VectorStore) -> IntegrityReport:
+    """Compare stored chunks with the embedding status records.
+
+    Args:
+        indexer: Indexer holding the status records
+        store: Vector store to check
+
+    Returns:
+        IntegrityReport listing the paths that disagree
+    """
+    all_status = indexer.get_all_status()
+    counts = store.source_counts()
+    report = IntegrityReport()
+
+    for path, status in sorted(all_status.items()):
+        if status.shared_with:
+            owner = all_status.get(status.shared_with)
+            if owner is None or owner.shared_with or not counts.get(status.shared_with):
+                report.dangling.append(path)
+            continue
+
+        stored = counts.get(path, 0)
+        if status.num_chunks and not stored:
+            report.missing.append(path)
+        elif stored != status.num_chunks:
+            report.mismatched.append(
+                {"path": path, "expected": status.num_chunks, "stored": stored}
+            )
+
+    report.orphaned = sorted(
+        path
+        for path in counts
+        if path not in all_status or all_status[path].shared_with
+    )
+    return report
+
+
+def repair(report: IntegrityReport, indexer: Indexer, store: VectorStore) -> None:
+    """Bring store and status records back in line.
+
+    Orphaned and incomplete chunks are deleted, and the status records of
+    missing, incomplete and dangling paths are dropped so the next
+    ``cortext embed`` run embeds them again.
+
+    Args:
+        report: Result of check_integrity()
+        indexer: Indexer holding the status records
+        store: Vector store to repair
+    """
+    mismatched = [item["path"] for item in report.mismatched]
+    for path in [*mismatched, *report.orphaned]:
+        store.delete_by_source(path)
+    for path in [*report.missing, *mismatched, *report.dangling]:
+        indexer.remove_status(path)
+
+
+def compact(
+    store: VectorStore, indexer: Indexer, repair_integrity: bool = False
+) -> CompactionReport:
+    """Compact the store and check it against the status records.
+
+    The caller must hold the workspace write lease.
+
+    Args:
+        store: Vector store to compact
+        indexer: Indexer holding the status records
+        repair_integrity: Repair any differences found (see repair())
+
+    Returns:
+        CompactionReport with sizes, latencies and integrity results
+    """
+    probes = store.sample_embeddings(LATENCY_PROBES)
+    size_before = disk_usage(store.db_path)
+    latency_before = measure_latency(store, probes)
+
+    start = time.perf_counter()
+    chunks = store.compact()
+    seconds = time.perf_counter() - start
+
+    integrity = check_integrity(indexer, store)
+    repaired = repair_integrity and not integrity.ok
+    if repaired:
+        repair(integrity, indexer, store)
+
+    return CompactionReport(
+        chunks=chunks,
+        seconds=seconds,
+        size_before=size_before,
+        size_after=disk_usage(store.db_path),
+        latency_before_ms=latency_before,
+        latency_after_ms=measure_latency(store, probes),
+        integrity=integrity,
+        repaired=repaired,
+    )
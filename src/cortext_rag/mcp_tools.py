@@ -3,14 +3,43 @@
 These functions expose RAG capabilities for AI agents.
 """
 
+import time
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+import numpy as np
 
 from .embedder import Embedder
 from .indexer import Indexer
-from .retriever import Retriever
+from .locking import WriteLease
+from .maintenance import compact as _compact
+from .planner import conversation_dirs as _conversation_dirs
+from .planner import plan_path as _plan_path
+from .planner import record_throughput
+from .projection import (
+    FIT_SAMPLE,
+    PROJECTION_METHODS,
+    Projection,
+    fit_pca,
+    fit_random,
+    projection_info,
+    recall_at_k,
+    split_holdout,
+)
+from .retriever import Retriever, fuse_rankings
 from .store import VectorStore
 
+# Chunks embedded per batch when streaming large documents
+STREAM_BATCH_SIZE = 64
+
+
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    """Yield successive lists of at most size items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
 
 def embed_document(
     path: str, workspace_path: str = None
@@ -33,51 +62,216 @@ def embed_document(
     if not doc_path.exists():
         return {"error": f"Path not found: {doc_path}"}
 
-    embedder = Embedder()
     indexer = Indexer(ws_path)
-    store = VectorStore(ws_path)
-
-    embedded_count = 0
-    skipped_count = 0
-    errors = []
+    lease = WriteLease(ws_path, timeout=indexer.config.lease_timeout)
+    if not lease.acquire(handoff=[str(doc_path)]):
+        # Another writer is running and will embed these paths before it exits
+        return {
+            "success": True,
+            "queued": True,
+            "embedded": 0,
+            "skipped": 0,
+            "shared": 0,
+            "total_files": 0,
+            "errors": None,
+        }
 
-    # Find documents to embed
-    documents = indexer.find_documents(doc_path)
+    try:
+        return _embed_held(lease, [str(doc_path)], ws_path, indexer=indexer)
+    finally:
+        lease.release()
 
-    for doc_file in documents:
-        try:
-            doc = indexer.parse_document(doc_file)
 
-            if not indexer.needs_embedding(doc):
-                skipped_count += 1
-                continue
+def _embed_held(
+    lease: WriteLease,
+    paths: list[str],
+    ws_path: Path,
+    indexer: Indexer = None,
+    store: VectorStore = None,
+) -> dict[str, Any]:
+    """Embed paths, then any handed off by other writers, under a held lease.
 
-            # Generate embeddings
-            chunk_texts = [chunk.text for chunk in doc.chunks]
-            embeddings = embedder.embed(chunk_texts)
+    Args:
+        lease: Write lease held by the caller (released once the queue is empty)
+        paths: Files or directories the caller came to embed
+        ws_path: Workspace root path
+        indexer: Indexer to reuse (created if omitted)
+        store: Vector store to reuse (created if omitted)
 
-            # Store in vector DB (UPSERT)
-            store.update_chunks(doc.chunks, embeddings, str(doc_file))
+    Returns:
+        Dictionary with embedding results
+    """
+    embedder = Embedder()
+    indexer = indexer or Indexer(ws_path)
+    store = store or VectorStore(ws_path)
+    projection = Projection.load(ws_path)
 
-            # Update status
-            indexer.update_status(
-                doc, embedder.model_name, embedder.embedding_dim
-            )
+    embedded_count = 0
+    skipped_count = 0
+    shared_count = 0
+    errors = []
+    chunks_embedded = 0
+    inference_seconds = 0.0
+
+    documents: list[Path] = []
+    seen: set[Path] = set()
+    # Our paths first, then any handed off by writers that arrived later
+    for queued_paths in lease.batches(paths):
+        batch_documents = [
+            doc_file
+            for queued_path in queued_paths
+            for doc_file in indexer.find_documents(Path(queued_path))
+            if doc_file not in seen
+        ]
+        seen.update(batch_documents)
+        documents.extend(batch_documents)
+
+        for doc_file in batch_documents:
+            try:
+                outcome, chunks, seconds = _embed_file(
+                    doc_file, embedder, indexer, store, projection
+                )
+            except Exception as e:
+                errors.append(f"{doc_file}: {str(e)}")
+                continue
 
-            embedded_count += 1
+            inference_seconds += seconds
+            if outcome == "embedded":
+                embedded_count += 1
+                chunks_embedded += chunks
+            elif outcome == "shared":
+                shared_count += 1
+            else:
+                skipped_count += 1
 
-        except Exception as e:
-            errors.append(f"{doc_file}: {str(e)}")
+    # Model loading is counted separately from steady-state throughput
+    load_seconds = getattr(embedder, "load_seconds", None)
+    if load_seconds:
+        inference_seconds -= load_seconds
+    record_throughput(ws_path, chunks_embedded, inference_seconds, load_seconds)
 
     return {
         "success": True,
         "embedded": embedded_count,
         "skipped": skipped_count,
+        "shared": shared_count,
         "total_files": len(documents),
         "errors": errors if errors else None,
     }
 
 
+def _embed_file(
+    doc_file: Path,
+    embedder: Embedder,
+    indexer: Indexer,
+    store: VectorStore,
+    projection: Projection = None,
+) -> tuple[str, int, float]:
+    """Embed one document if it changed.
+
+    With a projection applied, embeddings are projected before storing.
+
+    Returns:
+        Tuple of (outcome, chunks embedded, inference seconds); outcome is
+        "embedded", "shared" or "skipped"
+    """
+    # Untouched since last embedding: skip without parsing
+    if indexer.is_unchanged_on_disk(doc_file):
+        return "skipped", 0, 0.0
+
+    doc = indexer.parse_document(doc_file)
+
+    if not indexer.needs_embedding(doc):
+        status = indexer.get_status(str(doc_file))
+        if indexer.fields_outdated(status):
+            # Stored before filter fields existed: update them in place
+            if not status.shared_with:
+                store.set_source_fields(str(doc_file), doc.fields)
+            indexer.update_status(
+                doc,
+                status.model_name,
+                status.embedding_dim,
+                shared_with=status.shared_with,
+            )
+        return "skipped", 0, 0.0
+
+    # Paths reusing this file's chunks still hold the old content
+    _hand_off_shared_chunks(indexer, store, str(doc_file))
+
+    shared_with = indexer.find_shared(doc)
+    if shared_with:
+        # Identical content is already embedded: reference its chunks
+        owner = indexer.get_status(shared_with)
+        store.delete_by_source(str(doc_file))
+        indexer.update_status(
+            doc, owner.model_name, owner.embedding_dim, shared_with=shared_with
+        )
+        return "shared", 0, 0.0
+
+    inference_seconds = 0.0
+    if doc.is_streamed:
+        # Large file: embed and store chunks batch by batch
+        store.delete_by_source(str(doc_file))
+        for batch in _batched(indexer.iter_chunks(doc), STREAM_BATCH_SIZE):
+            start = time.perf_counter()
+            embeddings = embedder.embed([chunk.text for chunk in batch])
+            inference_seconds += time.perf_counter() - start
+            if projection is not None:
+                embeddings = projection.apply(embeddings).tolist()
+            store.add_chunks(batch, embeddings, str(doc_file))
+    else:
+        # Generate embeddings
+        chunk_texts = [chunk.text for chunk in doc.chunks]
+        start = time.perf_counter()
+        embeddings = embedder.embed(chunk_texts)
+        inference_seconds += time.perf_counter() - start
+        if projection is not None:
+            embeddings = projection.apply(embeddings).tolist()
+
+        # Store in vector DB (UPSERT)
+        store.update_chunks(doc.chunks, embeddings, str(doc_file))
+
+    # Update status
+    indexer.update_status(doc, embedder.model_name, embedder.embedding_dim)
+    return "embedded", doc.num_chunks, inference_seconds
+
+
+def _hand_off_shared_chunks(
+    indexer: Indexer, store: VectorStore, source_path: str
+) -> None:
+    """Give a path's stored chunks to the first path sharing them.
+
+    Called before the path is re-embedded with new content, so identical
+    copies elsewhere keep their vectors without another inference pass.
+    """
+    aliases = indexer.get_aliases().get(source_path)
+    if not aliases:
+        return
+
+    new_owner = aliases[0]
+    fields = indexer.parse_document(Path(new_owner)).fields
+    store.reassign_source(source_path, new_owner, fields=fields)
+    indexer.reassign_aliases(source_path, new_owner)
+
+
+def plan_embedding(
+    path: str = None, workspace_path: str = None
+) -> dict[str, Any]:
+    """Compute what an embedding run would do, without running it.
+
+    Uses file stats and content hashes only; the embedding model is not
+    loaded and the vector store is not opened.
+
+    Args:
+        path: Path to file or directory (default: whole workspace)
+        workspace_path: Optional workspace root path
+
+    Returns:
+        Dictionary with the change set and cost estimates
+    """
+    return _plan_path(path, workspace_path)
+
+
 def embed_workspace(workspace_path: str = None) -> dict[str, Any]:
     """Embed all unembedded content in workspace.
 
@@ -90,27 +284,23 @@ def embed_workspace(workspace_path: str = None) -> dict[str, Any]:
     ws_path = Path(workspace_path) if workspace_path else Path.cwd()
 
     # Get all conversation type directories
-    registry_path = ws_path / ".workspace" / "registry.json"
-    if not registry_path.exists():
+    type_dirs = _conversation_dirs(ws_path)
+    if type_dirs is None:
         return {"error": "Not a valid Cortext workspace (no registry.json)"}
 
-    import json
-
-    registry = json.loads(registry_path.read_text())
-    conversation_types = registry.get("conversation_types", {})
-
     total_embedded = 0
     total_skipped = 0
+    total_shared = 0
+    queued = False
     all_errors = []
 
-    for type_name, config in conversation_types.items():
-        folder = config.get("folder", type_name)
-        type_dir = ws_path / folder
-
+    for type_dir in type_dirs:
         if type_dir.exists():
             result = embed_document(str(type_dir), str(ws_path))
             total_embedded += result.get("embedded", 0)
             total_skipped += result.get("skipped", 0)
+            total_shared += result.get("shared", 0)
+            queued = queued or result.get("queued", False)
             if result.get("errors"):
                 all_errors.extend(result["errors"])
 
@@ -118,6 +308,8 @@ def embed_workspace(workspace_path: str = None) -> dict[str, Any]:
         "success": True,
         "embedded": total_embedded,
         "skipped": total_skipped,
+        "shared": total_shared,
+        "queued": queued,
         "errors": all_errors if all_errors else None,
     }
 
@@ -128,6 +320,15 @@ def search_semantic(
     n_results: int = 10,
     conversation_type: str = None,
     date_range: str = None,
+    date_from: str = None,
+    date_to: str = None,
+    mode: str = "semantic",
+    group_by: str = None,
+    aggregate: str = "max",
+    rerank: bool = None,
+    diversity: float = 0.0,
+    timeout_ms: int = None,
+    expand: int = 0,
 ) -> dict[str, Any]:
     """Semantic search across workspace.
 
@@ -136,7 +337,23 @@ def search_semantic(
         workspace_path: Optional workspace root path
         n_results: Maximum number of results
         conversation_type: Filter by type (e.g., "brainstorm")
-        date_range: Filter by date (YYYY-MM or YYYY-MM-DD)
+        date_range: Filter by date (YYYY, YYYY-MM or YYYY-MM-DD)
+        date_from: Only conversations on or after this date
+        date_to: Only conversations on or before this date
+        mode: "semantic", or "hybrid" to fuse with BM25 keyword matches
+            (finds exact identifiers such as ticket IDs and error codes)
+        group_by: "document" to return distinct documents with their best
+            chunks instead of raw chunk hits
+        aggregate: Document score when grouping: "max" or "softmax"
+        rerank: Reorder results with the local cross-encoder (default: the
+            workspace's rerank setting)
+        diversity: 0 to 1; higher trades relevance for results that cover
+            different content (maximal marginal relevance)
+        timeout_ms: Deadline; when it passes, BM25 keyword matches are
+            returned with ``degraded`` set while the search finishes in
+            the background
+        expand: Also return each hit merged with up to this many chunks
+            before and after it (``context``)
 
     Returns:
         Dictionary with search results
@@ -150,11 +367,22 @@ def search_semantic(
             n_results=n_results,
             conversation_type=conversation_type,
             date_range=date_range,
+            date_from=date_from,
+            date_to=date_to,
+            mode=mode,
+            group_by=group_by,
+            aggregate=aggregate,
+            rerank=rerank,
+            diversity=diversity,
+            timeout_ms=timeout_ms,
+            expand=expand,
         )
 
         return {
             "success": True,
             "query": query,
+            "mode": mode,
+            "degraded": retriever.degraded,
             "num_results": len(results),
             "results": retriever.format_results_json(results),
         }
@@ -163,6 +391,71 @@ def search_semantic(
         return {"error": str(e)}
 
 
+def search_many(
+    queries: list[str],
+    workspace_path: str = None,
+    n_results: int = 10,
+    conversation_type: str = None,
+    date_range: str = None,
+    date_from: str = None,
+    date_to: str = None,
+    fuse: bool = False,
+    timeout_ms: int = None,
+) -> dict[str, Any]:
+    """Semantic search for several queries in one round-trip.
+
+    Args:
+        queries: Search query texts (e.g. phrasings or aspects of a task)
+        workspace_path: Optional workspace root path
+        n_results: Maximum number of results per query
+        conversation_type: Filter by type (e.g., "brainstorm")
+        date_range: Filter by date (YYYY, YYYY-MM or YYYY-MM-DD)
+        date_from: Only conversations on or after this date
+        date_to: Only conversations on or before this date
+        fuse: Also merge the rankings into one with reciprocal rank fusion
+        timeout_ms: Deadline; when it passes, each query's BM25 keyword
+            matches are returned with ``degraded`` set while the search
+            finishes in the background
+
+    Returns:
+        Dictionary with results per query (and the fused ranking)
+    """
+    ws_path = Path(workspace_path) if workspace_path else Path.cwd()
+    retriever = Retriever(ws_path)
+
+    try:
+        rankings = retriever.search_many(
+            queries=queries,
+            n_results=n_results,
+            conversation_type=conversation_type,
+            date_range=date_range,
+            date_from=date_from,
+            date_to=date_to,
+            timeout_ms=timeout_ms,
+        )
+
+        response = {
+            "success": True,
+            "degraded": retriever.degraded,
+            "results": [
+                {
+                    "query": query,
+                    "num_results": len(results),
+                    "results": retriever.format_results_json(results),
+                }
+                for query, results in zip(queries, rankings)
+            ],
+        }
+        if fuse:
+            response["fused"] = retriever.format_results_json(
+                fuse_rankings(rankings, n_results)
+            )
+        return response
+
+    except Exception as e:
+        return {"error": str(e)}
+
+
 def get_similar(
     source_path: str, workspace_path: str = None, n_results: int = 5
 ) -> dict[str, Any]:
@@ -231,5 +524,322 @@ def get_embedding_status(workspace_path: str = None) -> dict[str, Any]:
         "total_chunks": store_stats["total_chunks"],
         "num_documents": store_stats["num_documents"],
         "db_path": store_stats["db_path"],
+        "backend": store_stats["backend"],
+        "distance": store_stats["distance"],
+        "needs_reindex": store_stats["needs_reindex"],
+        "shards": store_stats.get("shards"),
+        "tiers": store_stats.get("tiers"),
+        "ann": store_stats.get("ann"),
+        "lexical_chunks": store_stats["lexical_chunks"],
+        "document_vectors": store_stats["document_vectors"],
+        "projection": projection_info(ws_path),
         "recent_embeddings": recent_embeddings,
     }
+
+
+def reindex_store(
+    workspace_path: str = None, conversation_type: str = None
+) -> dict[str, Any]:
+    """Rebuild the vector index with the workspace's current settings.
+
+    Args:
+        workspace_path: Optional workspace root path
+        conversation_type: Only rebuild this type's shard (sharded stores)
+
+    Returns:
+        Dictionary with the number of reindexed chunks
+    """
+    ws_path = Path(workspace_path) if workspace_path else Path.cwd()
+
+    store = VectorStore(ws_path)
+    lease = WriteLease(ws_path, timeout=store.config.lease_timeout)
+    try:
+        lease.acquire()
+        start = time.perf_counter()
+        reindexed = store.reindex(conversation_type)
+        seconds = time.perf_counter() - start
+
+        # Embed paths other writers handed off while we held the lease
+        _embed_held(lease, [], ws_path, store=store)
+
+        return {
+            "success": True,
+            "reindexed": reindexed,
+            "backend": store.config.backend,
+            "distance": store.get_stats()["distance"],
+            "seconds": round(seconds, 2),
+        }
+
+    except Exception as e:
+        return {"error": str(e)}
+
+    finally:
+        lease.release()
+
+
+def build_ann_index(
+    workspace_path: str = None,
+    conversation_type: str = None,
+    stale_only: bool = False,
+) -> dict[str, Any]:
+    """Train the IVF approximate search index of the store's shards.
+
+    Args:
+        workspace_path: Optional workspace root path
+        conversation_type: Only train this type's shard (sharded stores)
+        stale_only: Only train large shards whose index is missing or drifted
+
+    Returns:
+        Dictionary with the number of vectors indexed per collection
+    """
+    ws_path = Path(workspace_path) if workspace_path else Path.cwd()
+
+    store = VectorStore(ws_path)
+    lease = WriteLease(ws_path, timeout=store.config.lease_timeout)
+    try:
+        lease.acquire()
+        start = time.perf_counter()
+        built = store.build_ann(conversation_type, stale_only=stale_only)
+        seconds = time.perf_counter() - start
+
+        # Embed paths other writers handed off while we held the lease
+        _embed_held(lease, [], ws_path, store=store)
+
+        return {
+            "success": True,
+            "built": built,
+            "threshold": store.config.ann_threshold,
+            "seconds": round(seconds, 2),
+        }
+
+    except Exception as e:
+        return {"error": str(e)}
+
+    finally:
+        lease.release()
+
+
+def archive_conversation(path: str, workspace_path: str = None) -> dict[str, Any]:
+    """Move an archived conversation to the store's cold tier.
+
+    Args:
+        path: Path to the conversation directory or document
+        workspace_path: Optional workspace root path
+
+    Returns:
+        Dictionary with the number of archived documents
+    """
+    ws_path = Path(workspace_path) if workspace_path else Path.cwd()
+    doc_path = Path(path)
+
+    if not doc_path.is_absolute():
+        doc_path = ws_path / doc_path
+
+    store = VectorStore(ws_path)
+    lease = WriteLease(ws_path, timeout=store.config.lease_timeout)
+    try:
+        lease.acquire()
+        archived = store.archive(str(doc_path))
+
+        # Embed paths other writers handed off while we held the lease
+        _embed_held(lease, [], ws_path, store=store)
+
+        return {
+            "success": True,
+            "archived": archived,
+            "tiering": store.config.tiering,
+        }
+
+    except Exception as e:
+        return {"error": str(e)}
+
+    finally:
+        lease.release()
+
+
+def retier_store(workspace_path: str = None) -> dict[str, Any]:
+    """Move stored chunks between the hot and cold tiers.
+
+    Args:
+        workspace_path: Optional workspace root path
+
+    Returns:
+        Dictionary with the number of moved chunks and the tier sizes
+    """
+    ws_path = Path(workspace_path) if workspace_path else Path.cwd()
+
+    store = VectorStore(ws_path)
+    lease = WriteLease(ws_path, timeout=store.config.lease_timeout)
+    try:
+        lease.acquire()
+        start = time.perf_counter()
+        moved = store.retier()
+        seconds = time.perf_counter() - start
+
+        # Embed paths other writers handed off while we held the lease
+        _embed_held(lease, [], ws_path, store=store)
+
+        return {
+            "success": True,
+            "moved": moved,
+            "tiers": store.get_stats().get("tiers"),
+            "seconds": round(seconds, 2),
+        }
+
+    except Exception as e:
+        return {"error": str(e)}
+
+    finally:
+        lease.release()
+
+
+def compact_store(workspace_path: str = None, repair: bool = False) -> dict[str, Any]:
+    """Compact the vector store and check it against the status records.
+
+    Rebuilds every collection from its live vectors, vacuums the database
+    and reports disk usage and search latency before and after. Readers keep
+    working throughout: rebuilt collections are swapped in atomically.
+
+    Args:
+        workspace_path: Optional workspace root path
+        repair: Fix differences between the store and the status records
+
+    Returns:
+        Dictionary with the compaction report
+    """
+    ws_path = Path(workspace_path) if workspace_path else Path.cwd()
+
+    indexer = Indexer(ws_path)
+    store = VectorStore(ws_path, config=indexer.config)
+    lease = WriteLease(ws_path, timeout=store.config.lease_timeout)
+    try:
+        lease.acquire()
+        report = _compact(store, indexer, repair_integrity=repair)
+
+        # Embed paths other writers handed off while we held the lease
+        _embed_held(lease, [], ws_path, indexer=indexer, store=store)
+
+        return {
+            "success": True,
+            "backend": store.config.backend,
+            **report.to_dict(),
+        }
+
+    except Exception as e:
+        return {"error": str(e)}
+
+    finally:
+        lease.release()
+
+
+def project_store(
+    workspace_path: str = None,
+    dim: int = None,
+    method: str = "pca",
+    dry_run: bool = False,
+    remove: bool = False,
+) -> dict[str, Any]:
+    """Fit a dimensionality-reducing projection and apply it to the store.
+
+    The projection is fitted on a random sample of the stored vectors drawn
+    across all shards, and its recall@k against unprojected search is
+    measured on rows of the sample held out of the fit.
+    Applying it rewrites every stored vector without re-embedding; later
+    embedding runs and searches project their vectors too. Projecting an
+    already projected store reduces it further.
+
+    Args:
+        workspace_path: Optional workspace root path
+        dim: Dimension of the projected vectors
+        method: "pca" or "random"
+        dry_run: Only measure the recall impact
+        remove: Drop the projection; clears the store, so the workspace
+            must be embedded again
+
+    Returns:
+        Dictionary with dimensions, recall and the number of chunks rewritten
+    """
+    ws_path = Path(workspace_path) if workspace_path else Path.cwd()
+
+    indexer = Indexer(ws_path)
+    store = VectorStore(ws_path, config=indexer.config)
+    current = Projection.load(ws_path)
+
+    if remove:
+        if current is None:
+            return {"error": "No projection is applied"}
+    elif method not in PROJECTION_METHODS:
+        return {
+            "error": f"Invalid projection method: {method}. "
+            f"Supported: {', '.join(PROJECTION_METHODS)}"
+        }
+
+    lease = WriteLease(ws_path, timeout=store.config.lease_timeout)
+    try:
+        lease.acquire()
+
+        if remove:
+            Projection.remove(ws_path)
+            store.clear()
+            # Status records still name the old version: all get re-embedded
+            _embed_held(lease, [], ws_path, indexer=indexer, store=store)
+            return {"success": True, "removed": current.version}
+
+        sample = np.asarray(store.sample_embeddings(FIT_SAMPLE), dtype=np.float32)
+        if sample.size == 0:
+            return {"error": "No embeddings found. Run `cortext embed --all` first."}
+        source_dim = sample.shape[1]
+        if not dim or not 0 < dim < source_dim:
+            return {
+                "error": f"Dimension must be between 1 and {source_dim - 1} "
+                f"(stored vectors have {source_dim})"
+            }
+
+        fit_rows, held_out = split_holdout(sample)
+        if method == "pca":
+            matrix = fit_pca(fit_rows, dim)
+        else:
+            matrix = fit_random(source_dim, dim)
+        recall = recall_at_k(held_out, matrix)
+
+        report = {
+            "success": True,
+            "method": method,
+            "source_dim": current.source_dim if current else source_dim,
+            "stored_dim": source_dim,
+            "dim": dim,
+            "recall": None if recall is None else round(recall, 4),
+            "sample": len(sample),
+            "held_out": len(held_out),
+            "dry_run": dry_run,
+        }
+        if dry_run:
+            return report
+
+        # Stored vectors are projected already: compose the two matrices
+        projection = Projection(
+            current.matrix @ matrix if current else matrix,
+            method,
+            recall=report["recall"],
+        )
+        start = time.perf_counter()
+        rewritten = store.project(lambda vectors: vectors @ matrix)
+        projection.save(ws_path)
+        indexer.set_projection(projection.version)
+        seconds = time.perf_counter() - start
+
+        # Embed paths other writers handed off while we held the lease
+        _embed_held(lease, [], ws_path, indexer=indexer, store=store)
+
+        return {
+            **report,
+            "version": projection.version,
+            "rewritten": rewritten,
+            "seconds": round(seconds, 2),
+        }
+
+    except Exception as e:
+        return {"error": str(e)}
+
+    finally:
+        lease.release()
@@ -32,6 +32,21 @@ class Document:
     doc_type: str
     metadata: dict[str, Any] = field(default_factory=dict)
     chunks: list[Chunk] = field(default_factory=list)
+    # Byte ranges read on demand for streamed (large) documents
+    byte_ranges: list[tuple[int, int]] = field(default_factory=list)
+    streamed_chunks: int = 0
+    # Structured filter fields copied onto every chunk (see Indexer.filter_fields)
+    fields: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def is_streamed(self) -> bool:
+        """Whether chunks are produced from the file instead of held in memory."""
+        return bool(self.byte_ranges)
+
+    @property
+    def num_chunks(self) -> int:
+        """Number of chunks the document produces."""
+        return self.streamed_chunks if self.is_streamed else len(self.chunks)
 
 
 @dataclass
@@ -44,10 +59,22 @@ class EmbeddingStatus:
     embedded_at: datetime
     model_name: str
     embedding_dim: int
+    # Path whose stored chunks this identical document reuses
+    shared_with: str | None = None
+    # File stat at embedding time, for change detection without parsing
+    file_size: int | None = None
+    file_mtime_ns: int | None = None
+    # Version of the filter fields stored with the chunks
+    fields_version: int | None = None
+    # Version of the projection applied to the stored vectors (None = none)
+    projection: str | None = None
+    # Own filter fields of a path sharing another's chunks (the stored
+    # chunks carry the owner's)
+    fields: dict[str, Any] | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for storage."""
-        return {
+        data = {
             "source_path": self.source_path,
             "content_hash": self.content_hash,
             "num_chunks": self.num_chunks,
@@ -55,6 +82,18 @@ class EmbeddingStatus:
             "model_name": self.model_name,
             "embedding_dim": self.embedding_dim,
         }
+        if self.shared_with:
+            data["shared_with"] = self.shared_with
+        if self.file_size is not None:
+            data["file_size"] = self.file_size
+            data["file_mtime_ns"] = self.file_mtime_ns
+        if self.fields_version is not None:
+            data["fields_version"] = self.fields_version
+        if self.projection:
+            data["projection"] = self.projection
+        if self.fields is not None:
+            data["fields"] = self.fields
+        return data
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "EmbeddingStatus":
@@ -66,6 +105,12 @@ class EmbeddingStatus:
             embedded_at=datetime.fromisoformat(data["embedded_at"]),
             model_name=data["model_name"],
             embedding_dim=data["embedding_dim"],
+            shared_with=data.get("shared_with"),
+            file_size=data.get("file_size"),
+            file_mtime_ns=data.get("file_mtime_ns"),
+            fields_version=data.get("fields_version"),
+            projection=data.get("projection"),
+            fields=data.get("fields"),
         )
 
 
@@ -76,6 +121,16 @@ class SearchResult:
     chunk: Chunk
     score: float
     embedding: list[float] | None = None
+    # Other paths holding identical content (deduplicated at index time)
+    also_in: list[str] = field(default_factory=list)
+    # Next best chunks of the same document (document-grouped searches)
+    other_chunks: list["SearchResult"] = field(default_factory=list)
+    # Cross-encoder relevance (reranked searches; None if not scored in time)
+    rerank_score: float | None = None
+    # The chunk merged with its neighbors, and their chunk indexes
+    # (expanded searches)
+    context: str | None = None
+    context_chunks: list[int] = field(default_factory=list)
 
     @property
     def conversation_name(self) -> str:
@@ -1,7 +1,36 @@
-"""Document parsers for different file types."""
+"""Document parsers for different file types.
 
+Parsers are looked up by file extension in a registry that keeps one parser
+instance per class and set of options. A parser class can take options from
+the workspace ``RAGConfig`` through an ``options_from_config`` classmethod
+returning its constructor keyword arguments. Third-party packages can add formats through the
+``cortext.parsers`` entry point group, where each entry point is named after
+the extension it handles (e.g. ``rst``) and points at a parser class.
+"""
+
+import warnings
+from importlib import import_module
+from importlib.metadata import entry_points
 from pathlib import Path
-from typing import Protocol
+from typing import TYPE_CHECKING, Callable, Protocol
+
+if TYPE_CHECKING:
+    from ..config import RAGConfig
+
+ENTRY_POINT_GROUP = "cortext.parsers"
+
+# Built-in parsers: extension -> "module:Class" (imported on first use)
+BUILTIN_PARSERS = {
+    ".md": "markdown:MarkdownParser",
+    ".markdown": "markdown:MarkdownParser",
+    ".txt": "text:TextParser",
+    ".pdf": "pdf:PDFParser",
+    ".docx": "docx:DOCXParser",
+    ".html": "html:HTMLParser",
+    ".htm": "html:HTMLParser",
+    ".ipynb": "notebook:NotebookParser",
+    ".csv": "csv:CSVParser",
+}
 
 
 class Parser(Protocol):
@@ -17,30 +46,124 @@ class Parser(Protocol):
         ...
 
 
-def get_parser(path: Path) -> Parser:
+class ParserRegistry:
+    """Map file extensions to shared parser instances."""
+
+    def __init__(self):
+        self._factories: dict[str, Callable[[], Parser] | str] = dict(BUILTIN_PARSERS)
+        self._classes: dict[str, Callable[..., Parser]] = {}
+        self._shared: dict[object, Parser] = {}
+        self._entry_points_loaded = False
+
+    def register(self, extensions: list[str], factory: Callable[[], Parser]) -> None:
+        """Register a parser class or factory for file extensions.
+
+        Args:
+            extensions: Extensions including the leading dot (e.g. [".rst"])
+            factory: Zero-argument callable returning a parser
+        """
+        for ext in extensions:
+            ext = _normalize_extension(ext)
+            self._factories[ext] = factory
+            self._classes.pop(ext, None)
+
+    def get(self, path: Path, config: "RAGConfig" = None) -> Parser:
+        """Get the parser for a file, creating it on first use.
+
+        Args:
+            path: Path to document
+            config: Workspace RAG configuration for parsers that read
+                options from it (default settings when omitted)
+
+        Returns:
+            Shared parser instance
+
+        Raises:
+            ValueError: If no parser handles the file extension
+        """
+        ext = path.suffix.lower()
+        parser_class = self._classes.get(ext)
+        if parser_class is None:
+            self._load_entry_points()
+            factory = self._factories.get(ext)
+            if factory is None:
+                raise ValueError(
+                    f"Unsupported file type: {ext}. "
+                    f"Supported: {', '.join(self.extensions)}"
+                )
+            parser_class = self._resolve(factory)
+            self._classes[ext] = parser_class
+
+        options = {}
+        if hasattr(parser_class, "options_from_config"):
+            if config is None:
+                from ..config import RAGConfig
+
+                config = RAGConfig()
+            options = parser_class.options_from_config(config)
+
+        # Extensions served by the same factory share one instance per options
+        key = (parser_class, tuple(sorted(options.items())))
+        parser = self._shared.get(key)
+        if parser is None:
+            parser = parser_class(**options)
+            self._shared[key] = parser
+        return parser
+
+    @property
+    def extensions(self) -> list[str]:
+        """All registered file extensions."""
+        self._load_entry_points()
+        return sorted(self._factories)
+
+    def _resolve(self, factory: Callable[[], Parser] | str) -> Callable[[], Parser]:
+        """Import a built-in "module:Class" reference."""
+        if not isinstance(factory, str):
+            return factory
+        module_name, _, class_name = factory.partition(":")
+        module = import_module(f"{__name__}.{module_name}")
+        return getattr(module, class_name)
+
+    def _load_entry_points(self) -> None:
+        """Register parsers advertised by installed packages (once)."""
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            try:
+                factory = entry_point.load()
+            except Exception as e:
+                warnings.warn(
+                    f"Could not load parser plugin '{entry_point.name}': {e}"
+                )
+                continue
+            self.register([entry_point.name], factory)
+
+
+def _normalize_extension(ext: str) -> str:
+    """Lower-case an extension and ensure it has a leading dot."""
+    ext = ext.lower()
+    return ext if ext.startswith(".") else f".{ext}"
+
+
+registry = ParserRegistry()
+
+
+def get_parser(path: Path, config: "RAGConfig" = None) -> Parser:
     """Get appropriate parser for file type."""
-    ext = path.suffix.lower()
-
-    if ext in [".md", ".markdown"]:
-        from .markdown import MarkdownParser
-        return MarkdownParser()
-    elif ext in [".txt"]:
-        from .text import TextParser
-        return TextParser()
-    elif ext in [".pdf"]:
-        from .pdf import PDFParser
-        return PDFParser()
-    elif ext in [".docx"]:
-        from .docx import DOCXParser
-        return DOCXParser()
-    elif ext in [".html", ".htm"]:
-        from .html import HTMLParser
-        return HTMLParser()
-    else:
-        raise ValueError(
-            f"Unsupported file type: {ext}. "
-            f"Supported: .md, .txt, .pdf, .docx, .html"
-        )
-
-
-__all__ = ["Parser", "get_parser"]
+    return registry.get(path, config)
+
+
+def supported_extensions() -> list[str]:
+    """List all file extensions with a registered parser."""
+    return registry.extensions
+
+
+__all__ = [
+    "Parser",
+    "ParserRegistry",
+    "get_parser",
+    "registry",
+    "supported_extensions",
+]
@@ -0,0 +1,60 @@
+"""CSV document parser."""
+
+import csv
+from pathlib import Path
+from typing import Any
+
+# Bytes inspected to detect the delimiter
+SNIFF_BYTES = 8192
+
+
+class CSVParser:
+    """Parse CSV files into one "column: value" line per row."""
+
+    @property
+    def supported_extensions(self) -> list[str]:
+        """Supported file extensions."""
+        return [".csv"]
+
+    def parse(self, path: Path) -> tuple[str, dict[str, Any]]:
+        """Parse CSV file.
+
+        The first row is treated as the header so each value is embedded
+        next to its column name.
+
+        Args:
+            path: Path to CSV file
+
+        Returns:
+            Tuple of (content, metadata)
+        """
+        with path.open(newline="", encoding="utf-8") as f:
+            sample = f.read(SNIFF_BYTES)
+            f.seek(0)
+            try:
+                dialect = csv.Sniffer().sniff(sample, delimiters=",;\t|")
+            except csv.Error:
+                dialect = csv.excel
+
+            reader = csv.reader(f, dialect)
+            header = next(reader, [])
+
+            lines = []
+            num_rows = 0
+            for row in reader:
+                num_rows += 1
+                fields = [
+                    f"{name}: {value}" if name else value
+                    for name, value in zip(header, row)
+                    if value.strip()
+                ]
+                if fields:
+                    lines.append("; ".join(fields))
+
+        metadata = {
+            "num_rows": num_rows,
+            "columns": ", ".join(header),
+            "file_name": path.name,
+        }
+
+        return "\n".join(lines).strip(), metadata
@@ -1,11 +1,57 @@
 """HTML document parser."""
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterator
+
+if TYPE_CHECKING:
+    from ..config import RAGConfig
+
+# Elements whose text never contributes to document content
+SKIP_TAGS = frozenset(
+    {
+        "head", "script", "style", "noscript", "template",
+        "svg", "canvas", "iframe", "object", "embed",
+    }
+)
+
+# Page chrome dropped when boilerplate removal is enabled
+BOILERPLATE_TAGS = frozenset({"nav", "header", "footer", "aside", "form", "button"})
+BOILERPLATE_ROLES = frozenset(
+    {"navigation", "banner", "contentinfo", "complementary", "search"}
+)
+
+# Elements that start a new text block
+BLOCK_TAGS = frozenset(
+    {
+        "address", "article", "blockquote", "body", "br", "caption", "dd",
+        "details", "div", "dl", "dt", "figcaption", "figure", "h1", "h2",
+        "h3", "h4", "h5", "h6", "hr", "li", "main", "ol", "p", "pre",
+        "section", "summary", "table", "td", "th", "tr", "ul",
+    }
+)
 
 
 class HTMLParser:
-    """Parse HTML files, stripping tags."""
+    """Parse HTML files, stripping tags.
+
+    Uses a streaming lxml walk that skips non-content subtrees without
+    building a BeautifulSoup tree. BeautifulSoup is only used as a fallback
+    when lxml is unavailable or cannot parse the input.
+    """
+
+    def __init__(self, remove_boilerplate: bool = False):
+        """Initialize parser.
+
+        Args:
+            remove_boilerplate: Drop navigation, header, footer and similar
+                page chrome in addition to scripts and styles
+        """
+        self.remove_boilerplate = remove_boilerplate
+
+    @classmethod
+    def options_from_config(cls, config: "RAGConfig") -> dict[str, Any]:
+        """Constructor options taken from the workspace RAG configuration."""
+        return {"remove_boilerplate": config.html_remove_boilerplate}
 
     @property
     def supported_extensions(self) -> list[str]:
@@ -21,6 +67,106 @@ class HTMLParser:
         Returns:
             Tuple of (content, metadata)
         """
+        data = path.read_bytes()
+
+        try:
+            from lxml import etree
+        except ImportError:
+            etree = None
+
+        if etree is None:
+            title, content = self._parse_soup(data)
+        else:
+            try:
+                title, content = self._parse_lxml(data)
+            except (etree.ParserError, etree.XMLSyntaxError):
+                # Empty or badly broken input: let BeautifulSoup recover it
+                title, content = self._parse_soup(data)
+
+        metadata = {
+            "title": title.strip() if title else path.stem,
+            "file_name": path.name,
+        }
+
+        return content.strip(), metadata
+
+    def _parse_lxml(self, data: bytes) -> tuple[str, str]:
+        """Extract title and text with lxml."""
+        from lxml import html as lxml_html
+
+        root = lxml_html.document_fromstring(data)
+
+        title = ""
+        title_el = root.find(".//title")
+        if title_el is not None and title_el.text:
+            title = title_el.text
+
+        content = "\n".join(self.iter_text_blocks(root))
+        return title, content
+
+    def iter_text_blocks(self, root) -> Iterator[str]:
+        """Stream whitespace-normalized text blocks from an lxml tree.
+
+        Args:
+            root: Root lxml element
+
+        Yields:
+            Non-empty text blocks in document order. Inline elements are
+            joined to their neighbours as written; only block elements
+            start a new block.
+        """
+        from lxml import etree
+
+        parts: list[str] = []
+
+        def flush() -> Iterator[str]:
+            if parts:
+                block = " ".join("".join(parts).split())
+                parts.clear()
+                if block:
+                    yield block
+
+        walker = etree.iterwalk(root, events=("start", "end", "comment", "pi"))
+        for event, el in walker:
+            if event in ("comment", "pi"):
+                # Comment text is dropped but text following it is content
+                if el.tail:
+                    parts.append(el.tail)
+                continue
+
+            tag = el.tag if isinstance(el.tag, str) else ""
+
+            if event == "start":
+                if self._is_skipped(el, tag):
+                    walker.skip_subtree()
+                    continue
+                if tag in BLOCK_TAGS:
+                    yield from flush()
+                if el.text:
+                    parts.append(el.text)
+            else:
+                if tag in BLOCK_TAGS:
+                    yield from flush()
+                if el.tail:
+                    parts.append(el.tail)
+
+        yield from flush()
+
+    def _is_skipped(self, el, tag: str) -> bool:
+        """Check whether an element's subtree holds no content."""
+        if tag in SKIP_TAGS:
+            return True
+        if self.remove_boilerplate:
+            if tag in BOILERPLATE_TAGS:
+                return True
+            if el.get("role") in BOILERPLATE_ROLES:
+                return True
+            if el.get("aria-hidden") == "true":
+                return True
+        return False
+
+    def _parse_soup(self, data: bytes) -> tuple[str, str]:
+        """Extract title and text with BeautifulSoup (fallback path)."""
         try:
             from bs4 import BeautifulSoup
         except ImportError:
@@ -29,28 +175,26 @@ class HTMLParser:
                 "Install with: pip install cortext-workspace[rag]"
             )
 
-        html_content = path.read_text(encoding="utf-8")
-        soup = BeautifulSoup(html_content, "lxml")
+        soup = BeautifulSoup(data, "html.parser")
 
         # Extract title if present
         title = ""
         if soup.title:
             title = soup.title.string or ""
 
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
+        # Remove non-content elements
+        skipped = SKIP_TAGS - {"head"}
+        if self.remove_boilerplate:
+            skipped = skipped | BOILERPLATE_TAGS
+        for element in soup(list(skipped)):
+            element.decompose()
 
-        # Get text content
-        text = soup.get_text(separator="\n")
+        # Break lines only around block elements so inline markup stays joined
+        for element in soup(list(BLOCK_TAGS)):
+            element.insert_before("\n")
+            element.insert_after("\n")
+        text = soup.get_text()
 
         # Clean up whitespace
-        lines = [line.strip() for line in text.splitlines() if line.strip()]
-        content = "\n".join(lines)
-
-        metadata = {
-            "title": title.strip() if title else path.stem,
-            "file_name": path.name,
-        }
-
-        return content.strip(), metadata
+        lines = [" ".join(line.split()) for line in text.splitlines()]
+        return title, "\n".join(line for line in lines if line)
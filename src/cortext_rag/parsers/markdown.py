@@ -4,6 +4,9 @@ import re
 from pathlib import Path
 from typing import Any
 
+# How far into a streamed file to look for closing frontmatter
+FRONTMATTER_SCAN_BYTES = 64 * 1024
+
 
 class MarkdownParser:
     """Parse markdown files, extracting frontmatter and content."""
@@ -46,6 +49,28 @@ class MarkdownParser:
 
         return content.strip(), metadata
 
+    def stream_info(self, path: Path) -> tuple[int, dict[str, Any]]:
+        """Describe a large markdown file for streaming ingestion.
+
+        Only the head of the file is read to extract frontmatter.
+
+        Args:
+            path: Path to markdown file
+
+        Returns:
+            Tuple of (byte offset where content starts, metadata)
+        """
+        with path.open("rb") as f:
+            head = f.read(FRONTMATTER_SCAN_BYTES)
+
+        if head.startswith(b"---"):
+            end = head.find(b"\n---\n", 3)
+            if end != -1:
+                frontmatter_text = head[3:end].decode("utf-8", errors="replace")
+                return end + 5, self._parse_frontmatter(frontmatter_text)
+
+        return 0, {}
+
     def _parse_frontmatter(self, text: str) -> dict[str, Any]:
         """Parse simple YAML frontmatter."""
         metadata = {}
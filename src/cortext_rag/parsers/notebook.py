@@ -0,0 +1,53 @@
+"""Jupyter notebook parser."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+
+class NotebookParser:
+    """Parse Jupyter notebooks, keeping markdown and code cell sources."""
+
+    @property
+    def supported_extensions(self) -> list[str]:
+        """Supported file extensions."""
+        return [".ipynb"]
+
+    def parse(self, path: Path) -> tuple[str, dict[str, Any]]:
+        """Parse notebook file.
+
+        Cell outputs are skipped; only markdown, raw and code sources are
+        kept, in notebook order.
+
+        Args:
+            path: Path to notebook file
+
+        Returns:
+            Tuple of (content, metadata)
+        """
+        notebook = json.loads(path.read_text(encoding="utf-8"))
+        cells = notebook.get("cells", [])
+
+        sections = []
+        for cell in cells:
+            source = cell.get("source", "")
+            if isinstance(source, list):
+                source = "".join(source)
+            source = source.strip()
+            if source:
+                sections.append(source)
+
+        content = "\n\n".join(sections)
+
+        metadata = {
+            "num_cells": len(cells),
+            "file_name": path.name,
+        }
+
+        language = (
+            notebook.get("metadata", {}).get("language_info", {}).get("name")
+        )
+        if language:
+            metadata["language"] = language
+
+        return content.strip(), metadata
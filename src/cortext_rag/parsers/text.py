@@ -27,3 +27,18 @@ class TextParser:
             "file_size": path.stat().st_size,
         }
         return content.strip(), metadata
+
+    def stream_info(self, path: Path) -> tuple[int, dict[str, Any]]:
+        """Describe a large text file for streaming ingestion.
+
+        Args:
+            path: Path to text file
+
+        Returns:
+            Tuple of (byte offset where content starts, metadata)
+        """
+        metadata = {
+            "file_name": path.name,
+            "file_size": path.stat().st_size,
+        }
+        return 0, metadata
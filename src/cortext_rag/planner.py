@@ -0,0 +1,231 @@
+"""Embedding change planning and cost estimation.
+
+Computes what ``cortext embed`` would do using file stats and content hashes
+only: the embedding model is not loaded and the vector store is not opened.
+Time estimates come from inference throughput recorded by earlier runs.
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .indexer import Indexer
+from .locking import write_text_atomic
+
+
+@dataclass
+class EmbedPlan:
+    """Change set and estimated cost of an embedding run."""
+
+    new: list[str] = field(default_factory=list)
+    modified: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+    renamed: list[tuple[str, str]] = field(default_factory=list)
+    # New or modified files whose content is already embedded elsewhere
+    duplicates: list[str] = field(default_factory=list)
+    estimated_chunks: int = 0
+    chunks_per_second: float | None = None
+    model_load_seconds: float | None = None
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def estimated_seconds(self) -> float | None:
+        """Estimated inference time, or None without recorded throughput."""
+        if self.estimated_chunks == 0:
+            return 0.0
+        if not self.chunks_per_second:
+            return None
+        return (
+            self.estimated_chunks / self.chunks_per_second
+            + (self.model_load_seconds or 0.0)
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON output."""
+        return {
+            "new": self.new,
+            "modified": self.modified,
+            "unchanged": len(self.unchanged),
+            "deleted": self.deleted,
+            "renamed": [{"from": old, "to": new} for old, new in self.renamed],
+            "duplicates": self.duplicates,
+            "estimated_chunks": self.estimated_chunks,
+            "chunks_per_second": self.chunks_per_second,
+            "estimated_seconds": self.estimated_seconds,
+            "errors": self.errors if self.errors else None,
+        }
+
+
+def _metrics_file(workspace_path: Path) -> Path:
+    return Path(workspace_path) / ".workspace" / "embeddings" / "metrics.json"
+
+
+def load_throughput(workspace_path: Path) -> dict[str, Any]:
+    """Load inference throughput recorded by earlier embedding runs."""
+    try:
+        return json.loads(_metrics_file(workspace_path).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def record_throughput(
+    workspace_path: Path,
+    chunks: int,
+    seconds: float,
+    model_load_seconds: float | None = None,
+) -> None:
+    """Add an embedding run's measurements to the workspace metrics.
+
+    Args:
+        workspace_path: Path to workspace root
+        chunks: Number of chunks embedded
+        seconds: Time spent in inference
+        model_load_seconds: Time spent loading the model, if it was loaded
+    """
+    if chunks <= 0 or seconds <= 0:
+        return
+
+    metrics = load_throughput(workspace_path)
+    metrics["chunks_embedded"] = metrics.get("chunks_embedded", 0) + chunks
+    metrics["inference_seconds"] = metrics.get("inference_seconds", 0.0) + seconds
+    if model_load_seconds is not None:
+        metrics["model_load_seconds"] = model_load_seconds
+    metrics["updated_at"] = datetime.now().isoformat()
+
+    write_text_atomic(_metrics_file(workspace_path), json.dumps(metrics, indent=2))
+
+
+def plan_embedding(workspace_path: Path, roots: list[Path]) -> EmbedPlan:
+    """Compute the change set for embedding the given paths.
+
+    Files whose size and mtime match their status are unchanged without being
+    read; other files are parsed and compared by content hash.
+
+    Args:
+        workspace_path: Path to workspace root
+        roots: Files or directories that would be embedded
+
+    Returns:
+        EmbedPlan with categorized paths and cost estimates
+    """
+    indexer = Indexer(workspace_path)
+    all_status = indexer.get_all_status()
+    plan = EmbedPlan()
+
+    # Content already in the store can be reused without inference
+    embedded_hashes = {
+        status.content_hash
+        for status in all_status.values()
+        if not status.shared_with and status.num_chunks > 0
+    }
+    new_by_hash: dict[str, str] = {}
+    seen: set[str] = set()
+
+    for root in roots:
+        for path in indexer.find_documents(root):
+            key = str(path)
+            if key in seen:
+                continue
+            seen.add(key)
+            status = all_status.get(key)
+
+            if indexer.stat_matches(status, path):
+                plan.unchanged.append(key)
+                continue
+
+            try:
+                doc = indexer.parse_document(path)
+            except Exception as e:
+                plan.errors.append(f"{path}: {str(e)}")
+                continue
+
+            if status is not None and status.content_hash == doc.content_hash:
+                plan.unchanged.append(key)
+                continue
+
+            if status is None:
+                plan.new.append(key)
+                new_by_hash.setdefault(doc.content_hash, key)
+            else:
+                plan.modified.append(key)
+
+            if doc.content_hash in embedded_hashes:
+                plan.duplicates.append(key)
+            else:
+                embedded_hashes.add(doc.content_hash)
+                plan.estimated_chunks += doc.num_chunks
+
+    # Status entries under the roots whose files are gone
+    for key, status in all_status.items():
+        path = Path(key)
+        if key in seen or path.exists():
+            continue
+        if not any(path == root or root in path.parents for root in roots):
+            continue
+
+        renamed_to = new_by_hash.pop(status.content_hash, None)
+        if renamed_to:
+            plan.renamed.append((key, renamed_to))
+            plan.new.remove(renamed_to)
+            if renamed_to in plan.duplicates:
+                plan.duplicates.remove(renamed_to)
+        else:
+            plan.deleted.append(key)
+
+    metrics = load_throughput(workspace_path)
+    if metrics.get("inference_seconds"):
+        plan.chunks_per_second = (
+            metrics["chunks_embedded"] / metrics["inference_seconds"]
+        )
+    plan.model_load_seconds = metrics.get("model_load_seconds")
+
+    return plan
+
+
+def conversation_dirs(workspace_path: Path) -> list[Path] | None:
+    """List conversation type folders from the registry (None if missing)."""
+    registry_path = workspace_path / ".workspace" / "registry.json"
+    if not registry_path.exists():
+        return None
+
+    registry = json.loads(registry_path.read_text())
+    conversation_types = registry.get("conversation_types", {})
+    return [
+        workspace_path / config.get("folder", type_name)
+        for type_name, config in conversation_types.items()
+    ]
+
+
+def plan_path(path: str = None, workspace_path: str = None) -> dict[str, Any]:
+    """Plan embedding a file, directory or the whole workspace.
+
+    Only needs the indexer and parsers, so it runs without the embedding
+    model, the vector store or their dependencies installed.
+
+    Args:
+        path: Path to file or directory (default: whole workspace)
+        workspace_path: Optional workspace root path
+
+    Returns:
+        Dictionary with the change set and cost estimates, or an error
+    """
+    ws_path = Path(workspace_path) if workspace_path else Path.cwd()
+
+    if path:
+        doc_path = Path(path)
+        if not doc_path.is_absolute():
+            doc_path = ws_path / doc_path
+        if not doc_path.exists():
+            return {"error": f"Path not found: {doc_path}"}
+        roots = [doc_path]
+    else:
+        type_dirs = conversation_dirs(ws_path)
+        if type_dirs is None:
+            return {"error": "Not a valid Cortext workspace (no registry.json)"}
+        roots = [type_dir for type_dir in type_dirs if type_dir.exists()]
+
+    plan = plan_embedding(ws_path, roots)
+    return {"success": True, **plan.to_dict()}
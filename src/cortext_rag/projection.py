@@ -0,0 +1,261 @@
+"""Dimensionality reduction of stored and query vectors.
+
+A projection maps model embeddings (e.g. 384 dimensions) to fewer dimensions
+(e.g. 128) with one matrix product, shrinking index memory and distance
+computations by the same factor without changing the embedding model. It is
+fitted on the workspace's own vectors and kept next to the status records::
+
+    .workspace/embeddings/
+        status.json             # each record notes the projection version
+        projection.json         # version, method, dimensions, recall
+        projection-<version>.npy  # float32 (source_dim, dim)
+
+Two methods are supported:
+
+- ``pca``: the top principal directions of the stored vectors (uncentered,
+  so inner products, not distances from the mean, are preserved)
+- ``random``: a random orthonormal basis; needs no data but loses more recall
+
+Stored vectors are rewritten through the matrix when a projection is applied,
+embedding runs project new chunks, and Retriever.search projects queries.
+Status records carry the version their vectors were projected with, so
+documents embedded under another projection are embedded again.
+"""
+
+import json
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .backends.numpy_flat import normalize
+from .locking import write_text_atomic
+
+PROJECTION_METHODS = ("pca", "random")
+
+# Stored vectors used to fit a projection and measure its recall, and the
+# fraction held out of the fit for measuring recall
+FIT_SAMPLE = 50_000
+HOLDOUT_FRACTION = 0.2
+
+# Sample vectors used as queries when measuring recall, and results compared
+RECALL_PROBES = 200
+RECALL_K = 10
+
+
+def _embeddings_dir(workspace_path: Path) -> Path:
+    return Path(workspace_path) / ".workspace" / "embeddings"
+
+
+def fit_pca(sample: np.ndarray, dim: int) -> np.ndarray:
+    """Top principal directions of a sample of vectors.
+
+    Args:
+        sample: Float32 rows, shape (n, source_dim)
+        dim: Number of directions to keep
+
+    Returns:
+        Matrix with orthonormal columns, shape (source_dim, dim)
+    """
+    sample = np.asarray(sample, dtype=np.float64)
+    eigenvalues, eigenvectors = np.linalg.eigh(sample.T @ sample)
+    order = np.argsort(eigenvalues)[::-1][:dim]
+    return eigenvectors[:, order].astype(np.float32)
+
+
+def fit_random(source_dim: int, dim: int, seed: int = 0) -> np.ndarray:
+    """Random orthonormal projection.
+
+    Args:
+        source_dim: Dimension of the input vectors
+        dim: Dimension of the projected vectors
+        seed: Random seed
+
+    Returns:
+        Matrix with orthonormal columns, shape (source_dim, dim)
+    """
+    rng = np.random.default_rng(seed)
+    basis, _ = np.linalg.qr(rng.standard_normal((source_dim, dim)))
+    return basis.astype(np.float32)
+
+
+def split_holdout(
+    sample: np.ndarray, fraction: float = HOLDOUT_FRACTION
+) -> tuple[np.ndarray, np.ndarray]:
+    """Split a randomly ordered sample into fitting rows and held-out rows.
+
+    Recall measured on rows the projection was not fitted on reflects how
+    it treats the rest of the store.
+
+    Args:
+        sample: Float32 rows in random order, shape (n, source_dim)
+        fraction: Share of the rows held out
+
+    Returns:
+        Tuple of (rows to fit on, held-out rows)
+    """
+    held_out = int(len(sample) * fraction)
+    return sample[: len(sample) - held_out], sample[len(sample) - held_out :]
+
+
+def recall_at_k(
+    sample: np.ndarray,
+    matrix: np.ndarray,
+    k: int = RECALL_K,
+    probes: int = RECALL_PROBES,
+    seed: int = 0,
+) -> float | None:
+    """Fraction of exact top-k neighbors a projection keeps.
+
+    Sample rows serve as queries against the rest of the sample, searched
+    by cosine similarity before and after projecting.
+
+    Args:
+        sample: Float32 rows, shape (n, source_dim)
+        matrix: Projection matrix, shape (source_dim, dim)
+        k: Neighbors compared per query
+        probes: Number of query rows
+        seed: Random seed for picking the queries
+
+    Returns:
+        Mean recall@k, or None if the sample is too small
+    """
+    if len(sample) <= k:
+        return None
+
+    full = normalize(np.asarray(sample, dtype=np.float32))
+    reduced = normalize(full @ matrix)
+    rng = np.random.default_rng(seed)
+    queries = rng.choice(len(full), min(probes, len(full)), replace=False)
+
+    def neighbors(vectors: np.ndarray) -> np.ndarray:
+        scores = vectors[queries] @ vectors.T
+        # A query is not its own neighbor
+        scores[np.arange(len(queries)), queries] = -np.inf
+        return np.argpartition(-scores, k, axis=1)[:, :k]
+
+    exact, approximate = neighbors(full), neighbors(reduced)
+    hits = [len(np.intersect1d(e, a)) for e, a in zip(exact, approximate)]
+    return float(np.mean(hits)) / k
+
+
+class Projection:
+    """A fitted projection matrix with its version."""
+
+    def __init__(
+        self,
+        matrix: np.ndarray,
+        method: str,
+        version: str = None,
+        fitted_at: datetime = None,
+        recall: float | None = None,
+    ):
+        """Initialize projection.
+
+        Args:
+            matrix: Float32 matrix, shape (source_dim, dim)
+            method: "pca" or "random"
+            version: Identifier recorded with embedded documents (new if omitted)
+            fitted_at: When the matrix was fitted
+            recall: Measured recall@k against unprojected search
+        """
+        self.matrix = np.asarray(matrix, dtype=np.float32)
+        self.method = method
+        self.version = version or uuid.uuid4().hex[:12]
+        self.fitted_at = fitted_at or datetime.now()
+        self.recall = recall
+
+    @property
+    def source_dim(self) -> int:
+        """Dimension of model embeddings."""
+        return self.matrix.shape[0]
+
+    @property
+    def dim(self) -> int:
+        """Dimension of stored vectors."""
+        return self.matrix.shape[1]
+
+    def apply(self, vectors) -> np.ndarray:
+        """Project model embeddings.
+
+        Args:
+            vectors: Embeddings, shape (n, source_dim)
+
+        Returns:
+            Float32 array of shape (n, dim)
+        """
+        return np.asarray(vectors, dtype=np.float32) @ self.matrix
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for storage (without the matrix)."""
+        return {
+            "version": self.version,
+            "method": self.method,
+            "source_dim": self.source_dim,
+            "dim": self.dim,
+            "fitted_at": self.fitted_at.isoformat(),
+            "recall": self.recall,
+        }
+
+    def save(self, workspace_path: Path) -> None:
+        """Make this the workspace's projection.
+
+        The matrix is written under its version first and projection.json
+        is replaced last, so readers load either the old or the new pair.
+        Older matrices are removed.
+        """
+        embeddings_dir = _embeddings_dir(workspace_path)
+        embeddings_dir.mkdir(parents=True, exist_ok=True)
+        np.save(embeddings_dir / f"projection-{self.version}.npy", self.matrix)
+        write_text_atomic(
+            embeddings_dir / "projection.json", json.dumps(self.to_dict(), indent=2)
+        )
+        for old in embeddings_dir.glob("projection-*.npy"):
+            if old.name != f"projection-{self.version}.npy":
+                old.unlink(missing_ok=True)
+
+    @classmethod
+    def load(cls, workspace_path: Path) -> "Projection | None":
+        """Load the workspace's projection, if one is applied."""
+        embeddings_dir = _embeddings_dir(workspace_path)
+        for _ in range(2):
+            data = projection_info(workspace_path)
+            if data is None:
+                return None
+            try:
+                matrix = np.load(embeddings_dir / f"projection-{data['version']}.npy")
+            except FileNotFoundError:
+                # Replaced by a newer projection while loading: read again
+                continue
+            return cls(
+                matrix,
+                data["method"],
+                version=data["version"],
+                fitted_at=datetime.fromisoformat(data["fitted_at"]),
+                recall=data.get("recall"),
+            )
+        return None
+
+    @staticmethod
+    def remove(workspace_path: Path) -> None:
+        """Stop projecting; stored vectors must be embedded again."""
+        embeddings_dir = _embeddings_dir(workspace_path)
+        (embeddings_dir / "projection.json").unlink(missing_ok=True)
+        for old in embeddings_dir.glob("projection-*.npy"):
+            old.unlink(missing_ok=True)
+
+
+def projection_info(workspace_path: Path) -> dict[str, Any] | None:
+    """Version, method, dimensions and recall of the applied projection."""
+    try:
+        return json.loads((_embeddings_dir(workspace_path) / "projection.json").read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def current_version(workspace_path: Path) -> str | None:
+    """Version of the applied projection (None without one)."""
+    data = projection_info(workspace_path)
+    return data["version"] if data else None
@@ -1,12 +1,51 @@
 """Semantic search and context retrieval."""
 
+import calendar
+import json
+import math
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
+from datetime import date
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
+import numpy as np
+
+from .backends.numpy_flat import normalize
+from .cache import RESULT_CACHE, QueryEmbeddingCache
 from .embedder import Embedder
-from .models import SearchResult
+from .filters import compile_where
+from .hydration import hydrate
+from .indexer import Indexer
+from .models import Chunk, SearchResult
+from .projection import Projection
 from .store import VectorStore
 
+SEARCH_MODES = ("semantic", "hybrid")
+
+# Results taken from each ranking before fusing, and the rank offset of
+# reciprocal rank fusion (60 is the customary value)
+HYBRID_CANDIDATES = 50
+RRF_K = 60
+
+GROUP_BY = ("document",)
+AGGREGATES = ("max", "softmax")
+
+# Chunk hits fetched per requested document when grouping; doubled until
+# enough distinct documents are found, up to GROUP_MAX_FETCH
+GROUP_OVERFETCH = 3
+GROUP_MAX_FETCH = 1000
+
+# Chunks returned per document group, and the temperature of the softmax
+# aggregate (lower approaches max)
+CHUNKS_PER_DOCUMENT = 3
+SOFTMAX_TEMPERATURE = 0.05
+
+# Candidates per kept result that diversification chooses from
+DIVERSITY_OVERFETCH = 4
+
 
 class Retriever:
     """Semantic search across embedded workspace content."""
@@ -18,8 +57,17 @@ class Retriever:
             workspace_path: Path to workspace root
         """
         self.workspace_path = Path(workspace_path or Path.cwd())
-        self.embedder = Embedder()
         self.store = VectorStore(workspace_path)
+        self.embedder = Embedder(rerank_model=self.store.config.rerank_model)
+        self.query_cache = QueryEmbeddingCache(
+            self.workspace_path, self.store.config.query_cache_size
+        )
+        self.indexer = Indexer(self.workspace_path)
+        # Stored vectors may be reduced (see cortext_rag.projection)
+        self.projection = Projection.load(self.workspace_path)
+        # Whether the last search missed its deadline and returned keyword
+        # matches instead (see search)
+        self.degraded = False
 
     def search(
         self,
@@ -27,6 +75,16 @@ class Retriever:
         n_results: int = 10,
         conversation_type: str = None,
         date_range: str = None,
+        date_from: str = None,
+        date_to: str = None,
+        mode: str = "semantic",
+        group_by: str = None,
+        aggregate: str = "max",
+        chunks_per_document: int = CHUNKS_PER_DOCUMENT,
+        rerank: bool = None,
+        diversity: float = 0.0,
+        timeout_ms: int = None,
+        expand: int = 0,
     ) -> list[SearchResult]:
         """Semantic search across workspace.
 
@@ -34,92 +92,629 @@ class Retriever:
             query: Search query text
             n_results: Maximum number of results
             conversation_type: Filter by conversation type (e.g., "brainstorm")
-            date_range: Filter by date (YYYY-MM or YYYY-MM-DD)
+            date_range: Filter by date (YYYY, YYYY-MM or YYYY-MM-DD)
+            date_from: Only conversations on or after this date
+            date_to: Only conversations on or before this date
+            mode: "semantic" (vectors only) or "hybrid" (vectors and BM25
+                keywords, merged with reciprocal rank fusion)
+            group_by: "document" to return n_results distinct documents,
+                each as its best chunk with the next best in other_chunks
+            aggregate: Document score from its chunk scores when grouping:
+                "max" or "softmax" (chunk scores averaged with softmax
+                weights, so near-best chunks count and weak ones do not)
+            chunks_per_document: Chunks kept per document when grouping
+            rerank: Reorder the top rerank_candidates results with the
+                cross-encoder within rerank_budget_ms (default: the
+                workspace's rerank setting)
+            diversity: Trade relevance for coverage with maximal marginal
+                relevance, from 0 (plain ranking) to 1 (most diverse); not
+                for document-grouped searches
+            timeout_ms: Deadline for the search. If it passes (e.g. while
+                the model loads), keyword matches gathered meanwhile are
+                returned in the same shape (grouped, expanded) but not
+                reranked or diversified, and ``degraded`` is set; the
+                search finishes in the background and its results are
+                cached
+            expand: Merge each result's chunk with up to this many
+                neighboring chunks on each side into ``context``, so the
+                surrounding text comes without reading the file
 
         Returns:
             List of SearchResult objects sorted by relevance
         """
-        # Generate query embedding
-        query_embedding = self.embedder.embed_single(query)
+        self.degraded = False
+        if mode not in SEARCH_MODES:
+            raise ValueError(
+                f"Invalid search mode: {mode}. Supported: {', '.join(SEARCH_MODES)}"
+            )
+        if group_by is not None and group_by not in GROUP_BY:
+            raise ValueError(
+                f"Invalid group_by: {group_by}. Supported: {', '.join(GROUP_BY)}"
+            )
+        if aggregate not in AGGREGATES:
+            raise ValueError(
+                f"Invalid aggregate: {aggregate}. Supported: {', '.join(AGGREGATES)}"
+            )
+        if not 0.0 <= diversity <= 1.0:
+            raise ValueError(f"Invalid diversity: {diversity} (use 0 to 1)")
+        if diversity and group_by is not None:
+            raise ValueError("diversity does not apply to document-grouped searches")
+        if expand < 0:
+            raise ValueError(f"Invalid expand: {expand} (use 0 or more)")
 
         # Build filter
-        where_filter = self._build_filter(conversation_type, date_range)
+        where_filter = self._build_filter(
+            conversation_type, date_range, date_from, date_to
+        )
 
-        # Search vector store
-        results = self.store.search(
-            query_embedding=query_embedding,
-            n_results=n_results,
-            where=where_filter,
+        config = self.store.config
+        rerank = config.rerank if rerank is None else rerank
+
+        # Read before searching: a write finishing meanwhile bumps it
+        generation = self.store.generation
+        cache_key = json.dumps(
+            [
+                str(self.workspace_path),
+                generation,
+                self.projection.version if self.projection else None,
+                config.to_dict(),
+                query,
+                n_results,
+                where_filter,
+                mode,
+                group_by,
+                aggregate,
+                chunks_per_document,
+                rerank,
+                diversity,
+                expand,
+            ],
+            sort_keys=True,
         )
+        if config.result_cache:
+            cached = RESULT_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Deduplicated copies matching the filter bring in their owners' chunks
+        search_filter = self._alias_filter(where_filter)
+
+        def run() -> list[SearchResult]:
+            results = self._search(
+                query,
+                n_results,
+                search_filter,
+                mode,
+                group_by,
+                aggregate,
+                chunks_per_document,
+                rerank,
+                diversity,
+            )
+            if expand:
+                self._expand(results, expand)
+            self._attach_aliases(results, where_filter)
+            if config.result_cache:
+                RESULT_CACHE.put(cache_key, results)
+            return results
+
+        if timeout_ms is None:
+            return run()
+
+        return self._within_deadline(
+            timeout_ms,
+            run,
+            lambda: self._keyword_fallback(
+                query,
+                n_results,
+                where_filter,
+                search_filter,
+                group_by,
+                aggregate,
+                chunks_per_document,
+                expand,
+            ),
+            empty=[],
+        )
+
+    def _within_deadline(
+        self,
+        timeout_ms: int,
+        search: Callable[[], Any],
+        fallback: Callable[[], Any],
+        empty: Any,
+    ) -> Any:
+        """Run a search, falling back to keyword matches at a deadline.
+
+        Both start at once in the background. If the search misses the
+        deadline, ``degraded`` is set and the fallback's result is returned
+        (empty if it is not ready either); the search keeps running.
+        """
+        deadline = time.monotonic() + timeout_ms / 1000
+        searching = _in_background(search)
+        falling_back = _in_background(fallback)
+        try:
+            return searching.result(timeout=max(0.0, deadline - time.monotonic()))
+        except TimeoutError:
+            self.degraded = True
+        try:
+            return falling_back.result(timeout=max(0.0, deadline - time.monotonic()))
+        except TimeoutError:
+            # Not even the keyword matches are ready (e.g. a locked index)
+            return empty
+
+    def _keyword_fallback(
+        self,
+        query: str,
+        n_results: int,
+        where_filter: dict[str, Any] | None,
+        search_filter: dict[str, Any] | None,
+        group_by: str | None,
+        aggregate: str,
+        chunks_per_document: int,
+        expand: int,
+    ) -> list[SearchResult]:
+        """Keyword matches in the shape search returns (its deadline fallback).
+
+        Uses the BM25 index, or scans the stored text of stores built before
+        the index existed. Not reranked or diversified: both wait for a
+        model or vectors, like the search that missed its deadline.
+        search_filter is where_filter widened to deduplicated copies (see
+        _alias_filter).
+        """
+        fetch = n_results * GROUP_OVERFETCH if group_by else n_results
+        if self.store.lexical.exists:
+            results = self.store.lexical_search(
+                query, fetch, search_filter, hydrate_text=False
+            )
+        else:
+            results = self.store.keyword_scan(query, fetch, search_filter, hydrate_text=False)
+
+        if group_by == "document":
+            groups: dict[str, list[SearchResult]] = {}
+            for result in results:
+                groups.setdefault(result.chunk.source_path, []).append(result)
+            results = _top_documents(groups, n_results, aggregate, chunks_per_document)
+        hydrate([r.chunk for best in results for r in [best, *best.other_chunks]])
+        if expand:
+            self._expand(results, expand)
+        return self._attach_aliases(results, where_filter)
+
+    def _search(
+        self,
+        query: str,
+        n_results: int,
+        where_filter: dict[str, Any] | None,
+        mode: str,
+        group_by: str | None,
+        aggregate: str,
+        chunks_per_document: int,
+        rerank: bool,
+        diversity: float,
+    ) -> list[SearchResult]:
+        """Run a validated search (see search); aliases are attached by the caller."""
+        config = self.store.config
+        if group_by == "document":
+            results = self._grouped_search(
+                query, n_results, where_filter, mode, aggregate, chunks_per_document
+            )
+            # Reorder the documents by their best chunks
+            if rerank:
+                results = self._rerank(query, results)
+            return results
+
+        # Candidates for the cross-encoder, chosen from a larger pool when
+        # diversifying (only the chosen ones need their text)
+        keep = max(n_results, config.rerank_candidates) if rerank else n_results
+        fetch = keep * DIVERSITY_OVERFETCH if diversity else keep
+
+        if mode == "hybrid":
+            results = self._hybrid_search(
+                query,
+                fetch,
+                where_filter,
+                hydrate_text=not diversity,
+                with_embeddings=bool(diversity),
+            )
+        else:
+            # Search vector store
+            results = self.store.search(
+                query_embedding=self._embed_query(query),
+                n_results=fetch,
+                where=where_filter,
+                hydrate_text=not diversity,
+                with_embeddings=bool(diversity),
+            )
 
+        if diversity:
+            results = self._diversify(results, keep, diversity)
+            hydrate([result.chunk for result in results])
+        if rerank:
+            results = self._rerank(query, results)[:n_results]
         return results
 
-    def get_similar(
-        self, source_path: str, n_results: int = 5
+    def _diversify(
+        self, results: list[SearchResult], n_results: int, diversity: float
     ) -> list[SearchResult]:
-        """Find documents similar to given source.
+        """Pick n_results by maximal marginal relevance.
+
+        Results without a vector (keyword-only hybrid hits) get theirs from
+        the store in one fetch.
+        """
+        missing = [result.chunk.chunk_id for result in results if result.embedding is None]
+        if missing:
+            fetched = self.store.get_embeddings(missing)
+            results = [
+                replace(result, embedding=fetched[result.chunk.chunk_id])
+                if result.embedding is None
+                else result
+                for result in results
+                if result.embedding is not None or result.chunk.chunk_id in fetched
+            ]
+        if not results:
+            return results
+
+        order = maximal_marginal_relevance(
+            np.array([result.score for result in results], dtype=np.float32),
+            np.array([result.embedding for result in results], dtype=np.float32),
+            n_results,
+            diversity,
+        )
+        return [results[i] for i in order]
+
+    def _rerank(self, query: str, results: list[SearchResult]) -> list[SearchResult]:
+        """Order results by cross-encoder relevance within the time budget.
+
+        Results are scored best first; those left unscored when the budget
+        runs out keep their order after the scored ones.
+        """
+        budget = self.store.config.rerank_budget_ms / 1000
+        scores = self.embedder.rerank(
+            query, [result.chunk.text for result in results], budget
+        )
+        scored = sorted(
+            (
+                replace(result, rerank_score=score)
+                for result, score in zip(results, scores)
+            ),
+            key=lambda result: result.rerank_score,
+            reverse=True,
+        )
+        return scored + results[len(scores) :]
+
+    def search_many(
+        self,
+        queries: list[str],
+        n_results: int = 10,
+        conversation_type: str = None,
+        date_range: str = None,
+        date_from: str = None,
+        date_to: str = None,
+        timeout_ms: int = None,
+    ) -> list[list[SearchResult]]:
+        """Semantic search for several queries at once.
+
+        All queries are embedded in one model batch and sent to the store
+        as one multi-query request, e.g. for the phrasings of one question
+        or the aspects of a task.
 
         Args:
-            source_path: Path to source document
-            n_results: Number of similar documents to return
+            queries: Search query texts
+            n_results: Maximum number of results per query
+            conversation_type: Filter by type (e.g., "brainstorm")
+            date_range: Filter by date (YYYY, YYYY-MM or YYYY-MM-DD)
+            date_from: Only conversations on or after this date
+            date_to: Only conversations on or before this date
+            timeout_ms: Deadline for the searches. If it passes (e.g. while
+                the model loads), each query's keyword matches are returned
+                instead and ``degraded`` is set; the search finishes in the
+                background, leaving the model loaded and the query
+                embeddings cached
 
         Returns:
-            List of similar documents (excluding source)
+            One list of SearchResult objects per query, in query order
+            (see fuse_rankings to merge them)
         """
-        # Get chunks from source document
-        store_results = self.store.collection.get(
-            where={"source_path": source_path},
-            include=["embeddings", "documents"],
+        self.degraded = False
+        if not queries:
+            return []
+
+        where_filter = self._build_filter(
+            conversation_type, date_range, date_from, date_to
+        )
+        search_filter = self._alias_filter(where_filter)
+
+        def run() -> list[list[SearchResult]]:
+            embeddings = self._embed_queries(queries)
+            rankings = self.store.search_many(embeddings, n_results, search_filter)
+            for ranking in rankings:
+                self._attach_aliases(ranking, where_filter)
+            return rankings
+
+        if timeout_ms is None:
+            return run()
+
+        return self._within_deadline(
+            timeout_ms,
+            run,
+            lambda: [
+                self._keyword_fallback(
+                    query,
+                    n_results,
+                    where_filter,
+                    search_filter,
+                    None,
+                    "max",
+                    CHUNKS_PER_DOCUMENT,
+                    0,
+                )
+                for query in queries
+            ],
+            empty=[[] for _ in queries],
         )
 
-        if not store_results["embeddings"]:
-            return []
+    def _embed_query(self, query: str) -> list[float]:
+        """Embed a query, projected like the stored vectors."""
+        return self._embed_queries([query])[0]
 
-        # Use first chunk's embedding as representative
-        source_embedding = store_results["embeddings"][0]
+    def _embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """Embed queries in one batch, reusing cached embeddings.
 
-        # Search for similar (get extra to filter out source)
-        results = self.store.search(
-            query_embedding=source_embedding,
-            n_results=n_results + 10,  # Get extra to filter
-        )
+        The cache holds model embeddings, so it stays valid when the
+        projection changes.
+        """
+        model = self.embedder.model_name
+        embeddings = self.query_cache.get_many(model, queries)
+        missing = [query for query in dict.fromkeys(queries) if query not in embeddings]
+        if missing:
+            new = dict(zip(missing, self.embedder.embed(missing)))
+            self.query_cache.put_many(model, new)
+            embeddings.update(new)
+
+        vectors = [embeddings[query] for query in queries]
+        if self.projection is not None:
+            vectors = self.projection.apply(vectors).tolist()
+        return vectors
+
+    def _hybrid_search(
+        self,
+        query: str,
+        n_results: int,
+        where: dict[str, Any] | None,
+        query_embedding: list[float] = None,
+        hydrate_text: bool = True,
+        with_embeddings: bool = False,
+    ) -> list[SearchResult]:
+        """Fuse vector and BM25 rankings with reciprocal rank fusion.
+
+        Both searches run concurrently and return HYBRID_CANDIDATES results
+        each (see fuse_rankings). The query is embedded on the vector
+        search's thread unless its embedding is given. with_embeddings
+        returns vectors for the results found by the vector search.
+        """
+        candidates = max(n_results, HYBRID_CANDIDATES)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            vector = executor.submit(
+                lambda: self.store.search(
+                    query_embedding or self._embed_query(query),
+                    candidates,
+                    where,
+                    hydrate_text=False,
+                    with_embeddings=with_embeddings,
+                )
+            )
+            lexical = executor.submit(
+                self.store.lexical_search, query, candidates, where, hydrate_text=False
+            )
+            rankings = [vector.result(), lexical.result()]
 
-        # Filter out results from same source and deduplicate by source
-        seen_sources = {source_path}
-        filtered_results = []
+        results = fuse_rankings(rankings, n_results)
+
+        if hydrate_text:
+            # Only the fused results need their full text
+            hydrate([result.chunk for result in results])
+        return results
+
+    def _grouped_search(
+        self,
+        query: str,
+        n_results: int,
+        where: dict[str, Any] | None,
+        mode: str,
+        aggregate: str,
+        chunks_per_document: int,
+    ) -> list[SearchResult]:
+        """Search for n_results distinct documents.
+
+        Chunk hits are fetched GROUP_OVERFETCH per requested document and
+        the fetch doubles while fewer distinct documents turn up and the
+        store has more hits. Only the returned chunks are hydrated.
+        """
+        query_embedding = self._embed_query(query)
+        fetch = n_results * GROUP_OVERFETCH
+        while True:
+            if mode == "hybrid":
+                hits = self._hybrid_search(
+                    query, fetch, where, query_embedding, hydrate_text=False
+                )
+            else:
+                hits = self.store.search(query_embedding, fetch, where, hydrate_text=False)
+
+            # Hits are sorted, so each group is too
+            groups: dict[str, list[SearchResult]] = {}
+            for hit in hits:
+                groups.setdefault(hit.chunk.source_path, []).append(hit)
+            exhausted = len(hits) < fetch or fetch >= GROUP_MAX_FETCH
+            if len(groups) >= n_results or exhausted:
+                break
+            fetch = min(fetch * 2, GROUP_MAX_FETCH)
+
+        results = _top_documents(groups, n_results, aggregate, chunks_per_document)
+        hydrate([r.chunk for best in results for r in [best, *best.other_chunks]])
+        return results
+
+    def _expand(self, results: list[SearchResult], expand: int) -> None:
+        """Merge each result's chunk with its neighbors into a passage.
+
+        The neighbors of all results are fetched in one batch. A passage
+        ends early at a neighbor missing from the store.
+
+        Args:
+            results: Search results (updated in place)
+            expand: Neighboring chunks to add on each side
+        """
+        ids = set()
+        for result in results:
+            chunk = result.chunk
+            first = max(0, chunk.chunk_index - expand)
+            last = min(chunk.total_chunks - 1, chunk.chunk_index + expand)
+            ids.update(
+                f"{chunk.source_path}::{index}"
+                for index in range(first, last + 1)
+                if index != chunk.chunk_index
+            )
+        neighbors = self.store.get_chunks(sorted(ids)) if ids else {}
 
         for result in results:
-            if result.chunk.source_path not in seen_sources:
-                seen_sources.add(result.chunk.source_path)
-                filtered_results.append(result)
-                if len(filtered_results) >= n_results:
-                    break
+            chunk = result.chunk
+            passage = [chunk]
+            for step in (-1, 1):
+                for offset in range(1, expand + 1):
+                    neighbor = neighbors.get(
+                        f"{chunk.source_path}::{chunk.chunk_index + step * offset}"
+                    )
+                    if neighbor is None:
+                        break
+                    if step < 0:
+                        passage.insert(0, neighbor)
+                    else:
+                        passage.append(neighbor)
+            result.context = merge_chunks(passage)
+            result.context_chunks = [part.chunk_index for part in passage]
+
+    def _alias_filter(self, where_filter: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Widen a filter to the owners of deduplicated copies matching it.
+
+        A copy has no chunks of its own and its owner's chunks carry the
+        owner's type and date, so a copy in another folder would never match
+        a filtered search. Its own fields are matched here instead, and the
+        chunks of the owners of matching copies are searched too.
+        """
+        if not where_filter:
+            return where_filter
+        predicate = compile_where(where_filter)
+        owners = sorted(
+            {
+                owner
+                for path, (owner, fields) in self.indexer.get_alias_fields().items()
+                if predicate({**fields, "source_path": path})
+            }
+        )
+        if not owners:
+            return where_filter
+        return {"$or": [where_filter, {"source_path": {"$in": owners}}]}
+
+    def _attach_aliases(
+        self, results: list[SearchResult], where_filter: dict[str, Any] = None
+    ) -> list[SearchResult]:
+        """List the other paths holding each result's (deduplicated) content.
 
-        return filtered_results
+        Results found only through a copy matching where_filter (see
+        _alias_filter) are reported under that copy's path and fields, with
+        the owner listed in also_in.
+
+        Args:
+            results: Search results (updated in place)
+            where_filter: Filter of the search, before widening
+
+        Returns:
+            The results
+        """
+        alias_fields = self.indexer.get_alias_fields()
+        if not alias_fields:
+            return results
+
+        aliases: dict[str, list[str]] = {}
+        for path, (owner, _) in alias_fields.items():
+            aliases.setdefault(owner, []).append(path)
+        predicate = compile_where(where_filter)
+
+        for i, result in enumerate(results):
+            owner = result.chunk.source_path
+            copies = aliases.get(owner, [])
+            if predicate({**result.chunk.metadata, "source_path": owner}):
+                result.also_in = copies
+                continue
+            matching = [
+                path
+                for path in copies
+                if predicate({**alias_fields[path][1], "source_path": path})
+            ]
+            if matching:
+                copy = _as_copy(result, matching[0], alias_fields[matching[0]][1])
+                copy.also_in = [owner, *(path for path in copies if path != matching[0])]
+                results[i] = copy
+        return results
+
+    def get_similar(
+        self, source_path: str, n_results: int = 5
+    ) -> list[SearchResult]:
+        """Find documents similar to given source.
+
+        Args:
+            source_path: Path to source document
+            n_results: Number of similar documents to return
+
+        Returns:
+            List of similar documents (excluding source)
+        """
+        # Identical copies reuse another path's chunks
+        status = self.indexer.get_status(source_path)
+        owner = status.shared_with if status and status.shared_with else source_path
+
+        # One lookup over the document vectors; the owner is excluded
+        results = self.store.similar_documents(owner, n_results=n_results)
+        return self._attach_aliases(results)
 
     def _build_filter(
-        self, conversation_type: str = None, date_range: str = None
+        self,
+        conversation_type: str = None,
+        date_range: str = None,
+        date_from: str = None,
+        date_to: str = None,
     ) -> dict[str, Any] | None:
-        """Build ChromaDB filter from parameters.
+        """Build a metadata filter from parameters.
+
+        Filters match the structured fields stored with each chunk at
+        ingest time (see Indexer.filter_fields).
 
         Args:
             conversation_type: Filter by type (e.g., "brainstorm")
-            date_range: Filter by date (YYYY-MM or YYYY-MM-DD)
+            date_range: Filter by date (YYYY, YYYY-MM or YYYY-MM-DD)
+            date_from: Earliest date, inclusive (YYYY, YYYY-MM or YYYY-MM-DD)
+            date_to: Latest date, inclusive (YYYY, YYYY-MM or YYYY-MM-DD)
 
         Returns:
-            ChromaDB where filter or None
+            Where filter or None
         """
         conditions = []
 
         if conversation_type:
-            # Filter by path containing conversation type
-            conditions.append(
-                {"source_path": {"$contains": f"/{conversation_type}/"}}
-            )
+            conditions.append({"conversation_type": conversation_type})
 
         if date_range:
-            # Filter by date in path
-            conditions.append({"source_path": {"$contains": f"/{date_range}"}})
+            first, last = _date_bounds(date_range)
+            if first == last:
+                conditions.append({"conversation_date": first})
+            else:
+                conditions.append({"conversation_date": {"$gte": first}})
+                conditions.append({"conversation_date": {"$lte": last}})
+
+        if date_from:
+            conditions.append({"conversation_date": {"$gte": _date_bounds(date_from)[0]}})
+
+        if date_to:
+            conditions.append({"conversation_date": {"$lte": _date_bounds(date_to)[1]}})
 
         if not conditions:
             return None
@@ -155,7 +750,10 @@ class Retriever:
 
             output += f"{i}. **{conv_name}** (score: {score_pct}%)\n"
             output += f"   {text}\n"
-            output += f"   Source: {result.chunk.source_path}\n\n"
+            output += f"   Source: {result.chunk.source_path}\n"
+            for path in result.also_in:
+                output += f"   Also in: {path}\n"
+            output += "\n"
 
         return output
 
@@ -168,13 +766,223 @@ class Retriever:
         Returns:
             List of dictionaries
         """
-        return [
-            {
+        formatted = []
+        for result in results:
+            entry = {
                 "conversation": result.conversation_name,
                 "score": result.score,
                 "text": result.chunk.text,
                 "source_path": result.chunk.source_path,
                 "chunk_index": result.chunk.chunk_index,
+                "also_in": result.also_in,
             }
-            for result in results
+            if result.rerank_score is not None:
+                entry["rerank_score"] = result.rerank_score
+            if result.context is not None:
+                entry["context"] = result.context
+                entry["context_chunks"] = result.context_chunks
+            if result.other_chunks:
+                # Document-grouped search: the group's next best chunks
+                entry["other_chunks"] = [
+                    {
+                        "score": other.score,
+                        "text": other.chunk.text,
+                        "chunk_index": other.chunk.chunk_index,
+                    }
+                    for other in result.other_chunks
+                ]
+            formatted.append(entry)
+        return formatted
+
+
+def _as_copy(result: SearchResult, path: str, fields: dict[str, Any]) -> SearchResult:
+    """Present a result (and its grouped chunks) under a deduplicated copy."""
+    chunk = replace(
+        result.chunk, source_path=path, metadata={**result.chunk.metadata, **fields}
+    )
+    return replace(
+        result,
+        chunk=chunk,
+        other_chunks=[_as_copy(other, path, fields) for other in result.other_chunks],
+    )
+
+
+def fuse_rankings(
+    rankings: list[list[SearchResult]], n_results: int
+) -> list[SearchResult]:
+    """Merge rankings with reciprocal rank fusion.
+
+    A chunk scores sum(1 / (RRF_K + rank)) over the rankings it appears
+    in, reported relative to the best possible score (first in every
+    ranking = 1.0). The input results are left unchanged.
+
+    Args:
+        rankings: Result lists, best first
+        n_results: Maximum number of fused results
+
+    Returns:
+        Fused results, best first
+    """
+    fused: dict[str, list] = {}
+    for ranking in rankings:
+        for rank, result in enumerate(ranking, 1):
+            entry = fused.setdefault(result.chunk.chunk_id, [0.0, result])
+            entry[0] += 1.0 / (RRF_K + rank)
+
+    best = len(rankings) / (RRF_K + 1)
+    return [
+        replace(result, score=score / best)
+        for score, result in sorted(fused.values(), key=lambda e: e[0], reverse=True)[
+            :n_results
         ]
+    ]
+
+
+def merge_chunks(chunks: list[Chunk]) -> str:
+    """Join consecutive chunks of a document into one passage.
+
+    Neighboring chunks overlap by a few words. The words a chunk shares
+    with the previous one, known from their ``start_word``/``end_word``
+    ranges, are dropped. Chunks whose text does not match their ranges
+    (e.g. a stored preview of a changed file) are joined with an ellipsis.
+
+    Args:
+        chunks: Chunks of one document, in chunk order
+
+    Returns:
+        Passage text
+    """
+    words = chunks[0].text.split()
+    for previous, chunk in zip(chunks, chunks[1:]):
+        chunk_words = chunk.text.split()
+        try:
+            overlap = int(previous.metadata["end_word"]) - int(chunk.metadata["start_word"])
+        except KeyError:
+            overlap = -1
+        if 0 < overlap <= len(chunk_words) and words[-overlap:] == chunk_words[:overlap]:
+            words.extend(chunk_words[overlap:])
+        elif overlap == 0:
+            words.extend(chunk_words)
+        else:
+            words.extend(["…", *chunk_words])
+    return " ".join(words)
+
+
+def maximal_marginal_relevance(
+    relevance: np.ndarray, vectors: np.ndarray, k: int, diversity: float
+) -> list[int]:
+    """Select k candidates balancing relevance against redundancy.
+
+    Each pick maximizes ``(1 - diversity) * relevance - diversity * s``,
+    where s is the candidate's highest cosine similarity to the picks so
+    far. Similarities come from one matrix product; each pick updates the
+    running maxima with one vectorized row operation.
+
+    Args:
+        relevance: Relevance score of each candidate, shape (n,)
+        vectors: Candidate vectors, shape (n, dim)
+        k: Number of candidates to select
+        diversity: 0 keeps the relevance order, 1 only avoids redundancy
+
+    Returns:
+        Indices of the selected candidates, in selection order
+    """
+    n = len(relevance)
+    k = min(k, n)
+    if k == 0:
+        return []
+
+    unit = normalize(np.asarray(vectors, dtype=np.float32))
+    similarity = unit @ unit.T
+    weighted = (1.0 - diversity) * np.asarray(relevance, dtype=np.float32)
+
+    # Nothing is selected yet: the first pick is the most relevant
+    redundancy = np.zeros(n, dtype=np.float32)
+    available = np.ones(n, dtype=bool)
+    selected = []
+    for _ in range(k):
+        scores = np.where(available, weighted - diversity * redundancy, -np.inf)
+        pick = int(np.argmax(scores))
+        selected.append(pick)
+        available[pick] = False
+        np.maximum(redundancy, similarity[pick], out=redundancy)
+    return selected
+
+
+def _top_documents(
+    groups: dict[str, list[SearchResult]],
+    n_results: int,
+    aggregate: str,
+    chunks_per_document: int,
+) -> list[SearchResult]:
+    """Best documents of grouped chunk hits (each group sorted best first).
+
+    Each document is its best chunk, scored by the aggregate of its chunk
+    scores, with the next best chunks in other_chunks.
+    """
+    scored = sorted(
+        (
+            (_aggregate([hit.score for hit in group], aggregate), group)
+            for group in groups.values()
+        ),
+        key=lambda entry: entry[0],
+        reverse=True,
+    )[:n_results]
+    return [
+        replace(group[0], score=score, other_chunks=group[1:chunks_per_document])
+        for score, group in scored
+    ]
+
+
+def _in_background(function: Callable[[], Any]) -> Future:
+    """Run a function on a daemon thread, which a CLI process does not wait for."""
+    future: Future = Future()
+
+    def run() -> None:
+        try:
+            future.set_result(function())
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def _aggregate(scores: list[float], aggregate: str) -> float:
+    """Document score from its chunk scores (best first)."""
+    if aggregate == "softmax":
+        # Softmax-weighted mean, shifted by the max for stability. It never
+        # exceeds the best score, and the weak hits a deeper fetch adds get
+        # negligible weight, so the score does not depend on fetch depth.
+        best = scores[0]
+        weights = [math.exp((score - best) / SOFTMAX_TEMPERATURE) for score in scores]
+        return sum(w * score for w, score in zip(weights, scores)) / sum(weights)
+    return scores[0]
+
+
+def _date_bounds(value: str) -> tuple[int, int]:
+    """First and last yyyymmdd integers covered by a YYYY[-MM[-DD]] date.
+
+    Raises:
+        ValueError: If the date is not in one of the supported formats or
+            names a day that does not exist (e.g. 2025-02-30)
+    """
+    parts = value.strip().split("-")
+    if not (1 <= len(parts) <= 3) or not all(p.isdigit() for p in parts):
+        raise ValueError(f"Invalid date: {value} (use YYYY, YYYY-MM or YYYY-MM-DD)")
+
+    year = int(parts[0])
+    first_month, last_month = (int(parts[1]),) * 2 if len(parts) > 1 else (1, 12)
+
+    try:
+        if len(parts) > 2:
+            start = end = date(year, first_month, int(parts[2]))
+        else:
+            start = date(year, first_month, 1)
+            end = date(year, last_month, calendar.monthrange(year, last_month)[1])
+    except ValueError:
+        raise ValueError(f"Invalid date: {value} (no such date)") from None
+
+    first = start.year * 10000 + start.month * 100 + start.day
+    last = end.year * 10000 + end.month * 100 + end.day
+    return first, last
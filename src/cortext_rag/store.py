@@ -1,55 +1,339 @@
-"""Vector store using ChromaDB."""
+"""Vector store with pluggable storage backends."""
 
+import heapq
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
+import numpy as np
+
+from .ann import IVFIndex
+from .backends import backend_path, create_backend
+from .backends.numpy_flat import normalize
+from .config import RAGConfig, load_conversation_types
+from .hydration import hydrate, is_lazy, preview
+from .lexical import LexicalIndex, tokenize
+from .locking import write_text_atomic
 from .models import Chunk, SearchResult
 
+COLLECTION_NAME = "cortext_chunks"
+
+# One vector per source document, for document-level similarity
+DOCUMENT_COLLECTION = "cortext_documents"
+
+# Document vectors are recomputed here and then swapped in
+DOCUMENT_REBUILD_COLLECTION = f"{DOCUMENT_COLLECTION}__rebuild"
+
+# Document vector metadata: total chunk weight (words) and the norm of the
+# weighted sum, so later batches of a streamed file can be folded in
+DOC_WEIGHT = "doc_weight"
+DOC_NORM = "doc_norm"
+
+# Shard for chunks outside any conversation type folder
+OTHER_SHARD = "_other"
+
+# Maximum number of shards searched concurrently
+MAX_SEARCH_WORKERS = 8
+
+# Stored entries read per batch when training an IVF index or rebuilding
+# the keyword index and document vectors
+ANN_TRAIN_BATCH = 10_000
+
+# IVF candidates fetched per requested result when a filter may reject some
+ANN_FILTER_OVERSAMPLE = 10
+
+# Runs of rows at random offsets a shard's share of a sample is read in
+SAMPLE_WINDOWS = 256
+
+# File in the store directory holding its index generation
+GENERATION_FILE = "generation"
+
+# Suffix of cold-tier shard names; "::" never occurs in conversation types
+COLD_SUFFIX = "::cold"
+
+# File in the store directory listing archived conversation paths
+ARCHIVE_FILE = "archived.json"
+
+
+def _cold_shard(shard: str | None) -> str:
+    """Cold-tier counterpart of a hot shard."""
+    return f"{shard or ''}{COLD_SUFFIX}"
+
+
+def _is_cold(shard: str | None) -> bool:
+    """Whether a shard belongs to the cold tier."""
+    return shard is not None and shard.endswith(COLD_SUFFIX)
+
+
+def _shard_collection(shard: str | None) -> str:
+    """Collection name of a shard (None = the unsharded collection)."""
+    if _is_cold(shard):
+        return f"{_shard_collection(shard[: -len(COLD_SUFFIX)] or None)}__cold"
+    if shard is None:
+        return COLLECTION_NAME
+    slug = re.sub(r"[^a-zA-Z0-9._-]+", "-", shard).strip("-.") or "type"
+    return f"{COLLECTION_NAME}__{slug}"
+
+
+def _filter_type(where: dict[str, Any] | None) -> str | None:
+    """Conversation type a where filter pins with an equality, if any."""
+    if not where:
+        return None
+    conditions = where.get("$and", [where])
+    for condition in conditions:
+        value = condition.get("conversation_type")
+        if isinstance(value, dict):
+            value = value.get("$eq")
+        if isinstance(value, str):
+            return value
+    return None
+
+
+def _filter_earliest_date(where: dict[str, Any] | None) -> int | None:
+    """Earliest conversation date a where filter admits.
+
+    Returns None without a conversation_date condition and 0 when the
+    conditions set no lower bound.
+    """
+    if not where:
+        return None
+    bounds = []
+    for condition in where.get("$and", [where]):
+        if "conversation_date" not in condition:
+            continue
+        value = condition["conversation_date"]
+        if not isinstance(value, dict):
+            bounds.append(int(value))
+        elif "$eq" in value:
+            bounds.append(int(value["$eq"]))
+        elif "$gte" in value or "$gt" in value:
+            bounds.append(int(value.get("$gte", value.get("$gt"))))
+        else:
+            bounds.append(0)
+    # Conditions are combined with AND: the tightest bound applies
+    return max(bounds) if bounds else None
+
+
+def _chunk_weight(metadata: dict[str, Any], text: str) -> float:
+    """Weight of a chunk in its document vector: its number of words."""
+    if "start_word" in metadata and "end_word" in metadata:
+        return float(int(metadata["end_word"]) - int(metadata["start_word"]))
+    return float(len(text.split()))
+
+
+def _to_results(candidates: list[tuple]) -> list[SearchResult]:
+    """Convert (score, document, metadata[, embedding]) entries to SearchResult objects."""
+    search_results = []
+    for score, text, metadata, *embedding in candidates:
+        chunk = Chunk(
+            text=text,
+            source_path=metadata.get("source_path", ""),
+            chunk_index=int(metadata.get("chunk_index", 0)),
+            total_chunks=int(metadata.get("total_chunks", 1)),
+            metadata={
+                k: v
+                for k, v in metadata.items()
+                if k not in ["source_path", "chunk_index", "total_chunks"]
+            },
+        )
+
+        search_results.append(
+            SearchResult(
+                chunk=chunk, score=score, embedding=embedding[0] if embedding else None
+            )
+        )
+    return search_results
+
 
 class VectorStore:
-    """Persistent vector store using ChromaDB."""
+    """Persistent vector store for document chunks.
+
+    Storage is delegated to the backend selected by the workspace RAG
+    configuration (ChromaDB by default). With ``shard_by_type`` enabled,
+    each conversation type gets its own collection: type-filtered searches
+    touch one shard and unfiltered searches fan out across all of them.
+    Shards with a trained IVF index of at least ``ann_threshold`` vectors
+    are searched through it instead (see build_ann). With ``lazy_text``,
+    text-file chunks are stored as previews and read from the workspace
+    files for search results (see cortext_rag.hydration).
+
+    Next to the chunks, a compact collection holds one vector per source
+    document: the length-weighted mean of its chunk vectors, kept up to date
+    as chunks are added and removed (see similar_documents).
+
+    With ``tiering``, every shard has a cold counterpart holding the chunks
+    of archived conversations and of those dated more than ``hot_days``
+    ago. Searches query the small hot tier first and the cold tier only
+    when the hot results are weak or the date filter reaches past the hot
+    window. With the numpy backend, hot shards are read into memory.
 
-    def __init__(self, workspace_path: Path = None):
+    Every write bumps the store's generation, a counter that lets caches
+    tell whether results were computed from the current contents.
+    """
+
+    def __init__(self, workspace_path: Path = None, config: RAGConfig = None):
         """Initialize vector store.
 
         Args:
             workspace_path: Path to workspace root
+            config: RAG settings (loaded from the workspace if omitted)
         """
         self.workspace_path = Path(workspace_path or Path.cwd())
-        self.db_path = self.workspace_path / ".workspace" / "embeddings" / "chroma"
-        self._client = None
-        self._collection = None
-
-    def _ensure_client(self) -> None:
-        """Ensure ChromaDB client is initialized."""
-        if self._client is not None:
-            return
+        self.config = config or RAGConfig.load(self.workspace_path)
+        self.db_path = backend_path(self.workspace_path, self.config.backend)
+        self._backends: dict[str | None, Any] = {}
+        self._anns: dict[str | None, IVFIndex] = {}
+        self._documents = None
+        # Keyword index over all shards, for hybrid search
+        self.lexical = LexicalIndex(self.db_path)
 
+    @property
+    def generation(self) -> int:
+        """Index generation: increases after every write to the store."""
         try:
-            import chromadb
-        except ImportError:
-            raise ImportError(
-                "chromadb not installed. "
-                "Install with: pip install cortext-workspace[rag]"
+            return int((self.db_path / GENERATION_FILE).read_text())
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def _bump_generation(self) -> None:
+        """Record a completed write.
+
+        Called after the write, so results computed while it ran are
+        cached under the old generation and never served afterwards.
+        """
+        write_text_atomic(self.db_path / GENERATION_FILE, str(self.generation + 1))
+
+    def _backend_for(self, shard: str | None):
+        """Get the backend of a shard, creating it on first use."""
+        backend = self._backends.get(shard)
+        if backend is None:
+            options = self._backend_options()
+            if self.config.backend == "numpy" and self.config.tiering and not _is_cold(shard):
+                options["in_memory"] = True
+            backend = create_backend(
+                self.config.backend,
+                self.db_path,
+                _shard_collection(shard),
+                **options,
             )
+            self._backends[shard] = backend
+        return backend
 
-        # Create database directory
-        self.db_path.mkdir(parents=True, exist_ok=True)
+    def _ann_for(self, shard: str | None) -> IVFIndex:
+        """Get the IVF index of a shard (untrained until build_ann)."""
+        ann = self._anns.get(shard)
+        if ann is None:
+            ann = IVFIndex(self.db_path / "ivf" / _shard_collection(shard))
+            self._anns[shard] = ann
+        return ann
 
-        # Initialize persistent client
-        self._client = chromadb.PersistentClient(path=str(self.db_path))
+    def _uses_ann(self, shard: str | None) -> bool:
+        """Whether searches of a shard go through its IVF index."""
+        ann = self._ann_for(shard)
+        return ann.exists and ann.count >= self.config.ann_threshold
 
-        # Get or create collection
-        self._collection = self._client.get_or_create_collection(
-            name="cortext_chunks",
-            metadata={"description": "Cortext workspace document chunks"},
-        )
+    def _backend_options(self) -> dict[str, Any]:
+        """Backend-specific settings from the RAG configuration."""
+        if self.config.backend == "numpy":
+            return {
+                "quantization": self.config.quantization,
+                "oversample": self.config.quantization_oversample,
+            }
+        return {
+            "space": self.config.distance,
+            "hnsw_m": self.config.hnsw_m,
+            "construction_ef": self.config.hnsw_construction_ef,
+            "search_ef": self.config.hnsw_search_ef,
+        }
+
+    @property
+    def documents(self):
+        """Backend of the document vector collection (not sharded)."""
+        if self._documents is None:
+            self._documents = create_backend(
+                self.config.backend,
+                self.db_path,
+                DOCUMENT_COLLECTION,
+                **self._backend_options(),
+            )
+        return self._documents
+
+    @property
+    def backend(self):
+        """Get the storage backend (the first shard when sharded)."""
+        return self._backend_for(self.shards[0])
 
     @property
     def collection(self):
-        """Get the ChromaDB collection."""
-        self._ensure_client()
-        return self._collection
+        """Get the underlying collection (the backend itself)."""
+        return self.backend
+
+    @property
+    def _hot_shards(self) -> list[str | None]:
+        """Shard names of the hot tier (all shards without tiering)."""
+        if not self.config.shard_by_type:
+            return [None]
+        return [*load_conversation_types(self.workspace_path), OTHER_SHARD]
+
+    @property
+    def shards(self) -> list[str | None]:
+        """Shard names: conversation types plus OTHER_SHARD, or [None].
+
+        With tiering, followed by the cold counterpart of each.
+        """
+        if not self.config.tiering:
+            return self._hot_shards
+        return [*self._hot_shards, *map(_cold_shard, self._hot_shards)]
+
+    @property
+    def hot_cutoff(self) -> int:
+        """Earliest conversation date (yyyymmdd) kept in the hot tier."""
+        cutoff = date.today() - timedelta(days=self.config.hot_days)
+        return int(cutoff.strftime("%Y%m%d"))
+
+    def _shard_of(self, metadata: dict[str, Any]) -> str | None:
+        """Shard a chunk belongs to."""
+        shard = None
+        if self.config.shard_by_type:
+            shard = metadata.get("conversation_type") or OTHER_SHARD
+        if not self.config.tiering:
+            return shard
+        cutoff = self.hot_cutoff
+        if (
+            metadata.get("archived") is True
+            or metadata.get("status") == "archived"
+            or int(metadata.get("conversation_date", cutoff)) < cutoff
+        ):
+            return _cold_shard(shard)
+        return shard
+
+    def _shards_for(self, where: dict[str, Any] | None) -> list[str | None]:
+        """Shards that can hold chunks matching a filter."""
+        conversation_type = _filter_type(where) if self.config.shard_by_type else None
+        if not conversation_type:
+            return self.shards
+        if self.config.tiering:
+            return [conversation_type, _cold_shard(conversation_type)]
+        return [conversation_type]
+
+    @property
+    def archived_paths(self) -> list[str]:
+        """Conversation paths archived with archive()."""
+        try:
+            return json.loads((self.db_path / ARCHIVE_FILE).read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+
+    def _is_archived(self, source_path: str, archived_paths: list[str]) -> bool:
+        """Whether a source lies in one of the archived paths."""
+        return any(
+            source_path == path or source_path.startswith(path + os.sep)
+            for path in archived_paths
+        )
 
     def add_chunks(
         self,
@@ -67,28 +351,220 @@ class VectorStore:
         if not chunks:
             return
 
-        self._ensure_client()
-
-        # Prepare data for ChromaDB
         ids = [chunk.chunk_id for chunk in chunks]
-        documents = [chunk.text for chunk in chunks]
+        # Archived conversations stay cold when they are embedded again
+        archived = self._is_archived(source_path, self.archived_paths)
+        documents = [
+            preview(chunk.text)
+            if self.config.lazy_text and is_lazy(chunk.metadata)
+            else chunk.text
+            for chunk in chunks
+        ]
         metadatas = [
             {
                 "source_path": chunk.source_path,
                 "chunk_index": chunk.chunk_index,
                 "total_chunks": chunk.total_chunks,
-                **{k: str(v) for k, v in chunk.metadata.items()},
+                # Keep numbers and flags typed so range filters work
+                **{
+                    k: v if isinstance(v, (str, int, float, bool)) else str(v)
+                    for k, v in chunk.metadata.items()
+                },
+                **({"archived": True} if archived else {}),
             }
             for chunk in chunks
         ]
 
-        # Add to collection
-        self.collection.add(
-            ids=ids,
-            embeddings=embeddings,
-            documents=documents,
-            metadatas=metadatas,
+        self._add(ids, embeddings, documents, metadatas)
+        self.lexical.add(
+            ids, [chunk.source_path for chunk in chunks], [chunk.text for chunk in chunks]
+        )
+        self._update_documents(embeddings, documents, metadatas)
+        self._bump_generation()
+
+    def _update_documents(
+        self,
+        embeddings: list[list[float]],
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+        collection=None,
+    ) -> None:
+        """Fold chunks into the document vectors of their sources.
+
+        A document vector is the direction of the word-count weighted sum of
+        its (normalized) chunk vectors. Its entry carries the text and
+        metadata of the document's first chunk, so similar documents are
+        reported like chunk results.
+
+        ``collection`` is the document collection to update (default: the
+        live one).
+        """
+        collection = self.documents if collection is None else collection
+        vectors = normalize(np.asarray(embeddings, dtype=np.float32))
+        by_source: dict[str, list[int]] = {}
+        for i, metadata in enumerate(metadatas):
+            by_source.setdefault(metadata["source_path"], []).append(i)
+
+        stored = collection.get(
+            ids=list(by_source), include=["embeddings", "documents", "metadatas"]
         )
+        current = {
+            id_: (embedding, document, metadata)
+            for id_, embedding, document, metadata in zip(
+                stored["ids"], stored["embeddings"], stored["documents"], stored["metadatas"]
+            )
+        }
+
+        ids, sums, entry_documents, entry_metadatas = [], [], [], []
+        for source_path, rows in by_source.items():
+            weights = np.array(
+                [_chunk_weight(metadatas[i], documents[i]) for i in rows], dtype=np.float32
+            )
+            total = weights @ vectors[rows]
+            weight = float(weights.sum())
+            first = min(rows, key=lambda i: int(metadatas[i].get("chunk_index", 0)))
+            document, metadata = documents[first], metadatas[first]
+
+            if source_path in current:
+                # Earlier batch of a streamed file
+                embedding, prior_document, prior_metadata = current[source_path]
+                total = total + np.asarray(embedding, dtype=np.float32) * prior_metadata[DOC_NORM]
+                weight += prior_metadata[DOC_WEIGHT]
+                if int(prior_metadata.get("chunk_index", 0)) < int(metadata.get("chunk_index", 0)):
+                    document, metadata = prior_document, prior_metadata
+
+            norm = float(np.linalg.norm(total))
+            ids.append(source_path)
+            sums.append((total / norm if norm else total).tolist())
+            entry_documents.append(document)
+            entry_metadatas.append({**metadata, DOC_WEIGHT: weight, DOC_NORM: norm})
+
+        collection.add(
+            ids=ids, embeddings=sums, documents=entry_documents, metadatas=entry_metadatas
+        )
+
+    def _build_documents(
+        self, shards: list[str | None], collection, where: dict[str, Any] = None
+    ) -> None:
+        """Compute the document vectors of the sources stored in shards."""
+        for shard in shards:
+            backend = self._backend_for(shard)
+            offset = 0
+            while True:
+                batch = backend.get(
+                    where=where,
+                    include=["embeddings", "documents", "metadatas"],
+                    limit=ANN_TRAIN_BATCH,
+                    offset=offset,
+                )
+                if not batch["ids"]:
+                    break
+                offset += len(batch["ids"])
+                self._update_documents(
+                    batch["embeddings"], batch["documents"], batch["metadatas"], collection
+                )
+
+    def _rebuild_documents(
+        self, shards: list[str | None], conversation_type: str = None
+    ) -> None:
+        """Recompute document vectors in a side collection and swap it in.
+
+        Similarity searches keep using the previous document vectors until
+        the swap. With a conversation type, only its documents are
+        recomputed and the others are copied over unchanged.
+        """
+        building = create_backend(
+            self.config.backend,
+            self.db_path,
+            DOCUMENT_REBUILD_COLLECTION,
+            **self._backend_options(),
+        )
+        # Leftover of an interrupted rebuild
+        building.clear()
+
+        where = None
+        if conversation_type is not None:
+            where = {"conversation_type": conversation_type}
+            offset = 0
+            while True:
+                batch = self.documents.get(
+                    include=["embeddings", "documents", "metadatas"],
+                    limit=ANN_TRAIN_BATCH,
+                    offset=offset,
+                )
+                if not batch["ids"]:
+                    break
+                offset += len(batch["ids"])
+                keep = [
+                    i
+                    for i, metadata in enumerate(batch["metadatas"])
+                    if metadata.get("conversation_type") != conversation_type
+                ]
+                if keep:
+                    building.add(
+                        ids=[batch["ids"][i] for i in keep],
+                        embeddings=[batch["embeddings"][i] for i in keep],
+                        documents=[batch["documents"][i] for i in keep],
+                        metadatas=[batch["metadatas"][i] for i in keep],
+                    )
+
+        self._build_documents(shards, building, where)
+        self.documents.swap_in(building)
+
+    def _add(
+        self,
+        ids: list[str],
+        embeddings: list[list[float]],
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        """Add entries, routing each to its shard."""
+        by_shard: dict[str | None, list[int]] = {}
+        for i, metadata in enumerate(metadatas):
+            by_shard.setdefault(self._shard_of(metadata), []).append(i)
+
+        for shard, rows in by_shard.items():
+            shard_ids = [ids[i] for i in rows]
+            shard_embeddings = [embeddings[i] for i in rows]
+            self._backend_for(shard).add(
+                ids=shard_ids,
+                embeddings=shard_embeddings,
+                documents=[documents[i] for i in rows],
+                metadatas=[metadatas[i] for i in rows],
+            )
+            ann = self._ann_for(shard)
+            if ann.exists:
+                ann.add(shard_ids, shard_embeddings)
+
+    def _delete(
+        self, shard: str | None, where: dict[str, Any], lexical: bool = True
+    ) -> None:
+        """Delete matching entries from a shard, its IVF index and the keyword index."""
+        backend = self._backend_for(shard)
+        ann = self._ann_for(shard)
+        lexical = lexical and self.lexical.exists
+        if not ann.exists and not lexical:
+            backend.delete(where=where)
+            return
+
+        ids = backend.get(where=where, include=[])["ids"]
+        if ids:
+            backend.delete(ids=ids)
+            if ann.exists:
+                ann.remove(ids)
+            if lexical:
+                self.lexical.delete(ids)
+
+    def _get_source(self, source_path: str, include: list[str]) -> dict[str, Any]:
+        """Fetch all stored entries of a source, across shards."""
+        merged: dict[str, list] = {"ids": [], **{key: [] for key in include}}
+        for shard in self.shards:
+            results = self._backend_for(shard).get(
+                where={"source_path": source_path}, include=include
+            )
+            for key in merged:
+                merged[key].extend(results[key] or [])
+        return merged
 
     def update_chunks(
         self,
@@ -117,19 +593,184 @@ class VectorStore:
         Args:
             source_path: Source document path
         """
-        self._ensure_client()
+        # A moved file may have left chunks in another type's shard
+        for shard in self.shards:
+            self._delete(shard, {"source_path": source_path})
+        self.documents.delete(ids=[source_path])
+        self._bump_generation()
+
+    def reassign_source(
+        self, source_path: str, new_source_path: str, fields: dict[str, Any] = None
+    ) -> None:
+        """Move all chunks of a source to another path without re-embedding.
 
-        # Query for all chunks from this source
-        results = self.collection.get(where={"source_path": source_path})
+        Args:
+            source_path: Current source document path
+            new_source_path: Path that takes over the chunks
+            fields: Filter fields of the new path (see Indexer.filter_fields)
+        """
+        results = self._get_source(
+            source_path, include=["embeddings", "documents", "metadatas"]
+        )
+        if not results["ids"]:
+            return
 
-        if results["ids"]:
-            self.collection.delete(ids=results["ids"])
+        metadatas = [
+            {**metadata, **(fields or {}), "source_path": new_source_path}
+            for metadata in results["metadatas"]
+        ]
+        ids = [
+            f"{new_source_path}::{metadata['chunk_index']}" for metadata in metadatas
+        ]
+
+        self._add(ids, results["embeddings"], results["documents"], metadatas)
+        self.lexical.rename_source(source_path, new_source_path)
+        self._set_document_fields(
+            source_path, {**(fields or {}), "source_path": new_source_path}
+        )
+        self.delete_by_source(source_path)
+
+    def set_source_fields(self, source_path: str, fields: dict[str, Any]) -> None:
+        """Set filter fields on all chunks of a source without re-embedding.
+
+        Args:
+            source_path: Source document path
+            fields: Metadata fields to add or overwrite
+        """
+        results = self._get_source(
+            source_path, include=["embeddings", "documents", "metadatas"]
+        )
+        if not results["ids"]:
+            return
+
+        metadatas = [{**metadata, **fields} for metadata in results["metadatas"]]
+        if self.config.shard_by_type or self.config.tiering:
+            # The type or tier may change, moving the chunks to another shard
+            for shard in self.shards:
+                self._delete(shard, {"source_path": source_path}, lexical=False)
+        self._add(results["ids"], results["embeddings"], results["documents"], metadatas)
+        self._set_document_fields(source_path, fields)
+        self._bump_generation()
+
+    def _set_document_fields(self, source_path: str, fields: dict[str, Any]) -> None:
+        """Copy a source's document vector with updated metadata.
+
+        The copy is stored under the ``source_path`` in fields, if given.
+        """
+        entry = self.documents.get(
+            ids=[source_path], include=["embeddings", "documents", "metadatas"]
+        )
+        if not entry["ids"]:
+            return
+        self.documents.add(
+            ids=[fields.get("source_path", source_path)],
+            embeddings=entry["embeddings"],
+            documents=entry["documents"],
+            metadatas=[{**entry["metadatas"][0], **fields}],
+        )
+
+    def archive(self, path: str) -> int:
+        """Move an archived conversation's chunks to the cold tier.
+
+        The path is remembered, so its documents stay cold when they are
+        embedded again. Without tiering the chunks are only marked
+        ``archived``.
+
+        Args:
+            path: Conversation directory or document, as in source paths
+
+        Returns:
+            Number of documents archived
+        """
+        path = str(path).rstrip(os.sep)
+        archived_paths = self.archived_paths
+        if path not in archived_paths:
+            write_text_atomic(
+                self.db_path / ARCHIVE_FILE, json.dumps(sorted([*archived_paths, path]))
+            )
+        sources = [
+            source_path
+            for source_path in self.documents.get(include=[])["ids"]
+            if self._is_archived(source_path, [path])
+        ]
+        for source_path in sources:
+            self.set_source_fields(source_path, {"archived": True})
+        return len(sources)
+
+    def retier(self) -> int:
+        """Move chunks to the tier they belong in today.
+
+        Conversations age out of the hot window over time, and changes to
+        ``tiering`` or ``hot_days`` only reach stored chunks through this
+        (e.g. from a daily job). Turning tiering off moves everything back
+        to the hot shards.
+
+        Returns:
+            Number of chunks moved
+        """
+        moved = 0
+        for shard in [*self._hot_shards, *map(_cold_shard, self._hot_shards)]:
+            backend = self._backend_for(shard)
+            ids = []
+            offset = 0
+            while True:
+                batch = backend.get(
+                    include=["metadatas"], limit=ANN_TRAIN_BATCH, offset=offset
+                )
+                if not batch["ids"]:
+                    break
+                offset += len(batch["ids"])
+                ids.extend(
+                    id_
+                    for id_, metadata in zip(batch["ids"], batch["metadatas"])
+                    if self._shard_of(metadata) != shard
+                )
+
+            ann = self._ann_for(shard)
+            for start in range(0, len(ids), ANN_TRAIN_BATCH):
+                batch = backend.get(
+                    ids=ids[start : start + ANN_TRAIN_BATCH],
+                    include=["embeddings", "documents", "metadatas"],
+                )
+                # Added before they are removed, so searches always find them
+                self._add(
+                    batch["ids"], batch["embeddings"], batch["documents"], batch["metadatas"]
+                )
+                backend.delete(ids=batch["ids"])
+                if ann.exists:
+                    ann.remove(batch["ids"])
+            moved += len(ids)
+
+        if moved:
+            self._bump_generation()
+        return moved
+
+    def get_source_embeddings(self, source_path: str) -> list[list[float]]:
+        """Get the chunk embeddings of a source document in chunk order.
+
+        Args:
+            source_path: Source document path
+
+        Returns:
+            List of embeddings (empty if the source is not stored)
+        """
+        results = self._get_source(source_path, include=["embeddings", "metadatas"])
+        if not results["ids"]:
+            return []
+
+        order = sorted(
+            range(len(results["ids"])),
+            key=lambda i: int(results["metadatas"][i].get("chunk_index", 0)),
+        )
+        return [results["embeddings"][i] for i in order]
 
     def search(
         self,
         query_embedding: list[float],
         n_results: int = 10,
         where: dict[str, Any] = None,
+        hydrate_text: bool = True,
+        with_embeddings: bool = False,
     ) -> list[SearchResult]:
         """Search for similar chunks.
 
@@ -137,82 +778,645 @@ class VectorStore:
             query_embedding: Query vector
             n_results: Maximum number of results
             where: Optional filter conditions
+            hydrate_text: Read lazily stored chunk text from the files (callers
+                that only keep some results can hydrate those themselves)
+            with_embeddings: Return the stored vector of each result
 
         Returns:
             List of SearchResult objects
         """
-        self._ensure_client()
+        return self.search_many(
+            [query_embedding], n_results, where, hydrate_text, with_embeddings
+        )[0]
+
+    def search_many(
+        self,
+        query_embeddings: list[list[float]],
+        n_results: int = 10,
+        where: dict[str, Any] = None,
+        hydrate_text: bool = True,
+        with_embeddings: bool = False,
+    ) -> list[list[SearchResult]]:
+        """Search for chunks similar to each of several queries.
+
+        Each shard receives one multi-query request (shards searched through
+        their IVF index take the queries one by one). With tiering, the cold
+        tier is then searched for the queries that need it (see _needs_cold).
+
+        Args:
+            query_embeddings: Query vectors
+            n_results: Maximum number of results per query
+            where: Optional filter conditions, shared by all queries
+            hydrate_text: Read lazily stored chunk text from the files
+            with_embeddings: Return the stored vector of each result
+
+        Returns:
+            One list of SearchResult objects per query, in query order
+        """
+        if not query_embeddings:
+            return []
+        shards = self._shards_for(where)
+        hot = [shard for shard in shards if not _is_cold(shard)]
+        cold = [shard for shard in shards if _is_cold(shard)]
+
+        candidates = self._query_shards(
+            hot, query_embeddings, n_results, where, with_embeddings
+        )
+        if cold:
+            needed = [
+                q
+                for q, ranking in enumerate(candidates)
+                if self._needs_cold(ranking, n_results, where)
+            ]
+            if needed:
+                cold_candidates = self._query_shards(
+                    cold,
+                    [query_embeddings[q] for q in needed],
+                    n_results,
+                    where,
+                    with_embeddings,
+                )
+                for q, extra in zip(needed, cold_candidates):
+                    candidates[q] = heapq.nlargest(
+                        n_results, candidates[q] + extra, key=lambda c: c[0]
+                    )
+
+        rankings = [_to_results(ranking) for ranking in candidates]
+        if hydrate_text:
+            # Read the text of lazily stored chunks, for the final results only
+            hydrate([result.chunk for ranking in rankings for result in ranking])
+        return rankings
+
+    def _needs_cold(
+        self, candidates: list[tuple], n_results: int, where: dict[str, Any] | None
+    ) -> bool:
+        """Whether a query's hot-tier candidates call for a cold-tier search.
+
+        The cold tier is searched when the hot tier cannot fill the results,
+        when its weakest result scores below cold_min_score, or when the
+        date filter admits dates before the hot window.
+        """
+        if len(candidates) < n_results:
+            return True
+        if min(c[0] for c in candidates) < self.config.cold_min_score:
+            return True
+        earliest = _filter_earliest_date(where)
+        return earliest is not None and earliest < self.hot_cutoff
+
+    def _query_shards(
+        self,
+        shards: list[str | None],
+        query_embeddings: list[list[float]],
+        n_results: int,
+        where: dict[str, Any] | None,
+        with_embeddings: bool,
+    ) -> list[list[tuple]]:
+        """Search shards and merge their top results.
+
+        Returns:
+            Per query, the best (score, document, metadata[, embedding])
+            entries, best first
+        """
+        if not shards:
+            return [[] for _ in query_embeddings]
+        include = ["documents", "metadatas"]
+        if with_embeddings:
+            include.append("embeddings")
+
+        def query_shard(shard: str | None) -> dict[str, Any]:
+            if self._uses_ann(shard):
+                per_query = [
+                    self._ann_query(shard, embedding, n_results, where, include)
+                    for embedding in query_embeddings
+                ]
+                return {
+                    key: [results[key][0] for results in per_query]
+                    for key in ("ids", "scores", *include)
+                }
+            return self._backend_for(shard).query(
+                query_embeddings=query_embeddings,
+                n_results=n_results,
+                where=where,
+                include=include,
+            )
+
+        if len(shards) == 1:
+            shard_results = [query_shard(shards[0])]
+        else:
+            # Shards are independent indexes: search them in parallel
+            workers = min(len(shards), MAX_SEARCH_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                shard_results = list(executor.map(query_shard, shards))
+
+        rankings = []
+        for q in range(len(query_embeddings)):
+            candidates = [
+                (
+                    results["scores"][q][i],
+                    results["documents"][q][i],
+                    results["metadatas"][q][i],
+                    *([results["embeddings"][q][i]] if with_embeddings else []),
+                )
+                for results in shard_results
+                if results["ids"] and results["ids"][q]
+                for i in range(len(results["ids"][q]))
+            ]
+            if len(shard_results) > 1:
+                # Merge the per-shard top-k lists
+                candidates = heapq.nlargest(n_results, candidates, key=lambda c: c[0])
+            rankings.append(candidates)
+        return rankings
+
+    def get_embeddings(self, ids: list[str]) -> dict[str, list[float]]:
+        """Fetch stored vectors by chunk id, across shards.
+
+        Args:
+            ids: Chunk ids
+
+        Returns:
+            Dictionary of chunk id -> vector (unknown ids are left out)
+        """
+        embeddings = {}
+        for shard in self.shards:
+            fetched = self._backend_for(shard).get(ids=ids, include=["embeddings"])
+            embeddings.update(zip(fetched["ids"], fetched["embeddings"]))
+        return embeddings
+
+    def get_chunks(self, ids: list[str]) -> dict[str, Chunk]:
+        """Fetch stored chunks by id, across shards, with their full text.
+
+        Args:
+            ids: Chunk ids
 
-        # Perform search
-        results = self.collection.query(
-            query_embeddings=[query_embedding],
+        Returns:
+            Dictionary of chunk id -> Chunk (unknown ids are left out)
+        """
+        entries = []
+        for shard in self.shards:
+            fetched = self._backend_for(shard).get(
+                ids=ids, include=["documents", "metadatas"]
+            )
+            entries.extend(
+                (0.0, document, metadata)
+                for document, metadata in zip(fetched["documents"], fetched["metadatas"])
+            )
+        chunks = [result.chunk for result in _to_results(entries)]
+        hydrate(chunks)
+        return {chunk.chunk_id: chunk for chunk in chunks}
+
+    def similar_documents(
+        self, source_path: str, n_results: int = 5
+    ) -> list[SearchResult]:
+        """Find the documents nearest to a stored document.
+
+        One nearest-neighbor lookup over the document vectors; each result
+        is the first chunk of a similar document.
+
+        Args:
+            source_path: Path of a stored source document
+            n_results: Maximum number of documents
+
+        Returns:
+            List of SearchResult objects (empty without a document vector)
+        """
+        entry = self.documents.get(ids=[source_path], include=["embeddings"])
+        if not entry["ids"]:
+            return []
+
+        results = self.documents.query(
+            query_embeddings=entry["embeddings"],
             n_results=n_results,
-            where=where,
-            include=["documents", "metadatas", "distances"],
-        )
-
-        # Convert to SearchResult objects
-        search_results = []
-        if results["ids"] and results["ids"][0]:
-            for i, chunk_id in enumerate(results["ids"][0]):
-                # Extract metadata
-                metadata = results["metadatas"][0][i]
-                text = results["documents"][0][i]
-                distance = results["distances"][0][i]
-
-                # Convert distance to similarity score (ChromaDB uses L2 by default)
-                # Lower distance = more similar
-                score = 1.0 / (1.0 + distance)
-
-                chunk = Chunk(
-                    text=text,
-                    source_path=metadata.get("source_path", ""),
-                    chunk_index=int(metadata.get("chunk_index", 0)),
-                    total_chunks=int(metadata.get("total_chunks", 1)),
-                    metadata={
-                        k: v
-                        for k, v in metadata.items()
-                        if k not in ["source_path", "chunk_index", "total_chunks"]
-                    },
+            where={"source_path": {"$ne": source_path}},
+            include=["documents", "metadatas"],
+        )
+        if not results["ids"] or not results["ids"][0]:
+            return []
+
+        search_results = _to_results(
+            [
+                (
+                    score,
+                    document,
+                    {k: v for k, v in metadata.items() if k not in (DOC_WEIGHT, DOC_NORM)},
                 )
+                for score, document, metadata in zip(
+                    results["scores"][0], results["documents"][0], results["metadatas"][0]
+                )
+            ]
+        )
+        hydrate([result.chunk for result in search_results])
+        return search_results
+
+    def lexical_search(
+        self,
+        query: str,
+        n_results: int = 10,
+        where: dict[str, Any] = None,
+        hydrate_text: bool = True,
+    ) -> list[SearchResult]:
+        """Search chunks by keywords, ranked by BM25.
+
+        Args:
+            query: Query text
+            n_results: Maximum number of results
+            where: Optional filter conditions
+            hydrate_text: Read lazily stored chunk text from the files
+
+        Returns:
+            List of SearchResult objects with BM25 scores
+        """
+        limit = n_results * ANN_FILTER_OVERSAMPLE if where else n_results
+        ranked = self.lexical.search(query, limit)
+        if not ranked:
+            return []
+
+        entries = {}
+        for shard in self._shards_for(where):
+            fetched = self._backend_for(shard).get(
+                ids=[id_ for id_, _ in ranked],
+                where=where,
+                include=["documents", "metadatas"],
+            )
+            for id_, document, metadata in zip(
+                fetched["ids"], fetched["documents"], fetched["metadatas"]
+            ):
+                entries[id_] = (document, metadata)
+
+        search_results = _to_results(
+            [(score, *entries[id_]) for id_, score in ranked if id_ in entries][:n_results]
+        )
+        if hydrate_text:
+            hydrate([result.chunk for result in search_results])
+        return search_results
+
+    def keyword_scan(
+        self,
+        query: str,
+        n_results: int = 10,
+        where: dict[str, Any] = None,
+        hydrate_text: bool = True,
+    ) -> list[SearchResult]:
+        """Search the stored chunk text for the query's terms, without an index.
 
-                search_results.append(SearchResult(chunk=chunk, score=score))
+        For stores built before the keyword index existed (see
+        lexical_search). Every chunk matching the filter is read, and
+        lazily stored chunks are matched on their preview.
 
+        Args:
+            query: Query text
+            n_results: Maximum number of results
+            where: Optional filter conditions
+            hydrate_text: Read lazily stored chunk text from the files
+
+        Returns:
+            List of SearchResult objects scored by the number of distinct
+            query terms they contain
+        """
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+
+        def matches():
+            for shard in self._shards_for(where):
+                backend = self._backend_for(shard)
+                offset = 0
+                while True:
+                    batch = backend.get(
+                        where=where,
+                        include=["documents", "metadatas"],
+                        limit=ANN_TRAIN_BATCH,
+                        offset=offset,
+                    )
+                    if not batch["ids"]:
+                        break
+                    offset += len(batch["ids"])
+                    for document, metadata in zip(batch["documents"], batch["metadatas"]):
+                        found = len(terms.intersection(tokenize(document)))
+                        if found:
+                            yield float(found), document, metadata
+
+        best = heapq.nlargest(n_results, matches(), key=lambda entry: entry[0])
+        search_results = _to_results(best)
+        if hydrate_text:
+            hydrate([result.chunk for result in search_results])
         return search_results
 
+    def _ann_query(
+        self,
+        shard: str | None,
+        query_embedding: list[float],
+        n_results: int,
+        where: dict[str, Any] = None,
+        include: list[str] = None,
+    ) -> dict[str, Any]:
+        """Search a shard through its IVF index.
+
+        Candidates come from the index; documents, metadata (and any other
+        included fields) and the filter come from the backend. When the
+        filter leaves fewer than n_results of the oversampled candidates
+        (a selective filter), the backend's exact filtered search is used.
+        """
+        include = include or ["documents", "metadatas"]
+        limit = n_results * ANN_FILTER_OVERSAMPLE if where else n_results
+        ranked = self._ann_for(shard).search(
+            query_embedding, limit, self.config.ivf_nprobe
+        )
+        if not ranked:
+            return {"ids": [[]], "scores": [[]], **{key: [[]] for key in include}}
+
+        fetched = self._backend_for(shard).get(
+            ids=[id_ for id_, _ in ranked], where=where, include=include
+        )
+        rows = {id_: i for i, id_ in enumerate(fetched["ids"])}
+        hits = [(id_, score) for id_, score in ranked if id_ in rows][:n_results]
+        if where and len(hits) < n_results:
+            return self._backend_for(shard).query(
+                query_embeddings=[query_embedding],
+                n_results=n_results,
+                where=where,
+                include=include,
+            )
+        return {
+            "ids": [[id_ for id_, _ in hits]],
+            "scores": [[score for _, score in hits]],
+            **{key: [[fetched[key][rows[id_]] for id_, _ in hits]] for key in include},
+        }
+
+    def build_ann(
+        self, conversation_type: str = None, stale_only: bool = False
+    ) -> dict[str, int]:
+        """Train the IVF index of each shard from its stored vectors.
+
+        Training runs k-means over a sample and writes fresh posting lists;
+        afterwards writes keep the index up to date until it is retrained.
+
+        Args:
+            conversation_type: Only this type's shard (sharded stores)
+            stale_only: Only shards of at least ann_threshold vectors whose
+                index is missing or has drifted (for periodic jobs)
+
+        Returns:
+            Dictionary of collection name -> number of vectors indexed
+        """
+        built = {}
+        for shard in self._shards_for({"conversation_type": conversation_type}):
+            ann = self._ann_for(shard)
+            count = self._backend_for(shard).count()
+            if stale_only and (
+                count < self.config.ann_threshold or (ann.exists and not ann.stale)
+            ):
+                continue
+            built[_shard_collection(shard)] = self._train_ann(shard)
+        if built:
+            self._bump_generation()
+        return built
+
+    def _train_ann(self, shard: str | None) -> int:
+        """Train a shard's IVF index from its stored vectors."""
+        backend = self._backend_for(shard)
+        count = backend.count()
+
+        def batches():
+            for offset in range(0, count, ANN_TRAIN_BATCH):
+                batch = backend.get(
+                    include=["embeddings"], limit=ANN_TRAIN_BATCH, offset=offset
+                )
+                yield batch["ids"], batch["embeddings"]
+
+        return self._ann_for(shard).train(batches, count, self.config.ivf_nlist)
+
     def get_stats(self) -> dict[str, Any]:
         """Get statistics about the vector store.
 
         Returns:
             Dictionary with store statistics
         """
-        self._ensure_client()
+        count = 0
+        sources = set()
+        shard_counts = {}
+        for shard in self.shards:
+            backend = self._backend_for(shard)
+            shard_count = backend.count()
+            shard_counts[shard] = shard_count
+            count += shard_count
 
-        count = self.collection.count()
+            # Get unique sources
+            if shard_count > 0:
+                for metadata in backend.get(include=["metadatas"])["metadatas"]:
+                    if "source_path" in metadata:
+                        sources.add(metadata["source_path"])
 
-        # Get unique sources
-        if count > 0:
-            results = self.collection.get(include=["metadatas"])
-            sources = set()
-            for metadata in results["metadatas"]:
-                if "source_path" in metadata:
-                    sources.add(metadata["source_path"])
-            num_documents = len(sources)
-        else:
-            num_documents = 0
-
-        return {
+        stats = {
             "total_chunks": count,
-            "num_documents": num_documents,
+            "num_documents": len(sources),
+            "backend": self.config.backend,
+            "distance": getattr(self.backend, "space", "cosine"),
+            "needs_reindex": any(
+                getattr(self._backend_for(shard), "needs_rebuild", False)
+                for shard in self.shards
+            ),
             "db_path": str(self.db_path),
         }
+        if self.config.shard_by_type:
+            stats["shards"] = shard_counts
+        if self.config.tiering:
+            stats["tiers"] = {
+                "hot": sum(n for shard, n in shard_counts.items() if not _is_cold(shard)),
+                "cold": sum(n for shard, n in shard_counts.items() if _is_cold(shard)),
+                "hot_cutoff": self.hot_cutoff,
+            }
+        ann = {
+            _shard_collection(shard): {
+                **self._ann_for(shard).info(),
+                "active": self._uses_ann(shard),
+            }
+            for shard in self.shards
+            if self._ann_for(shard).exists
+        }
+        if ann:
+            stats["ann"] = ann
+        stats["lexical_chunks"] = self.lexical.count()
+        stats["document_vectors"] = self.documents.count()
+        return stats
 
-    def clear(self) -> None:
-        """Clear all data from the store."""
-        self._ensure_client()
-        # Delete and recreate collection
-        self._client.delete_collection("cortext_chunks")
-        self._collection = self._client.create_collection(
-            name="cortext_chunks",
-            metadata={"description": "Cortext workspace document chunks"},
-        )
+    def reindex(self, conversation_type: str = None) -> int:
+        """Rebuild the index with the configured settings, keeping vectors.
+
+        Migrates existing stores to a new distance space or HNSW parameters
+        without re-embedding documents. The keyword index and document
+        vectors are rebuilt from the stored chunks too. Every rebuilt copy
+        is built next to the live one and swapped in when complete, so
+        searches keep working meanwhile.
+
+        Args:
+            conversation_type: Only rebuild this type's shard (sharded stores)
+
+        Returns:
+            Number of chunks reindexed
+        """
+        shards = self._shards_for({"conversation_type": conversation_type})
+        reindexed = sum(self._backend_for(shard).rebuild() for shard in shards)
+        batches = self._lexical_batches(shards)
+        if conversation_type is None:
+            self.lexical.rebuild(batches)
+        else:
+            # Re-adding a shard's chunks replaces their entries in place
+            for batch in batches:
+                self.lexical.add(*batch)
+        self._rebuild_documents(shards, conversation_type)
+        self._bump_generation()
+        return reindexed
+
+    def _lexical_batches(
+        self, shards: list[str | None]
+    ) -> Iterator[tuple[list[str], list[str], list[str]]]:
+        """Batches of (ids, source paths, full texts) of the chunks in shards."""
+        for shard in shards:
+            backend = self._backend_for(shard)
+            offset = 0
+            while True:
+                batch = backend.get(
+                    include=["documents", "metadatas"], limit=ANN_TRAIN_BATCH, offset=offset
+                )
+                if not batch["ids"]:
+                    break
+                offset += len(batch["ids"])
+                results = _to_results(
+                    [
+                        (0.0, document, metadata)
+                        for document, metadata in zip(
+                            batch["documents"], batch["metadatas"]
+                        )
+                    ]
+                )
+                # Lazily stored chunks only hold a preview
+                hydrate([result.chunk for result in results])
+                yield (
+                    batch["ids"],
+                    [result.chunk.source_path for result in results],
+                    [result.chunk.text for result in results],
+                )
+
+    def project(self, transform: Callable[[np.ndarray], np.ndarray]) -> int:
+        """Rewrite every stored vector through a projection.
+
+        Each shard is rebuilt with the transformed vectors and swapped in
+        (see reindex); IVF indexes are retrained for the new dimension and
+        document vectors are recomputed and swapped in as well. The caller
+        must hold the workspace write lease.
+
+        Args:
+            transform: Function mapping a float32 array of stored vectors
+                to their projections
+
+        Returns:
+            Number of chunks rewritten
+        """
+        rewritten = 0
+        for shard in self.shards:
+            rewritten += self._backend_for(shard).rebuild(transform=transform)
+            if self._ann_for(shard).exists:
+                self._train_ann(shard)
+        self._rebuild_documents(self.shards)
+        self._bump_generation()
+        return rewritten
+
+    def compact(self) -> int:
+        """Rebuild every shard from its live vectors and reclaim disk space.
+
+        Each shard, the keyword index and the document vectors are rebuilt
+        next to their live copies and swapped in (see reindex), so a running
+        server keeps serving searches; then the backend's files are vacuumed.
+
+        Returns:
+            Number of chunks kept
+        """
+        kept = self.reindex()
+        backends = [self._backend_for(shard) for shard in self.shards]
+        if self.config.backend == "chroma":
+            # All Chroma shards live in one database: vacuum it once
+            backends = backends[:1]
+        else:
+            backends.append(self.documents)
+        for backend in backends:
+            backend.vacuum()
+        self.lexical.optimize()
+        return kept
+
+    def source_counts(self) -> dict[str, int]:
+        """Count stored chunks per source path, across shards.
+
+        Returns:
+            Dictionary of source path -> number of chunks
+        """
+        counts: dict[str, int] = {}
+        for shard in self.shards:
+            backend = self._backend_for(shard)
+            for metadata in backend.get(include=["metadatas"])["metadatas"]:
+                source_path = metadata.get("source_path")
+                if source_path is not None:
+                    counts[source_path] = counts.get(source_path, 0) + 1
+        return counts
+
+    def sample_embeddings(self, limit: int, seed: int = None) -> list[list[float]]:
+        """Draw a random sample of stored embeddings, e.g. as probe queries.
+
+        Every shard (and tier) contributes in proportion to its size; its
+        share is read as up to SAMPLE_WINDOWS runs of rows at random offsets.
+
+        Args:
+            limit: Maximum number of embeddings
+            seed: Random seed (default: a fresh sample each call)
+
+        Returns:
+            List of embeddings in random order (fewer when the store is smaller)
+        """
+        counts = [(shard, self._backend_for(shard).count()) for shard in self.shards]
+        total = sum(count for _, count in counts)
+        if not total:
+            return []
+
+        rng = np.random.default_rng(seed)
+        embeddings: list[list[float]] = []
+        for shard, count in counts:
+            backend = self._backend_for(shard)
+            share = limit * count // total
+            if share >= count:
+                embeddings.extend(backend.get(include=["embeddings"]).get("embeddings") or [])
+                continue
+            if not share:
+                continue
+            window = -(-share // SAMPLE_WINDOWS)
+            windows = min(-(-share // window), count // window)
+            starts = rng.choice(count // window, windows, replace=False) * window
+            for start in sorted(starts.tolist()):
+                results = backend.get(include=["embeddings"], limit=window, offset=start)
+                embeddings.extend(results.get("embeddings") or [])
+
+        order = rng.permutation(len(embeddings))[:limit]
+        return [embeddings[i] for i in order]
+
+    def clear(self, conversation_type: str = None) -> None:
+        """Clear data from the store.
+
+        Args:
+            conversation_type: Only clear chunks of this conversation type
+        """
+        if conversation_type is not None:
+            self.documents.delete(where={"conversation_type": conversation_type})
+        if conversation_type and not self.config.shard_by_type:
+            for shard in self.shards:
+                self._delete(shard, {"conversation_type": conversation_type})
+            self._bump_generation()
+            return
+
+        if conversation_type is None:
+            self.lexical.clear()
+            self.documents.clear()
+        for shard in self._shards_for({"conversation_type": conversation_type}):
+            backend = self._backend_for(shard)
+            if conversation_type is not None:
+                self.lexical.delete(backend.get(include=[])["ids"])
+            backend.clear()
+            self._ann_for(shard).clear()
+        self._bump_generation()
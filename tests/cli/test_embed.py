@@ -0,0 +1,79 @@
+"""Tests for cortext embed command."""
+
+import json
+import subprocess
+import sys
+
+from typer.testing import CliRunner
+
+from cortext_cli.cli import app
+
+runner = CliRunner()
+
+
+class TestRAGDependencies:
+    """Test the dependency check follows the configured backend."""
+
+    def _workspace(self, tmp_path, rag):
+        workspace_dir = tmp_path / ".workspace"
+        workspace_dir.mkdir()
+        registry = {"version": "1.0", "conversation_types": {}, "rag": rag}
+        (workspace_dir / "registry.json").write_text(json.dumps(registry))
+
+    def test_numpy_backend_does_not_need_chromadb(self, tmp_path, monkeypatch, mocker):
+        """Test chromadb is not required when the numpy backend is configured."""
+        from cortext_cli.commands import embed
+
+        self._workspace(tmp_path, {"backend": "numpy"})
+        monkeypatch.chdir(tmp_path)
+        find_spec = mocker.patch.object(
+            embed, "find_spec", side_effect=lambda name: name != "chromadb"
+        )
+
+        assert embed._check_rag_dependencies()
+        assert "chromadb" not in [call.args[0] for call in find_spec.call_args_list]
+
+    def test_chroma_backend_needs_chromadb(self, tmp_path, monkeypatch, mocker):
+        """Test a missing chromadb is reported for the default backend."""
+        from cortext_cli.commands import embed
+
+        self._workspace(tmp_path, {})
+        monkeypatch.chdir(tmp_path)
+        mocker.patch.object(embed, "find_spec", side_effect=lambda name: name != "chromadb")
+
+        result = runner.invoke(app, ["embed", "--all"])
+
+        assert result.exit_code == 1
+        assert "RAG dependencies not installed" in result.output
+
+
+class TestEmbedPlan:
+    """Test embed --plan without the RAG dependencies."""
+
+    def test_plan_without_numpy(self, tmp_path):
+        """Test planning works when numpy, chromadb and fastembed are missing."""
+        workspace_dir = tmp_path / ".workspace"
+        workspace_dir.mkdir()
+        registry = {"version": "1.0", "conversation_types": {"notes": {"folder": "notes"}}}
+        (workspace_dir / "registry.json").write_text(json.dumps(registry))
+        (tmp_path / "notes").mkdir()
+        (tmp_path / "notes" / "idea.md").write_text("# Idea\n\nSome text.")
+
+        # Blocked modules raise ImportError when imported
+        script = (
+            "import sys\n"
+            "for name in ('numpy', 'chromadb', 'fastembed'):\n"
+            "    sys.modules[name] = None\n"
+            "from typer.testing import CliRunner\n"
+            "from cortext_cli.cli import app\n"
+            "result = CliRunner().invoke(app, ['embed', '--all', '--plan', '--json'])\n"
+            "print(result.output)\n"
+            "sys.exit(result.exit_code)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], cwd=tmp_path, capture_output=True, text=True
+        )
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        plan = json.loads(result.stdout)
+        assert plan["new"] == [str(tmp_path / "notes" / "idea.md")]
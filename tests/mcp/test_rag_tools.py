@@ -43,6 +43,7 @@ class TestMCPRAGTools:
         assert "embed_document" in tool_names
         assert "embed_workspace" in tool_names
         assert "search_semantic" in tool_names
+        assert "search_many" in tool_names
         assert "get_similar" in tool_names
         assert "get_embedding_status" in tool_names
 
@@ -120,6 +121,22 @@ class TestMCPRAGTools:
         assert "content" in result
         mock_mcp_tools.search_semantic.assert_called_once()
 
+    @patch("cortext_mcp.server.RAG_AVAILABLE", True)
+    @patch("cortext_mcp.server.mcp_tools")
+    def test_call_search_many(self, mock_mcp_tools, server):
+        """Test calling search_many tool."""
+        mock_mcp_tools.search_many.return_value = {"success": True, "results": []}
+
+        result = server.call_tool(
+            "search_many",
+            {"queries": ["auth", "login"], "fuse": True},
+        )
+
+        assert "content" in result
+        mock_mcp_tools.search_many.assert_called_once_with(
+            queries=["auth", "login"], fuse=True
+        )
+
     @patch("cortext_mcp.server.RAG_AVAILABLE", True)
     @patch("cortext_mcp.server.mcp_tools")
     def test_call_rag_tool_handles_errors(self, mock_mcp_tools, server):
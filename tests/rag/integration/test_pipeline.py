@@ -111,6 +111,25 @@ class TestVectorStoreIntegration:
         stats = store.get_stats()
         assert stats["total_chunks"] == 1
 
+    def test_reassign_source(self, sample_workspace, mock_embedder):
+        """Test moving chunks to another path keeps their vectors."""
+        from cortext_rag.store import VectorStore
+        from cortext_rag.models import Chunk
+
+        store = VectorStore(sample_workspace)
+
+        chunk = Chunk(
+            text="Shared content", source_path="a.md", chunk_index=0, total_chunks=1
+        )
+        embedding = mock_embedder.embed([chunk.text])
+        store.add_chunks([chunk], embedding, "a.md")
+
+        store.reassign_source("a.md", "b.md")
+
+        results = store.search(embedding[0], n_results=5)
+        assert [r.chunk.source_path for r in results] == ["b.md"]
+        assert results[0].chunk.text == "Shared content"
+
     def test_get_stats(self, sample_workspace, mock_embedder):
         """Test getting store statistics."""
         from cortext_rag.store import VectorStore
@@ -134,6 +153,55 @@ class TestVectorStoreIntegration:
         assert stats["num_documents"] == 3
         assert "chroma" in stats["db_path"]
 
+    def test_cosine_scores(self, sample_workspace):
+        """Test new collections use cosine space and calibrated scores."""
+        from cortext_rag.store import VectorStore
+        from cortext_rag.models import Chunk
+
+        store = VectorStore(sample_workspace)
+        chunks = [
+            Chunk(text="a", source_path="a.md", chunk_index=0, total_chunks=1),
+            Chunk(text="b", source_path="b.md", chunk_index=0, total_chunks=1),
+        ]
+        store.add_chunks(chunks[:1], [[3.0, 0.0, 0.0]], "a.md")
+        store.add_chunks(chunks[1:], [[0.0, 2.0, 0.0]], "b.md")
+
+        results = store.search([1.0, 0.0, 0.0], n_results=2)
+
+        assert store.get_stats()["distance"] == "cosine"
+        assert results[0].score == pytest.approx(1.0, abs=1e-4)
+        assert results[1].score == pytest.approx(0.0, abs=1e-4)
+
+    def test_reindex_migrates_legacy_collection(self, sample_workspace):
+        """Test reindex moves an L2 collection to the configured settings."""
+        import chromadb
+        from cortext_rag.store import VectorStore
+
+        db_path = sample_workspace / ".workspace" / "embeddings" / "chroma"
+        legacy = chromadb.PersistentClient(path=str(db_path)).get_or_create_collection(
+            "cortext_chunks"
+        )
+        legacy.add(
+            ids=["a.md::0"],
+            embeddings=[[1.0, 0.0]],
+            documents=["legacy chunk"],
+            metadatas=[{"source_path": "a.md", "chunk_index": 0, "total_chunks": 1}],
+        )
+
+        store = VectorStore(sample_workspace)
+        assert store.get_stats()["distance"] == "l2"
+        assert store.get_stats()["needs_reindex"] is True
+
+        assert store.reindex() == 1
+
+        stats = store.get_stats()
+        assert stats["distance"] == "cosine"
+        assert stats["needs_reindex"] is False
+        assert stats["total_chunks"] == 1
+        assert VectorStore(sample_workspace).search([1.0, 0.0])[0].chunk.text == (
+            "legacy chunk"
+        )
+
 
 @pytest.mark.integration
 @pytest.mark.skipif(
@@ -0,0 +1,193 @@
+"""Unit tests for the IVF approximate nearest-neighbor index."""
+
+import numpy as np
+import pytest
+
+
+def _clustered(rows=1000, dim=32, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((20, dim))
+    return centers[rng.integers(0, 20, rows)] + 0.3 * rng.standard_normal((rows, dim))
+
+
+def _batches(ids, vectors, size=300):
+    def batches():
+        for start in range(0, len(ids), size):
+            yield ids[start : start + size], vectors[start : start + size]
+
+    return batches
+
+
+class TestIVFIndex:
+    """Tests for training, searching and updating the index."""
+
+    def test_train_and_search(self, tmp_path):
+        """Test probed lists recover the exact nearest neighbors."""
+        from cortext_rag.ann import IVFIndex
+        from cortext_rag.backends.numpy_flat import normalize
+
+        vectors = _clustered()
+        ids = [str(i) for i in range(len(vectors))]
+        index = IVFIndex(tmp_path / "ivf")
+
+        assert index.train(_batches(ids, vectors), len(ids), nlist=32) == 1000
+        assert index.count == 1000
+        assert len(list((tmp_path / "ivf").glob("g*/list-*.npz"))) <= 32
+
+        normalized = normalize(vectors)
+        recalls = []
+        for query in vectors[:20]:
+            exact = np.argsort(-(normalized @ normalize(query)))[:10]
+            found = index.search(query.tolist(), 10, nprobe=8)
+            assert found[0][1] >= found[-1][1]
+            recalls.append(len({int(i) for i, _ in found} & set(exact.tolist())) / 10)
+        assert np.mean(recalls) >= 0.9
+
+    def test_incremental_updates(self, tmp_path):
+        """Test added ids replace old entries and removed ids disappear."""
+        from cortext_rag.ann import IVFIndex
+
+        vectors = _clustered(rows=200)
+        ids = [str(i) for i in range(200)]
+        index = IVFIndex(tmp_path / "ivf")
+        index.train(_batches(ids, vectors), 200, nlist=8)
+
+        index.add(["new", "0"], [[1.0] + [0.0] * 31, [0.0] * 31 + [1.0]])
+        index.remove(["1", "missing"])
+
+        assert index.count == 200
+        assert index.search([1.0] + [0.0] * 31, 1, nprobe=8)[0][0] == "new"
+        assert index.search([0.0] * 31 + [1.0], 1, nprobe=8)[0][0] == "0"
+        found = {id_ for id_, _ in index.search(vectors[1].tolist(), 200, nprobe=8)}
+        assert "1" not in found
+
+        # A second instance (e.g. another process) sees the same state
+        assert IVFIndex(tmp_path / "ivf").count == 200
+
+    def test_retrain_replaces_generation(self, tmp_path):
+        """Test retraining switches generations and tracks drift."""
+        from cortext_rag.ann import IVFIndex
+
+        vectors = _clustered(rows=100)
+        ids = [str(i) for i in range(100)]
+        index = IVFIndex(tmp_path / "ivf")
+        index.train(_batches(ids, vectors), 100, nlist=4)
+        reader = IVFIndex(tmp_path / "ivf")
+        assert reader.search(vectors[0].tolist(), 1, nprobe=4)
+
+        more = _clustered(rows=60, seed=1)
+        index.add([f"m{i}" for i in range(60)], more.tolist())
+        assert index.stale
+
+        index.train(_batches(ids, vectors), 100, nlist=4)
+
+        assert not index.stale
+        assert [p.name for p in (tmp_path / "ivf").iterdir() if p.is_dir()] == ["g000002"]
+        assert reader.search(vectors[0].tolist(), 1, nprobe=4)[0][0] == "0"
+
+
+class TestStoreANN:
+    """Tests for IVF search through VectorStore."""
+
+    def _store(self, workspace, threshold=0):
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.models import Chunk
+        from cortext_rag.store import VectorStore
+
+        store = VectorStore(
+            workspace,
+            config=RAGConfig(backend="numpy", ann_threshold=threshold, ivf_nprobe=4),
+        )
+        vectors = _clustered(rows=300)
+        for doc in range(30):
+            chunks = [
+                Chunk(
+                    text=f"doc {doc} chunk {i}",
+                    source_path=f"doc{doc}.md",
+                    chunk_index=i,
+                    total_chunks=10,
+                    metadata={"conversation_type": "plan" if doc % 2 else "debug"},
+                )
+                for i in range(10)
+            ]
+            store.add_chunks(chunks, vectors[doc * 10 : doc * 10 + 10].tolist(), f"doc{doc}.md")
+        return store, vectors
+
+    def test_search_uses_index_above_threshold(self, sample_workspace):
+        """Test searches go through the index and match exact results."""
+        store, vectors = self._store(sample_workspace)
+        exact = [r.chunk.text for r in store.search(vectors[5].tolist(), n_results=3)]
+
+        assert store.build_ann() == {"cortext_chunks": 300}
+        assert store._uses_ann(None)
+
+        results = store.search(vectors[5].tolist(), n_results=3)
+        assert [r.chunk.text for r in results] == exact
+        assert results[0].score == pytest.approx(1.0, abs=1e-5)
+
+        filtered = store.search(
+            vectors[5].tolist(), n_results=3, where={"conversation_type": "plan"}
+        )
+        assert filtered
+        assert all(r.chunk.metadata["conversation_type"] == "plan" for r in filtered)
+
+        stats = store.get_stats()["ann"]["cortext_chunks"]
+        assert stats["active"] and stats["count"] == 300
+
+    def test_selective_filter_falls_back_to_exact(self, sample_workspace):
+        """Test filters matching few chunks still fill n_results."""
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.models import Chunk
+        from cortext_rag.store import VectorStore
+
+        store = VectorStore(
+            sample_workspace,
+            config=RAGConfig(backend="numpy", ann_threshold=100, ivf_nprobe=4),
+        )
+        vectors = _clustered(rows=1000)
+        chunks = [
+            Chunk(
+                text=f"chunk {i}",
+                source_path="doc.md",
+                chunk_index=i,
+                total_chunks=1000,
+                metadata={"conversation_type": "debug" if i % 50 == 0 else "plan"},
+            )
+            for i in range(1000)
+        ]
+        store.add_chunks(chunks, vectors.tolist(), "doc.md")
+        store.build_ann()
+        assert store._uses_ann(None)
+
+        results = store.search(
+            vectors[1].tolist(), n_results=10, where={"conversation_type": "debug"}
+        )
+
+        assert len(results) == 10
+        assert all(r.chunk.metadata["conversation_type"] == "debug" for r in results)
+        assert results[0].score >= results[-1].score
+
+    def test_writes_update_index(self, sample_workspace):
+        """Test added and deleted chunks are reflected in the index."""
+        from cortext_rag.models import Chunk
+
+        store, vectors = self._store(sample_workspace)
+        store.build_ann()
+
+        store.delete_by_source("doc0.md")
+        chunk = Chunk(text="fresh", source_path="new.md", chunk_index=0, total_chunks=1)
+        store.add_chunks([chunk], [vectors[0].tolist()], "new.md")
+
+        results = store.search(vectors[0].tolist(), n_results=3)
+        assert results[0].chunk.text == "fresh"
+        assert "doc0.md" not in {r.chunk.source_path for r in results}
+        assert store._ann_for(None).count == 291
+
+    def test_below_threshold_and_stale_only(self, sample_workspace):
+        """Test small shards keep exact search and --if-stale skips them."""
+        store, _ = self._store(sample_workspace, threshold=1000)
+
+        assert store.build_ann(stale_only=True) == {}
+        store.build_ann()
+        assert not store._uses_ann(None)
+        assert store.get_stats()["ann"]["cortext_chunks"]["active"] is False
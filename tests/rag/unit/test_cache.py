@@ -0,0 +1,100 @@
+"""Unit tests for the query-embedding and search result caches."""
+
+import pytest
+
+
+class TestQueryEmbeddingCache:
+    """Tests for the persistent query-embedding LRU."""
+
+    def test_round_trip_and_persistence(self, tmp_path):
+        """Test embeddings survive a new cache instance, per model."""
+        from cortext_rag.cache import QueryEmbeddingCache
+
+        QueryEmbeddingCache(tmp_path, 10).put_many("m", {"jwt": [0.5, -1.0]})
+        cache = QueryEmbeddingCache(tmp_path, 10)
+
+        assert cache.get_many("m", ["jwt", "oauth"]) == {"jwt": [0.5, -1.0]}
+        assert cache.get_many("other-model", ["jwt"]) == {}
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test the oldest unused query is evicted beyond capacity."""
+        from cortext_rag.cache import QueryEmbeddingCache
+
+        cache = QueryEmbeddingCache(tmp_path, 2)
+        cache.put_many("m", {"a": [1.0]})
+        cache.put_many("m", {"b": [2.0]})
+        cache.get_many("m", ["a"])
+        cache.put_many("m", {"c": [3.0]})
+
+        assert set(cache.get_many("m", ["a", "b", "c"])) == {"a", "c"}
+
+    def test_disabled(self, tmp_path):
+        """Test capacity 0 stores nothing."""
+        from cortext_rag.cache import QueryEmbeddingCache
+
+        cache = QueryEmbeddingCache(tmp_path, 0)
+        cache.put_many("m", {"a": [1.0]})
+
+        assert cache.get_many("m", ["a"]) == {}
+        assert not cache.path.exists()
+
+
+class TestResultCache:
+    """Tests for cached searches in the retriever."""
+
+    @pytest.fixture
+    def retriever(self, tmp_path, mocker):
+        from cortext_rag import retriever as retriever_module
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.models import Chunk
+        from cortext_rag.store import VectorStore
+
+        embedder = mocker.Mock(model_name="fake")
+        embedder.embed.side_effect = lambda texts: [[1.0, 0.0] for _ in texts]
+        mocker.patch.object(retriever_module, "Embedder", return_value=embedder)
+        mocker.patch.object(
+            retriever_module,
+            "VectorStore",
+            lambda ws: VectorStore(ws, RAGConfig(backend="numpy")),
+        )
+        retriever = retriever_module.Retriever(tmp_path)
+        chunk = Chunk(text="first", source_path="a.md", chunk_index=0, total_chunks=1)
+        retriever.store.add_chunks([chunk], [[1.0, 0.1]], "a.md")
+        return retriever
+
+    def test_repeat_search_is_cached(self, retriever, mocker):
+        """Test a repeated search neither embeds nor searches again."""
+        first = retriever.search("decision", n_results=5)
+        search_many = mocker.spy(retriever.store, "search_many")
+
+        second = retriever.search("decision", n_results=5)
+        second[0].score = -1.0
+
+        assert [r.chunk.text for r in second] == [r.chunk.text for r in first]
+        assert retriever.embedder.embed.call_count == 1
+        search_many.assert_not_called()
+        # Callers get copies
+        assert retriever.search("decision", n_results=5)[0].score == first[0].score
+
+    def test_write_invalidates_results(self, retriever):
+        """Test results cached before a write are not returned after it."""
+        from cortext_rag.models import Chunk
+
+        assert len(retriever.search("decision")) == 1
+        generation = retriever.store.generation
+
+        chunk = Chunk(text="second", source_path="b.md", chunk_index=0, total_chunks=1)
+        retriever.store.add_chunks([chunk], [[1.0, 0.0]], "b.md")
+
+        assert retriever.store.generation > generation
+        assert [r.chunk.text for r in retriever.search("decision")] == ["second", "first"]
+        # The query embedding itself was still cached
+        assert retriever.embedder.embed.call_count == 1
+
+    def test_search_many_embeds_only_missing_queries(self, retriever):
+        """Test batched searches reuse cached query embeddings."""
+        retriever.search("decision")
+
+        retriever.search_many(["decision", "other", "other"])
+
+        assert retriever.embedder.embed.call_args_list[-1].args == (["other"],)
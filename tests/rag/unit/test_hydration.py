@@ -0,0 +1,93 @@
+"""Unit tests for reading chunk text from source files on demand."""
+
+import pytest
+
+
+def _long_markdown(path, words=900):
+    body = " ".join(f"wörd{i}" if i % 7 else f"naïve {i}\n" for i in range(words))
+    path.write_text(f"---\ntitle: Long\n---\n\n{body}\n")
+    return path
+
+
+class TestByteOffsets:
+    """Tests for the byte ranges recorded with chunks."""
+
+    @pytest.mark.parametrize("streamed", [False, True])
+    def test_ranges_reproduce_chunk_text(self, tmp_path, streamed):
+        """Test each chunk's byte range hydrates to the chunk text."""
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.hydration import hydrate, preview
+        from cortext_rag.indexer import Indexer
+
+        path = _long_markdown(tmp_path / "long.md")
+        config = RAGConfig(stream_threshold=0 if streamed else 8 * 1024 * 1024)
+        indexer = Indexer(tmp_path, config=config)
+        doc = indexer.parse_document(path)
+        chunks = list(indexer.iter_chunks(doc))
+
+        assert doc.is_streamed == streamed
+        assert len(chunks) > 1
+        texts = [chunk.text for chunk in chunks]
+        for chunk in chunks:
+            assert chunk.metadata["byte_end"] > chunk.metadata["byte_start"]
+            chunk.text = preview(chunk.text)
+
+        hydrate(chunks)
+
+        assert [chunk.text for chunk in chunks] == texts
+
+    def test_non_text_formats_keep_stored_text(self, tmp_path):
+        """Test formats without a byte mapping get no offsets."""
+        from cortext_rag.indexer import Indexer
+
+        path = tmp_path / "table.csv"
+        path.write_text("name,value\n" + "".join(f"row{i},{i}\n" for i in range(50)))
+
+        doc = Indexer(tmp_path).parse_document(path)
+
+        assert doc.chunks and "byte_start" not in doc.chunks[0].metadata
+
+
+class TestLazyStore:
+    """Tests for previews in the store and hydrated search results."""
+
+    def _embed(self, workspace, path, lazy_text=True):
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.indexer import Indexer
+        from cortext_rag.store import VectorStore
+
+        config = RAGConfig(backend="numpy", lazy_text=lazy_text)
+        doc = Indexer(workspace, config=config).parse_document(path)
+        store = VectorStore(workspace, config=config)
+        embeddings = [[1.0, float(i)] for i in range(len(doc.chunks))]
+        store.update_chunks(doc.chunks, embeddings, str(path))
+        return store, doc
+
+    def test_store_keeps_previews(self, tmp_path):
+        """Test stored documents are previews and results carry full text."""
+        from cortext_rag.hydration import PREVIEW_CHARS
+
+        store, doc = self._embed(tmp_path, _long_markdown(tmp_path / "long.md"))
+
+        stored = store.backend.get(include=["documents"])["documents"]
+        assert all(len(text) <= PREVIEW_CHARS for text in stored)
+
+        results = store.search([1.0, 0.0], n_results=10)
+        assert sorted(r.chunk.text for r in results) == sorted(c.text for c in doc.chunks)
+
+    def test_changed_file_falls_back_to_preview(self, tmp_path):
+        """Test results keep the stored preview once the file has changed."""
+        path = _long_markdown(tmp_path / "long.md")
+        store, doc = self._embed(tmp_path, path)
+
+        path.write_text(path.read_text().replace("wörd1", "changed"))
+        results = store.search([1.0, 0.0], n_results=1)
+
+        assert results[0].chunk.text == doc.chunks[0].text[:200]
+
+    def test_disabled(self, tmp_path):
+        """Test lazy_text = false stores the full text."""
+        store, doc = self._embed(tmp_path, _long_markdown(tmp_path / "long.md"), False)
+
+        stored = store.backend.get(include=["documents"])["documents"]
+        assert sorted(stored) == sorted(c.text for c in doc.chunks)
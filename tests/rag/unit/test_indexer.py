@@ -161,6 +161,35 @@ class TestIndexer:
         assert len(docs) > 0
         assert any("conversation.md" in str(d) for d in docs)
 
+    def test_find_documents_uses_registry(self, sample_workspace):
+        """Test every registered format is discovered."""
+        from cortext_rag.indexer import Indexer
+
+        notes_dir = sample_workspace / "brainstorm" / "2025-11-10" / "001-auth-patterns"
+        (notes_dir / "tickets.csv").write_text("id,title\nPROJ-1,Auth\n")
+        (notes_dir / "scratch.xyz").write_text("ignored")
+
+        docs = Indexer(sample_workspace).find_documents(sample_workspace / "brainstorm")
+        names = {d.name for d in docs}
+
+        assert "tickets.csv" in names
+        assert "scratch.xyz" not in names
+
+    def test_find_documents_skips_hidden_directories(self, sample_workspace):
+        """Test checkpoint copies and VCS directories are not indexed."""
+        from cortext_rag.indexer import Indexer
+
+        notes_dir = sample_workspace / "brainstorm" / "2025-11-10" / "001-auth-patterns"
+        for hidden in (".ipynb_checkpoints", ".git"):
+            (notes_dir / hidden).mkdir()
+            (notes_dir / hidden / "conversation.md").write_text("# Copy\n")
+
+        docs = Indexer(sample_workspace).find_documents(sample_workspace / "brainstorm")
+
+        assert docs
+        relative = [d.relative_to(sample_workspace) for d in docs]
+        assert not [d for d in relative if any(p.startswith(".") for p in d.parts)]
+
     def test_status_tracking(self, sample_workspace):
         """Test embedding status tracking."""
         from cortext_rag.indexer import Indexer
@@ -215,3 +244,274 @@ class TestIndexer:
         # Remove status
         indexer.remove_status(str(conv_file))
         assert indexer.get_status(str(conv_file)) is None
+
+
+class TestStreamingIndexer:
+    """Tests for streamed ingestion of large files."""
+
+    def test_streamed_chunks_match_in_memory(self, tmp_path, monkeypatch):
+        """Test streamed chunking matches in-memory chunking."""
+        from cortext_rag import indexer as indexer_module
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.indexer import Indexer
+
+        # Small blocks force words to straddle block boundaries
+        monkeypatch.setattr(indexer_module, "STREAM_BLOCK_SIZE", 64)
+
+        txt_file = tmp_path / "transcript.txt"
+        txt_file.write_text(
+            "\n".join(f"line {i} speaker said something" for i in range(400))
+        )
+
+        in_memory = Indexer(tmp_path, config=RAGConfig()).parse_document(txt_file)
+        streaming = Indexer(tmp_path, config=RAGConfig(stream_threshold=0))
+        doc = streaming.parse_document(txt_file)
+
+        assert doc.is_streamed
+        assert doc.content == ""
+        assert doc.num_chunks == len(in_memory.chunks)
+
+        chunks = list(streaming.iter_chunks(doc))
+        assert [c.text for c in chunks] == [c.text for c in in_memory.chunks]
+        assert [c.metadata for c in chunks] == [c.metadata for c in in_memory.chunks]
+        assert all(c.total_chunks == doc.num_chunks for c in chunks)
+
+    def test_streamed_markdown_skips_frontmatter(self, sample_markdown_file):
+        """Test streamed markdown reads frontmatter but excludes it from chunks."""
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.indexer import Indexer
+
+        indexer = Indexer(
+            sample_markdown_file.parent, config=RAGConfig(stream_threshold=0)
+        )
+        doc = indexer.parse_document(sample_markdown_file)
+
+        assert doc.metadata.get("title") == "Sample Document"
+        text = " ".join(c.text for c in indexer.iter_chunks(doc))
+        assert "Section 1" in text
+        assert "author:" not in text
+
+    def test_long_line_without_whitespace(self, tmp_path):
+        """Test a multi-MB run without whitespace is split, keeping blocks small."""
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.indexer import BYTES_PER_TOKEN, STREAM_BLOCK_SIZE, Indexer
+
+        txt_file = tmp_path / "minified.txt"
+        payload = "é" + "x" * (3 * 1024 * 1024) + " tail"
+        txt_file.write_text(payload)
+
+        indexer = Indexer(tmp_path, config=RAGConfig(stream_threshold=0))
+        max_word = indexer.chunk_size * BYTES_PER_TOKEN
+        blocks = list(indexer._iter_blocks(txt_file, [(0, txt_file.stat().st_size)]))
+
+        assert max(len(block) for _, block in blocks) <= STREAM_BLOCK_SIZE + max_word
+        assert b"".join(block.replace(b" ", b"") for _, block in blocks) == (
+            payload.replace(" ", "").encode()
+        )
+
+        doc = indexer.parse_document(txt_file)
+        chunks = list(indexer.iter_chunks(doc))
+        assert len(chunks) == doc.num_chunks
+        assert chunks[0].text.startswith("é")
+        assert chunks[-1].text.endswith("tail")
+        # Split words cannot be read back from the file
+        assert all("byte_start" not in c.metadata for c in chunks)
+
+    def test_size_cap_head_sampling(self, tmp_path):
+        """Test files over the cap only index their head."""
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.indexer import Indexer
+
+        txt_file = tmp_path / "big.txt"
+        txt_file.write_text(" ".join(f"w{i}" for i in range(5000)))
+
+        indexer = Indexer(tmp_path, config=RAGConfig(max_file_size=1000))
+        doc = indexer.parse_document(txt_file)
+
+        assert doc.metadata.get("sampled") == "head"
+        text = " ".join(c.text for c in indexer.iter_chunks(doc))
+        assert text.startswith("w0 w1")
+        assert "w4999" not in text
+
+    def test_size_cap_spread_sampling(self, tmp_path):
+        """Test spread sampling reads windows across the file."""
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.indexer import Indexer
+
+        txt_file = tmp_path / "big.txt"
+        txt_file.write_text(" ".join(f"w{i}" for i in range(5000)))
+
+        indexer = Indexer(
+            tmp_path, config=RAGConfig(max_file_size=3200, sampling="spread")
+        )
+        doc = indexer.parse_document(txt_file)
+        words = " ".join(c.text for c in indexer.iter_chunks(doc)).split()
+
+        # Every word is whole and the tail of the file is represented
+        assert all(w.startswith("w") and w[1:].isdigit() for w in words)
+        assert max(int(w[1:]) for w in words) > 4000
+
+    def test_size_cap_skip(self, tmp_path):
+        """Test skip policy produces no chunks for oversized files."""
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.indexer import Indexer
+
+        txt_file = tmp_path / "big.txt"
+        txt_file.write_text("word " * 1000)
+
+        indexer = Indexer(
+            tmp_path, config=RAGConfig(max_file_size=100, sampling="skip")
+        )
+        doc = indexer.parse_document(txt_file)
+
+        assert doc.metadata.get("skipped") == "max_file_size"
+        assert doc.num_chunks == 0
+
+
+class TestDeduplication:
+    """Tests for content-hash deduplication across paths."""
+
+    def _copy_conversation(self, sample_workspace):
+        src = (
+            sample_workspace
+            / "brainstorm"
+            / "2025-11-10"
+            / "001-auth-patterns"
+            / "conversation.md"
+        )
+        copy_dir = sample_workspace / "plan" / "2025-11-12" / "004-auth-copy"
+        copy_dir.mkdir(parents=True)
+        dst = copy_dir / "conversation.md"
+        dst.write_text(src.read_text())
+        return src, dst
+
+    def test_find_shared(self, sample_workspace):
+        """Test identical content is matched to the path owning its chunks."""
+        from cortext_rag.indexer import Indexer
+
+        src, dst = self._copy_conversation(sample_workspace)
+        indexer = Indexer(sample_workspace)
+
+        indexer.update_status(indexer.parse_document(src), "test-model", 384)
+        copy = indexer.parse_document(dst)
+
+        assert indexer.find_shared(copy) == str(src)
+
+        indexer.update_status(copy, "test-model", 384, shared_with=str(src))
+        assert indexer.get_aliases() == {str(src): [str(dst)]}
+        assert indexer.get_status(str(dst)).shared_with == str(src)
+
+    def test_reassign_aliases(self, sample_workspace):
+        """Test alias bookkeeping when the owner's content changes."""
+        from cortext_rag.indexer import Indexer
+
+        src, dst = self._copy_conversation(sample_workspace)
+        indexer = Indexer(sample_workspace)
+        indexer.update_status(indexer.parse_document(src), "test-model", 384)
+        indexer.update_status(
+            indexer.parse_document(dst), "test-model", 384, shared_with=str(src)
+        )
+
+        indexer.reassign_aliases(str(src), str(dst))
+
+        assert indexer.get_status(str(dst)).shared_with is None
+        assert indexer.get_aliases() == {}
+
+    def test_embed_document_reuses_vectors(self, sample_workspace, mock_embedder, mocker):
+        """Test identical files are embedded once and share chunks."""
+        from cortext_rag import mcp_tools
+
+        src, dst = self._copy_conversation(sample_workspace)
+        embed_spy = mocker.spy(mock_embedder, "embed")
+        mocker.patch.object(mcp_tools, "Embedder", return_value=mock_embedder)
+        store = mocker.MagicMock()
+        mocker.patch.object(mcp_tools, "VectorStore", return_value=store)
+
+        mcp_tools.embed_document(str(src), str(sample_workspace))
+        result = mcp_tools.embed_document(str(dst), str(sample_workspace))
+
+        assert result["shared"] == 1
+        assert result["embedded"] == 0
+        assert embed_spy.call_count == 1
+
+        # Changing the owner hands its chunks to the identical copy first
+        src.write_text("# Rewritten\n\nNew content.")
+        mcp_tools.embed_document(str(src), str(sample_workspace))
+
+        store.reassign_source.assert_called_once()
+        assert store.reassign_source.call_args[0] == (str(src), str(dst))
+        assert embed_spy.call_count == 2
+
+
+class TestFilterFields:
+    """Tests for structured filter fields extracted at ingest time."""
+
+    def test_conversation_fields(self, sample_workspace):
+        """Test type, date and ID come from the registry folder layout."""
+        from cortext_rag.indexer import Indexer
+
+        indexer = Indexer(sample_workspace)
+        path = sample_workspace / "plan" / "2025-11-11" / "003-api-redesign" / "conversation.md"
+
+        doc = indexer.parse_document(path)
+
+        assert doc.fields == {
+            "doc_type": "md",
+            "conversation_type": "plan",
+            "conversation_date": 20251111,
+            "conversation_id": "003-api-redesign",
+        }
+        assert all(chunk.metadata["conversation_date"] == 20251111 for chunk in doc.chunks)
+
+    def test_renamed_folder_and_frontmatter(self, sample_workspace):
+        """Test registry folders, frontmatter date, status and tags."""
+        import json
+
+        from cortext_rag.indexer import Indexer
+
+        registry_path = sample_workspace / ".workspace" / "registry.json"
+        registry = json.loads(registry_path.read_text())
+        registry["conversation_types"]["plan"]["folder"] = "work/plans"
+        registry_path.write_text(json.dumps(registry))
+
+        note = sample_workspace / "work" / "plans" / "roadmap.md"
+        note.parent.mkdir(parents=True)
+        note.write_text(
+            "---\ndate: 2024-02-03\nstatus: Draft\ntags: [API, #backend, api]\n---\n\nRoadmap."
+        )
+
+        fields = Indexer(sample_workspace).parse_document(note).fields
+
+        assert fields["conversation_type"] == "plan"
+        assert fields["conversation_date"] == 20240203
+        assert "conversation_id" not in fields
+        assert fields["status"] == "draft"
+        assert fields["tags"] == "api,backend"
+        assert fields["tag_api"] is True
+        assert fields["tag_backend"] is True
+
+    def test_outdated_fields_are_backfilled(self, sample_workspace, mock_embedder, mocker):
+        """Test chunks stored before filter fields get them without re-embedding."""
+        from cortext_rag import mcp_tools
+        from cortext_rag.indexer import Indexer
+
+        path = sample_workspace / "debug" / "2025-11-10" / "002-login-bug" / "conversation.md"
+        mocker.patch.object(mcp_tools, "Embedder", return_value=mock_embedder)
+        store = mocker.MagicMock()
+        mocker.patch.object(mcp_tools, "VectorStore", return_value=store)
+        mcp_tools.embed_document(str(path), str(sample_workspace))
+
+        # Simulate a status written before fields were stored
+        indexer = Indexer(sample_workspace)
+        all_status = indexer._load_all_status()
+        del all_status[str(path)]["fields_version"]
+        indexer._save_all_status(all_status)
+        embed_spy = mocker.spy(mock_embedder, "embed")
+
+        result = mcp_tools.embed_document(str(path), str(sample_workspace))
+
+        assert result["skipped"] == 1
+        assert embed_spy.call_count == 0
+        store.set_source_fields.assert_called_once()
+        assert store.set_source_fields.call_args[0][1]["conversation_type"] == "debug"
+        assert not indexer.fields_outdated(indexer.get_status(str(path)))
@@ -0,0 +1,144 @@
+"""Unit tests for the BM25 keyword index and hybrid search."""
+
+import pytest
+
+
+class TestTokenize:
+    """Tests for splitting text into index terms."""
+
+    def test_identifiers_and_parts(self):
+        """Test identifiers are kept whole and split into their parts."""
+        from cortext_rag.lexical import tokenize
+
+        assert tokenize("Fix PROJ-1234 in getUserById") == [
+            "fix",
+            "proj-1234",
+            "proj",
+            "1234",
+            "in",
+            "getuserbyid",
+            "get",
+            "user",
+            "by",
+            "id",
+        ]
+
+    def test_punctuation_is_not_part_of_terms(self):
+        """Test trailing punctuation and quotes are dropped."""
+        from cortext_rag.lexical import tokenize
+
+        assert tokenize('"ERR_TIMEOUT", then.') == ["err_timeout", "err", "timeout", "then"]
+
+
+class TestLexicalIndex:
+    """Tests for the FTS5 index."""
+
+    @pytest.fixture
+    def index(self, tmp_path):
+        from cortext_rag.lexical import LexicalIndex
+
+        index = LexicalIndex(tmp_path)
+        index.add(
+            ["a.md::0", "b.md::0", "b.md::1"],
+            ["a.md", "b.md", "b.md"],
+            [
+                "Login fails with ERR_TIMEOUT after PROJ-1234 was merged",
+                "We discussed caching strategies for the user service",
+                "getUserById returns stale data from the cache",
+            ],
+        )
+        return index
+
+    def test_exact_identifier_ranks_first(self, index):
+        """Test a rare identifier finds the chunk containing it."""
+        assert index.search("what broke in PROJ-1234", 10)[0][0] == "a.md::0"
+        assert [id_ for id_, _ in index.search("ERR_TIMEOUT", 10)] == ["a.md::0"]
+        assert index.search("user", 10)[0][0].startswith("b.md")
+
+    def test_no_matching_terms(self, index):
+        """Test queries without indexed terms return nothing."""
+        assert index.search("kubernetes", 10) == []
+        assert index.search("   ", 10) == []
+
+    def test_replace_delete_and_rename(self, index):
+        """Test entries follow updates, deletions and moved sources."""
+        index.add(["a.md::0"], ["a.md"], ["Nothing to see"])
+        assert index.search("PROJ-1234", 10) == []
+
+        index.delete(["b.md::1"])
+        assert index.count() == 2
+
+        index.rename_source("b.md", "c.md")
+        assert [id_ for id_, _ in index.search("caching", 10)] == ["c.md::0"]
+
+    def test_missing_index_is_empty(self, tmp_path):
+        """Test an index that was never written is not created by reads."""
+        from cortext_rag.lexical import LexicalIndex
+
+        index = LexicalIndex(tmp_path / "store")
+
+        assert index.search("anything", 10) == []
+        assert index.count() == 0
+        assert not index.exists
+
+
+class TestHybridSearch:
+    """Tests for fused vector and keyword search."""
+
+    @pytest.fixture
+    def workspace(self, sample_workspace, mock_embedder, mocker):
+        import json
+
+        from cortext_rag import mcp_tools
+        from cortext_rag import retriever as retriever_module
+
+        registry_path = sample_workspace / ".workspace" / "registry.json"
+        registry = json.loads(registry_path.read_text())
+        registry["rag"] = {"backend": "numpy"}
+        registry_path.write_text(json.dumps(registry))
+
+        mocker.patch.object(mcp_tools, "Embedder", return_value=mock_embedder)
+        mocker.patch.object(retriever_module, "Embedder", return_value=mock_embedder)
+        mcp_tools.embed_workspace(str(sample_workspace))
+        return sample_workspace
+
+    def test_keyword_match_ranks_first(self, workspace):
+        """Test hybrid search surfaces the chunk with the exact term."""
+        from cortext_rag.retriever import Retriever
+
+        retriever = Retriever(workspace)
+        results = retriever.search("JWT", n_results=3, mode="hybrid")
+
+        assert results and "JWT" in results[0].chunk.text
+        assert 0 < results[0].score <= 1.0
+
+    def test_filters_apply_to_keywords(self, workspace):
+        """Test type filters restrict keyword matches too."""
+        from cortext_rag.retriever import Retriever
+
+        results = Retriever(workspace).search(
+            "JWT", conversation_type="debug", mode="hybrid"
+        )
+
+        assert all(r.chunk.metadata["conversation_type"] == "debug" for r in results)
+
+    def test_invalid_mode(self, workspace):
+        """Test unknown search modes are rejected."""
+        from cortext_rag.retriever import Retriever
+
+        with pytest.raises(ValueError, match="Invalid search mode"):
+            Retriever(workspace).search("JWT", mode="fuzzy")
+
+    def test_reindex_builds_keyword_index(self, workspace):
+        """Test reindexing fills the keyword index of an existing store."""
+        from cortext_rag.store import VectorStore
+
+        store = VectorStore(workspace)
+        total = store.get_stats()["total_chunks"]
+        store.lexical.clear()
+        assert store.lexical_search("JWT") == []
+
+        store.reindex()
+
+        assert store.get_stats()["lexical_chunks"] == total
+        assert "JWT" in store.lexical_search("JWT")[0].chunk.text
@@ -0,0 +1,71 @@
+"""Unit tests for the workspace write lease."""
+
+import pytest
+
+
+class TestWriteLease:
+    """Tests for single-writer coordination."""
+
+    def test_second_writer_hands_off(self, tmp_path):
+        """Test a busy lease queues paths for the holder to process."""
+        from cortext_rag.locking import WriteLease
+
+        holder = WriteLease(tmp_path)
+        other = WriteLease(tmp_path)
+
+        assert holder.acquire()
+        batches = holder.batches(["a.md"])
+        assert next(batches) == ["a.md"]
+
+        assert other.acquire(handoff=["b.md", "a.md"]) is False
+        assert not other.held
+
+        assert next(batches) == ["b.md", "a.md"]
+        assert list(batches) == []
+        assert not holder.held
+        assert other.acquire()
+        other.release()
+
+    def test_wait_times_out(self, tmp_path):
+        """Test waiting without hand-off paths gives up after the timeout."""
+        from cortext_rag.locking import LeaseTimeout, WriteLease
+
+        holder = WriteLease(tmp_path)
+        holder.acquire()
+        try:
+            with pytest.raises(LeaseTimeout):
+                WriteLease(tmp_path, timeout=0.1).acquire()
+        finally:
+            holder.release()
+
+    def test_write_text_atomic(self, tmp_path):
+        """Test atomic writes replace the file and leave no temp files."""
+        from cortext_rag.locking import write_text_atomic
+
+        path = tmp_path / "status" / "file.json"
+        write_text_atomic(path, "old")
+        write_text_atomic(path, "new")
+
+        assert path.read_text() == "new"
+        assert [p.name for p in path.parent.iterdir()] == ["file.json"]
+
+    def test_embed_document_queued(self, sample_workspace, mocker):
+        """Test embed_document hands its path to a running writer."""
+        from cortext_rag import mcp_tools
+        from cortext_rag.locking import WriteLease
+
+        mocker.patch.object(mcp_tools, "Embedder")
+        mocker.patch.object(mcp_tools, "VectorStore")
+
+        holder = WriteLease(sample_workspace)
+        holder.acquire()
+        try:
+            result = mcp_tools.embed_document("plan", str(sample_workspace))
+            assert result["queued"] is True
+            assert result["embedded"] == 0
+
+            batches = list(holder.batches([]))
+        finally:
+            holder.release()
+
+        assert batches == [[str(sample_workspace / "plan")]]
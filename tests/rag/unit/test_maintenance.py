@@ -0,0 +1,187 @@
+"""Unit tests for store compaction and integrity checks."""
+
+import json
+
+import pytest
+
+
+def _embed_all(workspace, store):
+    """Store chunks and status for every document, with fake embeddings."""
+    from cortext_rag.indexer import Indexer
+
+    indexer = Indexer(workspace)
+    for path in indexer.find_documents(workspace):
+        doc = indexer.parse_document(path)
+        embeddings = [[1.0, float(i)] for i in range(len(doc.chunks))]
+        store.update_chunks(doc.chunks, embeddings, str(path))
+        indexer.update_status(doc, "test-model", 2)
+    return indexer
+
+
+class TestIntegrity:
+    """Tests for comparing the store with the status records."""
+
+    def _store(self, workspace):
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.store import VectorStore
+
+        return VectorStore(workspace, config=RAGConfig(backend="numpy"))
+
+    def test_consistent_store(self, sample_workspace):
+        """Test a freshly embedded workspace passes the check."""
+        from cortext_rag.maintenance import check_integrity
+
+        store = self._store(sample_workspace)
+        indexer = _embed_all(sample_workspace, store)
+
+        assert check_integrity(indexer, store).ok
+
+    def test_differences_found_and_repaired(self, sample_workspace):
+        """Test missing, orphaned and dangling paths are reported and fixed."""
+        from cortext_rag.maintenance import check_integrity, repair
+        from cortext_rag.models import Chunk
+
+        store = self._store(sample_workspace)
+        indexer = _embed_all(sample_workspace, store)
+        debug_doc = str(
+            sample_workspace / "debug" / "2025-11-10" / "002-login-bug" / "conversation.md"
+        )
+        plan_doc = str(
+            sample_workspace / "plan" / "2025-11-11" / "003-api-redesign" / "conversation.md"
+        )
+
+        store.delete_by_source(debug_doc)
+        orphan = Chunk(text="gone", source_path="deleted.md", chunk_index=0, total_chunks=1)
+        store.add_chunks([orphan], [[0.0, 1.0]], "deleted.md")
+        status = json.loads(indexer.status_file.read_text())
+        status["copy.md"] = {**status[plan_doc], "source_path": "copy.md", "shared_with": "gone.md"}
+        indexer.status_file.write_text(json.dumps(status))
+
+        report = check_integrity(indexer, store)
+
+        assert report.missing == [debug_doc]
+        assert report.orphaned == ["deleted.md"]
+        assert report.dangling == ["copy.md"]
+        assert report.mismatched == []
+
+        repair(report, indexer, store)
+
+        assert check_integrity(indexer, store).ok
+        assert indexer.get_status(debug_doc) is None
+
+
+class TestCompaction:
+    """Tests for rebuilding and vacuuming the store."""
+
+    @pytest.mark.parametrize("backend", ["numpy", "chroma"])
+    def test_compact_reclaims_deleted_chunks(self, sample_workspace, backend, mocker):
+        """Test compaction keeps live chunks and reports before/after figures."""
+        if backend == "chroma":
+            pytest.importorskip("chromadb")
+        from cortext_rag.backends import numpy_flat
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.maintenance import compact
+        from cortext_rag.models import Chunk
+        from cortext_rag.store import VectorStore
+
+        store = VectorStore(sample_workspace, config=RAGConfig(backend=backend))
+        indexer = _embed_all(sample_workspace, store)
+        churn = [
+            Chunk(text=f"old {i}", source_path="churn.md", chunk_index=i, total_chunks=50)
+            for i in range(50)
+        ]
+        store.add_chunks(churn, [[float(i), 1.0] for i in range(50)], "churn.md")
+        store.delete_by_source("churn.md")
+        # Vacuuming waits out the grace period of the merged segments
+        mocker.patch.object(numpy_flat, "RETIRE_GRACE", 0.1)
+
+        report = compact(store, indexer)
+
+        assert report.chunks == 3
+        assert report.size_after < report.size_before
+        assert report.latency_before_ms is not None
+        assert report.latency_after_ms is not None
+        assert report.integrity.ok
+        assert store.get_stats()["total_chunks"] == 3
+
+    def test_reader_follows_swapped_collection(self, sample_workspace):
+        """Test an open Chroma handle keeps working after another compacts."""
+        pytest.importorskip("chromadb")
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.store import VectorStore
+
+        config = RAGConfig(backend="chroma")
+        writer = VectorStore(sample_workspace, config=config)
+        _embed_all(sample_workspace, writer)
+        reader = VectorStore(sample_workspace, config=config)
+        assert len(reader.search([1.0, 0.0], n_results=5)) == 3
+
+        writer.compact()
+
+        assert len(reader.search([1.0, 0.0], n_results=5)) == 3
+        assert reader.get_stats()["total_chunks"] == 3
+
+    @pytest.mark.parametrize("backend", ["numpy", "chroma"])
+    def test_reads_continue_during_compaction(self, sample_workspace, backend, mocker):
+        """Test keyword matches and document vectors stay readable while rebuilt."""
+        if backend == "chroma":
+            pytest.importorskip("chromadb")
+        from cortext_rag.backends import numpy_flat
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.store import VectorStore
+
+        config = RAGConfig(backend=backend)
+        writer = VectorStore(sample_workspace, config=config)
+        _embed_all(sample_workspace, writer)
+        reader = VectorStore(sample_workspace, config=config)
+        keyword_hits = len(reader.lexical_search("JWT"))
+        assert keyword_hits and reader.documents.count() == 3
+        mocker.patch.object(numpy_flat, "RETIRE_GRACE", 0.0)
+
+        observed = []
+
+        def observe(method):
+            def wrapper(*args, **kwargs):
+                observed.append(
+                    (len(reader.lexical_search("JWT")), reader.documents.count())
+                )
+                return method(*args, **kwargs)
+
+            return wrapper
+
+        mocker.patch.object(writer, "_update_documents", observe(writer._update_documents))
+        mocker.patch.object(writer.lexical, "_insert", observe(writer.lexical._insert))
+
+        writer.compact()
+
+        assert observed and set(observed) == {(keyword_hits, 3)}
+        assert len(reader.lexical_search("JWT")) == keyword_hits
+        assert reader.documents.count() == 3
+
+    def test_interrupted_swap_is_restored_by_writers(self, sample_workspace):
+        """Test readers use the previous Chroma copy as is until a write restores it."""
+        pytest.importorskip("chromadb")
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.store import COLLECTION_NAME, VectorStore
+
+        config = RAGConfig(backend="chroma")
+        writer = VectorStore(sample_workspace, config=config)
+        _embed_all(sample_workspace, writer)
+        # A rebuild interrupted between its renames
+        writer.backend.collection.modify(name=f"{COLLECTION_NAME}__previous")
+
+        def names(store):
+            return {
+                getattr(c, "name", c) for c in store.backend._client.list_collections()
+            }
+
+        reader = VectorStore(sample_workspace, config=config)
+        assert len(reader.search([1.0, 0.0], n_results=5)) == 3
+        assert f"{COLLECTION_NAME}__previous" in names(reader)
+        assert COLLECTION_NAME not in names(reader)
+
+        writer.backend.delete(ids=["missing"])
+
+        assert COLLECTION_NAME in names(writer)
+        assert f"{COLLECTION_NAME}__previous" not in names(writer)
+        assert len(reader.search([1.0, 0.0], n_results=5)) == 3
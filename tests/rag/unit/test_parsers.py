@@ -90,6 +90,90 @@ class TestHTMLParser:
         assert "<p>" not in content
         assert metadata.get("title") == "Sample Page"
 
+    def test_parse_skips_non_content(self, tmp_path):
+        """Test script, style and comment text is dropped but tails kept."""
+        pytest.importorskip("lxml", reason="lxml not installed")
+        from cortext_rag.parsers.html import HTMLParser
+
+        html_file = tmp_path / "page.html"
+        html_file.write_text(
+            "<html><head><title>T</title><style>p {}</style></head><body>"
+            "<p>Before<script>var x = 1;</script> after</p>"
+            "<p>Kept<!-- hidden --> tail</p></body></html>"
+        )
+
+        content, metadata = HTMLParser().parse(html_file)
+
+        assert content.splitlines() == ["Before after", "Kept tail"]
+        assert metadata.get("title") == "T"
+
+    def test_remove_boilerplate(self, tmp_path):
+        """Test optional removal of navigation and footer chrome."""
+        pytest.importorskip("lxml", reason="lxml not installed")
+        from cortext_rag.parsers.html import HTMLParser
+
+        html_file = tmp_path / "page.html"
+        html_file.write_text(
+            "<html><body><nav>Home | About</nav>"
+            "<main><p>Article body</p></main>"
+            "<div role='contentinfo'>Copyright</div></body></html>"
+        )
+
+        full, _ = HTMLParser().parse(html_file)
+        stripped, _ = HTMLParser(remove_boilerplate=True).parse(html_file)
+
+        assert "Home | About" in full
+        assert stripped == "Article body"
+
+    def test_inline_elements_stay_joined(self, tmp_path):
+        """Test only block elements separate text, on both parse paths."""
+        pytest.importorskip("lxml", reason="lxml not installed")
+        pytest.importorskip("bs4", reason="beautifulsoup4 not installed")
+        from cortext_rag.parsers.html import HTMLParser
+
+        data = (
+            b"<html><body><p>foo<b>bar</b> and <a href='#'>link</a>s</p>"
+            b"<div>un<span>split</span></div>line<br>break</body></html>"
+        )
+        expected = "foobar and links\nunsplit\nline\nbreak"
+
+        parser = HTMLParser()
+        assert parser._parse_lxml(data)[1] == expected
+        assert parser._parse_soup(data)[1] == expected
+
+    def test_remove_boilerplate_from_config(self, sample_workspace):
+        """Test the workspace config enables boilerplate removal."""
+        pytest.importorskip("lxml", reason="lxml not installed")
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.indexer import Indexer
+
+        html_file = sample_workspace / "page.html"
+        html_file.write_text(
+            "<html><body><nav>Home | About</nav>"
+            "<main><p>Article body</p></main></body></html>"
+        )
+
+        default = Indexer(sample_workspace, config=RAGConfig())
+        stripped = Indexer(
+            sample_workspace, config=RAGConfig(html_remove_boilerplate=True)
+        )
+
+        assert "Home | About" in default.parse_document(html_file).content
+        assert stripped.parse_document(html_file).content == "Article body"
+
+    def test_fallback_on_unparseable_input(self, tmp_path):
+        """Test BeautifulSoup fallback when lxml rejects the input."""
+        pytest.importorskip("bs4", reason="beautifulsoup4 not installed")
+        from cortext_rag.parsers.html import HTMLParser
+
+        html_file = tmp_path / "empty.html"
+        html_file.write_text("")
+
+        content, metadata = HTMLParser().parse(html_file)
+
+        assert content == ""
+        assert metadata.get("title") == "empty"
+
     def test_supported_extensions(self):
         """Test supported file extensions."""
         from cortext_rag.parsers.html import HTMLParser
@@ -127,3 +211,119 @@ class TestParserFactory:
         unknown_file = tmp_path / "test.xyz"
         with pytest.raises(ValueError, match="Unsupported file type"):
             get_parser(unknown_file)
+
+    def test_parser_instances_are_cached(self, tmp_path):
+        """Test the registry returns one shared instance per parser class."""
+        from cortext_rag.parsers import get_parser
+
+        assert get_parser(tmp_path / "a.md") is get_parser(tmp_path / "b.md")
+        assert get_parser(tmp_path / "a.md") is get_parser(tmp_path / "c.markdown")
+
+    def test_parser_options_from_config(self, tmp_path):
+        """Test parsers built with different config options are separate."""
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.parsers import ParserRegistry
+
+        registry = ParserRegistry()
+        registry._entry_points_loaded = True
+        stripped_config = RAGConfig(html_remove_boilerplate=True)
+
+        default = registry.get(tmp_path / "a.html")
+        stripped = registry.get(tmp_path / "a.html", stripped_config)
+
+        assert not default.remove_boilerplate
+        assert stripped.remove_boilerplate
+        assert registry.get(tmp_path / "b.htm", RAGConfig()) is default
+        assert registry.get(tmp_path / "b.htm", stripped_config) is stripped
+
+    def test_register_custom_parser(self, tmp_path):
+        """Test new formats plug into the registry."""
+        from cortext_rag.parsers import ParserRegistry
+
+        class RSTParser:
+            supported_extensions = [".rst"]
+
+            def parse(self, path):
+                return path.read_text(), {}
+
+        registry = ParserRegistry()
+        registry._entry_points_loaded = True
+        registry.register(["rst"], RSTParser)
+
+        assert isinstance(registry.get(tmp_path / "doc.RST"), RSTParser)
+        assert ".rst" in registry.extensions
+
+    def test_entry_point_parsers(self, tmp_path, mocker):
+        """Test parsers advertised through entry points are registered."""
+        from cortext_rag import parsers
+        from cortext_rag.parsers import ParserRegistry
+
+        class OrgParser:
+            supported_extensions = [".org"]
+
+            def parse(self, path):
+                return path.read_text(), {}
+
+        entry_point = mocker.Mock()
+        entry_point.name = "org"
+        entry_point.load.return_value = OrgParser
+        mocker.patch.object(parsers, "entry_points", return_value=[entry_point])
+
+        registry = ParserRegistry()
+
+        assert isinstance(registry.get(tmp_path / "notes.org"), OrgParser)
+
+
+class TestNotebookParser:
+    """Tests for Jupyter notebook parser."""
+
+    def test_parse_notebook(self, tmp_path):
+        """Test markdown and code sources are extracted, outputs skipped."""
+        import json
+
+        from cortext_rag.parsers.notebook import NotebookParser
+
+        nb_file = tmp_path / "analysis.ipynb"
+        nb_file.write_text(
+            json.dumps(
+                {
+                    "cells": [
+                        {"cell_type": "markdown", "source": ["# Findings\n", "Latency is up"]},
+                        {
+                            "cell_type": "code",
+                            "source": "df.describe()",
+                            "outputs": [{"text": "huge output"}],
+                        },
+                    ],
+                    "metadata": {"language_info": {"name": "python"}},
+                }
+            )
+        )
+
+        content, metadata = NotebookParser().parse(nb_file)
+
+        assert "# Findings\nLatency is up" in content
+        assert "df.describe()" in content
+        assert "huge output" not in content
+        assert metadata["num_cells"] == 2
+        assert metadata["language"] == "python"
+
+
+class TestCSVParser:
+    """Tests for CSV parser."""
+
+    def test_parse_csv(self, tmp_path):
+        """Test rows are rendered with their column names."""
+        from cortext_rag.parsers.csv import CSVParser
+
+        csv_file = tmp_path / "tickets.csv"
+        csv_file.write_text("id,title,status\nPROJ-1,Login fails,open\nPROJ-2,,closed\n")
+
+        content, metadata = CSVParser().parse(csv_file)
+
+        assert content.splitlines() == [
+            "id: PROJ-1; title: Login fails; status: open",
+            "id: PROJ-2; status: closed",
+        ]
+        assert metadata["num_rows"] == 2
+        assert metadata["columns"] == "id, title, status"
@@ -0,0 +1,89 @@
+"""Unit tests for embedding planner."""
+
+import pytest
+
+
+class TestPlanner:
+    """Tests for change set computation and cost estimates."""
+
+    def _embed_all(self, workspace):
+        """Record status for every document as if embedded."""
+        from cortext_rag.indexer import Indexer
+
+        indexer = Indexer(workspace)
+        for path in indexer.find_documents(workspace / "brainstorm"):
+            indexer.update_status(indexer.parse_document(path), "test-model", 384)
+        return indexer
+
+    def test_plan_new_files(self, sample_workspace):
+        """Test unembedded files are planned as new with chunk estimates."""
+        from cortext_rag.planner import plan_embedding
+
+        plan = plan_embedding(sample_workspace, [sample_workspace / "brainstorm"])
+
+        assert len(plan.new) == 1
+        assert plan.estimated_chunks == 1
+        # No throughput recorded yet
+        assert plan.estimated_seconds is None
+
+    def test_plan_unchanged_modified_deleted(self, sample_workspace):
+        """Test stat/hash change detection."""
+        from cortext_rag.planner import plan_embedding
+
+        self._embed_all(sample_workspace)
+        conv_dir = sample_workspace / "brainstorm" / "2025-11-10" / "001-auth-patterns"
+        (conv_dir / "notes.md").write_text("Extra notes")
+        self._embed_all(sample_workspace)
+
+        (conv_dir / "conversation.md").write_text("# Changed\n\nNew body.")
+        (conv_dir / "notes.md").unlink()
+
+        plan = plan_embedding(sample_workspace, [sample_workspace / "brainstorm"])
+
+        assert plan.modified == [str(conv_dir / "conversation.md")]
+        assert plan.deleted == [str(conv_dir / "notes.md")]
+        assert plan.new == []
+        assert plan.estimated_chunks == 1
+
+    def test_plan_touched_file_is_unchanged(self, sample_workspace):
+        """Test an mtime change without content change needs no embedding."""
+        import os
+
+        from cortext_rag.planner import plan_embedding
+
+        self._embed_all(sample_workspace)
+        conv_file = next((sample_workspace / "brainstorm").rglob("conversation.md"))
+        os.utime(conv_file, ns=(1, 1))
+
+        plan = plan_embedding(sample_workspace, [sample_workspace / "brainstorm"])
+
+        assert plan.unchanged == [str(conv_file)]
+        assert plan.estimated_chunks == 0
+
+    def test_plan_renamed(self, sample_workspace):
+        """Test a moved file is reported as a rename costing no inference."""
+        from cortext_rag.planner import plan_embedding
+
+        self._embed_all(sample_workspace)
+        old = next((sample_workspace / "brainstorm").rglob("conversation.md"))
+        new = old.with_name("renamed.md")
+        old.rename(new)
+
+        plan = plan_embedding(sample_workspace, [sample_workspace / "brainstorm"])
+
+        assert plan.renamed == [(str(old), str(new))]
+        assert plan.new == []
+        assert plan.deleted == []
+        assert plan.estimated_chunks == 0
+
+    def test_estimate_uses_recorded_throughput(self, sample_workspace):
+        """Test time estimates come from measured throughput."""
+        from cortext_rag.planner import plan_embedding, record_throughput
+
+        record_throughput(sample_workspace, chunks=100, seconds=2.0)
+        record_throughput(sample_workspace, chunks=100, seconds=2.0, model_load_seconds=1.5)
+
+        plan = plan_embedding(sample_workspace, [sample_workspace / "brainstorm"])
+
+        assert plan.chunks_per_second == pytest.approx(50.0)
+        assert plan.estimated_seconds == pytest.approx(1 / 50.0 + 1.5)
@@ -0,0 +1,120 @@
+"""Unit tests for dimensionality-reducing projections."""
+
+import json
+
+import numpy as np
+import pytest
+
+
+def _low_rank(rows=2000, dim=64, rank=8, seed=0):
+    rng = np.random.default_rng(seed)
+    basis = rng.standard_normal((rank, dim))
+    return (rng.standard_normal((rows, rank)) @ basis + 0.05 * rng.standard_normal((rows, dim))).astype(
+        np.float32
+    )
+
+
+class TestFit:
+    """Tests for fitting projection matrices."""
+
+    def test_pca_keeps_neighbors(self):
+        """Test PCA to the data's rank keeps nearly all exact neighbors."""
+        from cortext_rag.projection import fit_pca, fit_random, recall_at_k
+
+        sample = _low_rank()
+        pca = fit_pca(sample, 8)
+
+        assert pca.shape == (64, 8)
+        np.testing.assert_allclose(pca.T @ pca, np.eye(8), atol=1e-4)
+        assert recall_at_k(sample, pca) >= 0.9
+        assert recall_at_k(sample, pca) > recall_at_k(sample, fit_random(64, 8))
+
+    def test_split_holdout(self):
+        """Test recall rows are held out of the fitting rows."""
+        from cortext_rag.projection import split_holdout
+
+        sample = _low_rank(rows=100)
+        fit_rows, held_out = split_holdout(sample)
+
+        assert len(fit_rows) == 80 and len(held_out) == 20
+        np.testing.assert_array_equal(np.concatenate([fit_rows, held_out]), sample)
+
+    def test_recall_needs_enough_vectors(self):
+        """Test recall is not reported for tiny samples."""
+        from cortext_rag.projection import fit_random, recall_at_k
+
+        assert recall_at_k(np.ones((5, 4), np.float32), fit_random(4, 2)) is None
+
+
+class TestProjectStore:
+    """Tests for applying a projection to a workspace."""
+
+    @pytest.fixture
+    def workspace(self, sample_workspace, mock_embedder, mocker):
+        from cortext_rag import mcp_tools
+        from cortext_rag import retriever as retriever_module
+
+        registry_path = sample_workspace / ".workspace" / "registry.json"
+        registry = json.loads(registry_path.read_text())
+        registry["rag"] = {"backend": "numpy"}
+        registry_path.write_text(json.dumps(registry))
+
+        mocker.patch.object(mcp_tools, "Embedder", return_value=mock_embedder)
+        mocker.patch.object(retriever_module, "Embedder", return_value=mock_embedder)
+        mcp_tools.embed_workspace(str(sample_workspace))
+        return sample_workspace
+
+    def test_dry_run_leaves_store(self, workspace):
+        """Test a dry run reports dimensions without changing anything."""
+        from cortext_rag import mcp_tools
+        from cortext_rag.projection import HOLDOUT_FRACTION, Projection
+
+        result = mcp_tools.project_store(str(workspace), dim=16, dry_run=True)
+
+        assert result["stored_dim"] == 384 and result["dim"] == 16
+        assert result["held_out"] == int(result["sample"] * HOLDOUT_FRACTION)
+        assert Projection.load(workspace) is None
+        assert mcp_tools.get_embedding_status(str(workspace))["projection"] is None
+
+    def test_project_and_search(self, workspace):
+        """Test stored vectors, queries and new chunks use the projection."""
+        from cortext_rag import mcp_tools
+        from cortext_rag.indexer import Indexer
+        from cortext_rag.store import VectorStore
+
+        before = mcp_tools.search_semantic("jwt tokens", str(workspace))
+        result = mcp_tools.project_store(str(workspace), dim=16, method="random")
+
+        assert result["rewritten"] == VectorStore(workspace).get_stats()["total_chunks"]
+        store = VectorStore(workspace)
+        assert {len(v) for v in store.sample_embeddings(100)} == {16}
+        statuses = Indexer(workspace).get_all_status().values()
+        assert {s.projection for s in statuses} == {result["version"]}
+
+        after = mcp_tools.search_semantic("jwt tokens", str(workspace))
+        assert after["num_results"] == before["num_results"]
+
+        # Projected again: the two matrices compose
+        again = mcp_tools.project_store(str(workspace), dim=8)
+        assert again["source_dim"] == 384 and again["stored_dim"] == 16
+        assert mcp_tools.get_embedding_status(str(workspace))["projection"]["dim"] == 8
+
+        doc = workspace / "brainstorm" / "2025-11-10" / "001-auth-patterns" / "conversation.md"
+        doc.write_text(doc.read_text() + "\nNew idea: passkeys\n")
+        assert mcp_tools.embed_workspace(str(workspace))["embedded"] == 1
+        assert {len(v) for v in store.get_source_embeddings(str(doc))} == {8}
+        assert mcp_tools.search_semantic("passkeys", str(workspace))["num_results"] > 0
+
+    def test_remove_requires_reembedding(self, workspace):
+        """Test removing the projection clears the store for re-embedding."""
+        from cortext_rag import mcp_tools
+        from cortext_rag.store import VectorStore
+
+        mcp_tools.project_store(str(workspace), dim=16)
+        assert mcp_tools.project_store(str(workspace), remove=True)["success"]
+        assert VectorStore(workspace).get_stats()["total_chunks"] == 0
+
+        result = mcp_tools.embed_workspace(str(workspace))
+
+        assert result["embedded"] == 3
+        assert {len(v) for v in VectorStore(workspace).sample_embeddings(100)} == {384}
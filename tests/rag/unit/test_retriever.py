@@ -0,0 +1,620 @@
+"""Unit tests for the retriever."""
+
+import pytest
+
+
+class TestRetrieverFilters:
+    """Tests for building metadata filters from search parameters."""
+
+    def test_type_and_month(self, sample_workspace):
+        """Test type equality and month ranges on structured fields."""
+        from cortext_rag.retriever import Retriever
+
+        where = Retriever(sample_workspace)._build_filter("debug", "2025-11")
+
+        assert where == {
+            "$and": [
+                {"conversation_type": "debug"},
+                {"conversation_date": {"$gte": 20251101}},
+                {"conversation_date": {"$lte": 20251130}},
+            ]
+        }
+
+    def test_exact_day_and_open_range(self, sample_workspace):
+        """Test a full date matches exactly and from/to are inclusive bounds."""
+        from cortext_rag.retriever import Retriever
+
+        retriever = Retriever(sample_workspace)
+
+        assert retriever._build_filter(date_range="2025-11-10") == {
+            "conversation_date": 20251110
+        }
+        assert retriever._build_filter(date_from="2024", date_to="2025-03") == {
+            "$and": [
+                {"conversation_date": {"$gte": 20240101}},
+                {"conversation_date": {"$lte": 20250331}},
+            ]
+        }
+        assert retriever._build_filter() is None
+
+    def test_invalid_date(self, sample_workspace):
+        """Test malformed and impossible dates are rejected."""
+        from cortext_rag.retriever import Retriever
+
+        retriever = Retriever(sample_workspace)
+        for value in ("last week", "2025-13", "2025-02-45", "2025-02-29", "2025-00"):
+            with pytest.raises(ValueError, match="Invalid date"):
+                retriever._build_filter(date_from=value)
+
+    def test_month_ends(self, sample_workspace):
+        """Test month ranges end on the month's real last day."""
+        from cortext_rag.retriever import _date_bounds
+
+        assert _date_bounds("2024-02") == (20240201, 20240229)
+        assert _date_bounds("2025-02") == (20250201, 20250228)
+        assert _date_bounds("2025") == (20250101, 20251231)
+
+    def test_range_query_on_store(self, sample_workspace, mock_embedder, mocker):
+        """Test date ranges select chunks through the store filter."""
+        import json
+
+        from cortext_rag import mcp_tools
+
+        registry_path = sample_workspace / ".workspace" / "registry.json"
+        registry = json.loads(registry_path.read_text())
+        registry["rag"] = {"backend": "numpy"}
+        registry_path.write_text(json.dumps(registry))
+
+        mocker.patch.object(mcp_tools, "Embedder", return_value=mock_embedder)
+        mcp_tools.embed_workspace(str(sample_workspace))
+
+        from cortext_rag import retriever as retriever_module
+
+        mocker.patch.object(retriever_module, "Embedder", return_value=mock_embedder)
+        result = mcp_tools.search_semantic(
+            "api", str(sample_workspace), date_from="2025-11-11"
+        )
+
+        assert result["num_results"] > 0
+        assert all("003-api-redesign" in r["source_path"] for r in result["results"])
+
+
+class TestDeduplicatedSearch:
+    """Tests for filtered searches over deduplicated copies."""
+
+    @pytest.mark.parametrize("backend", ["chroma", "numpy"])
+    def test_filters_match_copy_fields(self, sample_workspace, mock_embedder, mocker, backend):
+        """Test a copy in another type folder is found by its own type and date."""
+        import json
+
+        from cortext_rag import mcp_tools
+        from cortext_rag import retriever as retriever_module
+        from cortext_rag.retriever import Retriever
+
+        registry_path = sample_workspace / ".workspace" / "registry.json"
+        registry = json.loads(registry_path.read_text())
+        registry["rag"] = {"backend": backend}
+        registry_path.write_text(json.dumps(registry))
+
+        owner = (
+            sample_workspace / "brainstorm" / "2025-11-10" / "001-auth-patterns"
+        ) / "conversation.md"
+        copy_dir = sample_workspace / "debug" / "2025-11-12" / "004-auth-copy"
+        copy_dir.mkdir(parents=True)
+        copy = copy_dir / "conversation.md"
+        copy.write_text(owner.read_text())
+
+        mocker.patch.object(mcp_tools, "Embedder", return_value=mock_embedder)
+        mocker.patch.object(retriever_module, "Embedder", return_value=mock_embedder)
+        result = mcp_tools.embed_workspace(str(sample_workspace))
+        assert result["shared"] == 1
+
+        retriever = Retriever(sample_workspace)
+        by_type = retriever.search("JWT tokens", n_results=10, conversation_type="debug")
+        by_date = retriever.search("JWT tokens", n_results=10, date_range="2025-11-12")
+        grouped = retriever.search(
+            "JWT tokens", n_results=10, conversation_type="debug", group_by="document"
+        )
+        unfiltered = retriever.search("JWT tokens", n_results=10)
+
+        copies = [r for r in by_type if r.chunk.source_path == str(copy)]
+        assert copies and all(r.also_in == [str(owner)] for r in copies)
+        assert all(r.chunk.metadata["conversation_type"] == "debug" for r in by_type)
+        assert str(owner) not in {r.chunk.source_path for r in by_type}
+        assert {r.chunk.source_path for r in by_date} == {str(copy)}
+        assert str(copy) in {r.chunk.source_path for r in grouped}
+        assert all(
+            r.also_in == [str(copy)]
+            for r in unfiltered
+            if r.chunk.source_path == str(owner)
+        )
+
+
+class TestSearchMany:
+    """Tests for batched multi-query search."""
+
+    @pytest.fixture
+    def workspace(self, sample_workspace, mock_embedder, mocker):
+        import json
+
+        from cortext_rag import mcp_tools
+        from cortext_rag import retriever as retriever_module
+
+        registry_path = sample_workspace / ".workspace" / "registry.json"
+        registry = json.loads(registry_path.read_text())
+        registry["rag"] = {"backend": "numpy"}
+        registry_path.write_text(json.dumps(registry))
+
+        mocker.patch.object(mcp_tools, "Embedder", return_value=mock_embedder)
+        mocker.patch.object(retriever_module, "Embedder", return_value=mock_embedder)
+        mcp_tools.embed_workspace(str(sample_workspace))
+        return sample_workspace
+
+    def test_matches_single_searches(self, workspace, mocker):
+        """Test each query gets the results of its own search, in one batch."""
+        from cortext_rag.retriever import Retriever
+
+        retriever = Retriever(workspace)
+        queries = ["auth tokens", "login bug", "api design"]
+        embed = mocker.spy(retriever.embedder, "embed")
+        query = mocker.spy(retriever.store.backend, "query")
+
+        rankings = retriever.search_many(queries, n_results=3)
+
+        assert embed.call_count == 1 and query.call_count == 1
+        for text, ranking in zip(queries, rankings):
+            single = retriever.search(text, n_results=3)
+            assert [r.chunk.chunk_id for r in ranking] == [r.chunk.chunk_id for r in single]
+
+    def test_fused_ranking(self, workspace):
+        """Test the MCP tool returns per-query results and a fused ranking."""
+        from cortext_rag import mcp_tools
+
+        result = mcp_tools.search_many(
+            ["auth tokens", "login bug"], str(workspace), n_results=2, fuse=True
+        )
+
+        assert [r["query"] for r in result["results"]] == ["auth tokens", "login bug"]
+        assert 0 < len(result["fused"]) <= 2
+        assert result["fused"][0]["score"] <= 1.0
+        assert mcp_tools.search_many([], str(workspace))["results"] == []
+
+
+class TestSearchDeadline:
+    """Tests for searches with a latency deadline."""
+
+    @pytest.fixture
+    def workspace(self, sample_workspace, mock_embedder, mocker):
+        import json
+
+        from cortext_rag import mcp_tools
+        from cortext_rag import retriever as retriever_module
+
+        registry_path = sample_workspace / ".workspace" / "registry.json"
+        registry = json.loads(registry_path.read_text())
+        registry["rag"] = {"backend": "numpy"}
+        registry_path.write_text(json.dumps(registry))
+
+        mocker.patch.object(mcp_tools, "Embedder", return_value=mock_embedder)
+        mocker.patch.object(retriever_module, "Embedder", return_value=mock_embedder)
+        mcp_tools.embed_workspace(str(sample_workspace))
+        return sample_workspace
+
+    def test_slow_search_falls_back_to_keywords(self, workspace, mocker):
+        """Test a missed deadline returns keyword matches and caches the search."""
+        import threading
+        import time
+
+        from cortext_rag.retriever import Retriever
+
+        retriever = Retriever(workspace)
+        loaded = threading.Event()
+        embed = retriever.embedder.embed
+        mocker.patch.object(
+            retriever.embedder,
+            "embed",
+            side_effect=lambda texts: loaded.wait() and embed(texts),
+        )
+
+        results = retriever.search("JWT", n_results=3, timeout_ms=50)
+
+        assert retriever.degraded
+        assert results and "JWT" in results[0].chunk.text
+
+        # The search finishes in the background and serves the next call
+        loaded.set()
+        for _ in range(100):
+            results = retriever.search("JWT", n_results=3, timeout_ms=50)
+            if not retriever.degraded:
+                break
+            time.sleep(0.05)
+        assert not retriever.degraded
+        assert [r.chunk.chunk_id for r in results] == [
+            r.chunk.chunk_id for r in retriever.search("JWT", n_results=3)
+        ]
+
+    def _blocked(self, retriever, mocker):
+        """Make embedding wait until the returned event is set."""
+        import threading
+
+        loaded = threading.Event()
+        embed = retriever.embedder.embed
+        mocker.patch.object(
+            retriever.embedder,
+            "embed",
+            side_effect=lambda texts: loaded.wait() and embed(texts),
+        )
+        return loaded
+
+    def test_search_many_falls_back_per_query(self, workspace, mocker):
+        """Test a missed deadline returns keyword matches for each query."""
+        from cortext_rag import mcp_tools
+        from cortext_rag.retriever import Retriever
+
+        retriever = Retriever(workspace)
+        loaded = self._blocked(retriever, mocker)
+
+        rankings = retriever.search_many(["JWT", "nomatchword"], timeout_ms=50)
+        loaded.set()
+
+        assert retriever.degraded
+        assert rankings[0] and "JWT" in rankings[0][0].chunk.text
+        assert rankings[1] == []
+
+        result = mcp_tools.search_many(["JWT"], str(workspace), timeout_ms=5000)
+        assert result["degraded"] is False
+        assert result["results"][0]["num_results"] > 0
+
+    def test_fallback_without_keyword_index(self, workspace, mocker):
+        """Test stores built without a keyword index fall back to a text scan."""
+        from cortext_rag.retriever import Retriever
+
+        retriever = Retriever(workspace)
+        for path in retriever.store.lexical.path.parent.glob("lexical.sqlite3*"):
+            path.unlink()
+        loaded = self._blocked(retriever, mocker)
+
+        results = retriever.search("JWT", n_results=3, timeout_ms=50)
+        grouped = retriever.search(
+            "JWT tokens", n_results=3, group_by="document", timeout_ms=50
+        )
+        loaded.set()
+
+        assert retriever.degraded
+        assert results and "JWT" in results[0].chunk.text
+        assert all(r.also_in == [] for r in results)
+        sources = [r.chunk.source_path for r in grouped]
+        assert sources and len(sources) == len(set(sources))
+        assert not retriever.store.lexical.exists
+
+    def test_slow_keyword_index_is_bounded(self, workspace, mocker):
+        """Test the keyword fallback does not outlast the deadline."""
+        import time
+
+        from cortext_rag.retriever import Retriever
+
+        retriever = Retriever(workspace)
+        loaded = self._blocked(retriever, mocker)
+        mocker.patch.object(
+            retriever.store,
+            "lexical_search",
+            side_effect=lambda *args, **kwargs: loaded.wait() and [],
+        )
+
+        started = time.monotonic()
+        results = retriever.search("JWT", n_results=3, timeout_ms=100)
+        elapsed = time.monotonic() - started
+        loaded.set()
+
+        assert retriever.degraded and results == []
+        assert elapsed < 2.0
+
+    def test_fast_search_is_not_degraded(self, workspace):
+        """Test searches within the deadline return the semantic results."""
+        from cortext_rag import mcp_tools
+
+        result = mcp_tools.search_semantic("auth tokens", str(workspace), timeout_ms=10_000)
+        plain = mcp_tools.search_semantic("auth tokens", str(workspace))
+
+        assert result["degraded"] is False
+        assert result["results"] == plain["results"]
+
+
+class TestGroupedSearch:
+    """Tests for document-grouped search."""
+
+    @pytest.fixture
+    def retriever(self, tmp_path, mocker):
+        from cortext_rag import retriever as retriever_module
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.models import Chunk
+        from cortext_rag.store import VectorStore
+
+        class Embedder:
+            model_name = "fake"
+
+            def embed(self, texts):
+                return [[1.0, 0.0] for _ in texts]
+
+            def rerank(self, query, texts, budget_seconds=None):
+                # Prefers a.md, then b.md; stops after five texts as if out of time
+                scores = {"a.md": 2.0, "b.md": 1.0}
+                return [scores.get(text.split()[0], 0.0) for text in texts][:5]
+
+        mocker.patch.object(retriever_module, "Embedder", return_value=Embedder())
+        mocker.patch.object(
+            retriever_module,
+            "VectorStore",
+            lambda ws: VectorStore(ws, RAGConfig(backend="numpy")),
+        )
+        retriever = retriever_module.Retriever(tmp_path)
+
+        # long.md crowds the top chunk hits; three other documents follow
+        sources = [("long.md", 0.1 * i) for i in range(8)] + [
+            ("a.md", 0.85),
+            ("b.md", 0.9),
+            ("b.md", 0.05),
+            ("c.md", 0.95),
+        ]
+        counts: dict[str, int] = {}
+        for source_path, angle in sources:
+            index = counts.get(source_path, 0)
+            counts[source_path] = index + 1
+            chunk = Chunk(
+                text=f"{source_path} {index}",
+                source_path=source_path,
+                chunk_index=index,
+                total_chunks=1,
+            )
+            retriever.store.add_chunks([chunk], [[1.0, angle]], source_path)
+        return retriever
+
+    def test_distinct_documents_with_best_chunks(self, retriever, mocker):
+        """Test grouping over-fetches until enough documents are found."""
+        search = mocker.spy(retriever.store, "search")
+
+        results = retriever.search("q", n_results=3, group_by="document")
+
+        assert [r.chunk.source_path for r in results] == ["long.md", "b.md", "a.md"]
+        assert [o.chunk.chunk_index for o in results[0].other_chunks] == [1, 2]
+        assert results[1].chunk.text == "b.md 1"
+        assert results[1].other_chunks[0].chunk.text == "b.md 0"
+        assert search.call_count == 2
+
+    def test_softmax_bounded_by_max(self, retriever):
+        """Test softmax scores never exceed the best chunk score."""
+        by_max, by_softmax = (
+            {
+                r.chunk.source_path: r.score
+                for r in retriever.search(
+                    "q", n_results=4, group_by="document", aggregate=aggregate
+                )
+            }
+            for aggregate in ("max", "softmax")
+        )
+
+        assert by_softmax["long.md"] < by_max["long.md"] <= 1.0
+        assert by_softmax["a.md"] == pytest.approx(by_max["a.md"])
+
+    def test_softmax_stable_across_fetch_depth(self):
+        """Test weak hits from a deeper fetch barely move the softmax score."""
+        from cortext_rag.retriever import _aggregate
+
+        shallow = [0.9, 0.88, 0.85]
+        deep = shallow + [0.4] * 50
+
+        assert _aggregate(shallow, "softmax") <= 0.9
+        assert _aggregate(deep, "softmax") == pytest.approx(
+            _aggregate(shallow, "softmax"), abs=1e-3
+        )
+
+    def test_rerank_with_partial_scores(self, retriever):
+        """Test scored candidates are reordered and unscored ones follow."""
+        results = retriever.search("q", n_results=20, rerank=True)
+
+        assert len(results) == 12
+        assert [r.rerank_score is not None for r in results[:6]] == [True] * 5 + [False]
+        # b.md's best chunk ranked second before reranking
+        assert results[0].chunk.source_path == "b.md"
+        assert results[5].chunk.source_path == "long.md"
+        assert retriever.search("q", n_results=3, rerank=False)[0].rerank_score is None
+
+    def test_rerank_groups(self, retriever):
+        """Test reranking reorders document groups by their best chunks."""
+        results = retriever.search("q", n_results=3, group_by="document", rerank=True)
+
+        assert results[0].chunk.source_path == "a.md"
+        assert results[0].rerank_score == 2.0
+
+    def test_invalid_grouping(self, retriever):
+        """Test unknown group_by and aggregate values are rejected."""
+        with pytest.raises(ValueError, match="group_by"):
+            retriever.search("q", group_by="conversation")
+        with pytest.raises(ValueError, match="aggregate"):
+            retriever.search("q", group_by="document", aggregate="mean")
+
+
+class TestDiversity:
+    """Tests for maximal marginal relevance."""
+
+    def test_mmr_skips_near_duplicates(self):
+        """Test a near-duplicate of the top result is passed over."""
+        import numpy as np
+
+        from cortext_rag.retriever import maximal_marginal_relevance
+
+        vectors = np.array([[1, 0, 0], [0.99, 0.01, 0], [0, 1, 0], [0, 0, 1]], np.float32)
+        relevance = np.array([0.9, 0.89, 0.7, 0.5], np.float32)
+
+        assert maximal_marginal_relevance(relevance, vectors, 3, 0.0) == [0, 1, 2]
+        assert maximal_marginal_relevance(relevance, vectors, 3, 0.5) == [0, 2, 3]
+        assert maximal_marginal_relevance(relevance, vectors, 10, 0.5) == [0, 2, 3, 1]
+        assert maximal_marginal_relevance(relevance[:0], vectors[:0], 3, 0.5) == []
+
+    def test_search_diversity(self, tmp_path, mocker):
+        """Test diversified searches cover more documents for the same n_results."""
+        from cortext_rag import retriever as retriever_module
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.models import Chunk
+        from cortext_rag.store import VectorStore
+
+        class Embedder:
+            model_name = "fake"
+
+            def embed(self, texts):
+                return [[1.0, 0.0, 0.0] for _ in texts]
+
+        mocker.patch.object(retriever_module, "Embedder", return_value=Embedder())
+        mocker.patch.object(
+            retriever_module,
+            "VectorStore",
+            lambda ws: VectorStore(ws, RAGConfig(backend="numpy")),
+        )
+        retriever = retriever_module.Retriever(tmp_path)
+        # Three copies of one decision, then two different discussions
+        vectors = [[1, 0.1, 0], [1, 0.11, 0], [1, 0.12, 0], [1, 0.8, 0], [1, 0, 0.9]]
+        for i, vector in enumerate(vectors):
+            chunk = Chunk(
+                text=f"note {i}", source_path=f"{i}.md", chunk_index=0, total_chunks=1
+            )
+            retriever.store.add_chunks([chunk], [vector], chunk.source_path)
+
+        plain = retriever.search("q", n_results=3)
+        diverse = retriever.search("q", n_results=3, diversity=0.6)
+
+        assert [r.chunk.text for r in plain] == ["note 0", "note 1", "note 2"]
+        assert [r.chunk.text for r in diverse] == ["note 0", "note 4", "note 3"]
+        with pytest.raises(ValueError, match="diversity"):
+            retriever.search("q", diversity=1.5)
+
+
+class TestRerankBudget:
+    """Tests for the cross-encoder time budget."""
+
+    def test_stops_between_batches(self, mocker):
+        """Test no batch starts once the budget is spent."""
+        from cortext_rag import embedder as embedder_module
+        from cortext_rag.embedder import RERANK_BATCH_SIZE, Embedder
+
+        class CrossEncoder:
+            def rerank(self, query, documents, batch_size):
+                return [float(len(text)) for text in documents]
+
+        embedder = Embedder()
+        embedder._reranker = CrossEncoder()
+        # Each clock reading advances 0.1s: start, then one check per batch
+        clock = iter(i * 0.1 for i in range(100))
+        mocker.patch.object(embedder_module.time, "perf_counter", lambda: next(clock))
+
+        texts = ["x" * i for i in range(RERANK_BATCH_SIZE * 4)]
+        scores = embedder.rerank("q", texts, budget_seconds=0.25)
+
+        assert scores == [float(i) for i in range(RERANK_BATCH_SIZE * 2)]
+        assert len(embedder.rerank("q", texts)) == len(texts)
+
+    def test_cross_encoder_loaded_once_per_process(self, mocker):
+        """Test embedders share the cross-encoder and its load counts against the budget."""
+        import sys
+        import types
+
+        from cortext_rag import embedder as embedder_module
+        from cortext_rag.embedder import Embedder
+
+        loads = []
+
+        class TextCrossEncoder:
+            def __init__(self, model_name):
+                loads.append(model_name)
+
+            def rerank(self, query, documents, batch_size):
+                return [1.0 for _ in documents]
+
+        module = types.ModuleType("fastembed.rerank.cross_encoder")
+        module.TextCrossEncoder = TextCrossEncoder
+        mocker.patch.dict(sys.modules, {"fastembed.rerank.cross_encoder": module})
+        mocker.patch.dict(embedder_module._MODELS, clear=True)
+        # Loading takes 1s on this clock
+        clock = iter([0.0, 1.0, 1.0, 1.0])
+        mocker.patch.object(embedder_module.time, "perf_counter", lambda: next(clock))
+
+        assert Embedder().rerank("q", ["a", "b"], budget_seconds=0.5) == []
+        assert Embedder().rerank("q", ["a", "b"]) == [1.0, 1.0]
+        assert len(loads) == 1
+
+
+class TestContextExpansion:
+    """Tests for merging hits with their neighboring chunks."""
+
+    @staticmethod
+    def _chunks(source_path, total=5, size=6, step=4):
+        from cortext_rag.models import Chunk
+
+        # Consecutive chunks share size - step words, as the indexer's overlap
+        words = [f"w{i}" for i in range(step * (total - 1) + size)]
+        return [
+            Chunk(
+                text=" ".join(words[i * step : i * step + size]),
+                source_path=source_path,
+                chunk_index=i,
+                total_chunks=total,
+                metadata={"start_word": i * step, "end_word": i * step + size},
+            )
+            for i in range(total)
+        ]
+
+    def test_merge_removes_overlap(self):
+        """Test merged chunks read as one passage without repeated words."""
+        from cortext_rag.retriever import merge_chunks
+
+        chunks = self._chunks("a.md")
+
+        assert merge_chunks(chunks[1:4]) == " ".join(f"w{i}" for i in range(4, 18))
+        assert merge_chunks(chunks[:1]) == chunks[0].text
+
+        # Text that no longer matches its word range is not cut
+        chunks[2].text = "changed"
+        assert merge_chunks(chunks[1:3]) == f"{chunks[1].text} … changed"
+
+    def test_search_fetches_neighbors_in_one_batch(self, tmp_path, mocker):
+        """Test expanded results carry contiguous context from one fetch."""
+        from cortext_rag import retriever as retriever_module
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.store import VectorStore
+
+        class Embedder:
+            model_name = "fake"
+
+            def embed(self, texts):
+                return [[1.0, 0.0] for _ in texts]
+
+        mocker.patch.object(retriever_module, "Embedder", return_value=Embedder())
+        mocker.patch.object(
+            retriever_module,
+            "VectorStore",
+            lambda ws: VectorStore(ws, RAGConfig(backend="numpy")),
+        )
+        retriever = retriever_module.Retriever(tmp_path)
+        # a.md's chunk 3 is missing, so its passage ends at chunk 2
+        a_chunks = self._chunks("a.md")
+        del a_chunks[3]
+        retriever.store.add_chunks(
+            a_chunks, [[1.0, 0.5], [1.0, 0.4], [1.0, 0.0], [1.0, 0.6]], "a.md"
+        )
+        b_chunks = self._chunks("b.md", total=2)
+        retriever.store.add_chunks(b_chunks, [[1.0, 0.1], [1.0, 0.9]], "b.md")
+        get_chunks = mocker.spy(retriever.store, "get_chunks")
+
+        results = retriever.search("q", n_results=2, expand=2)
+
+        assert [r.chunk.chunk_id for r in results] == ["a.md::2", "b.md::0"]
+        assert results[0].context_chunks == [0, 1, 2]
+        assert results[0].context == " ".join(f"w{i}" for i in range(14))
+        assert results[1].context_chunks == [0, 1]
+        get_chunks.assert_called_once()
+        entry = retriever.format_results_json(results)[0]
+        assert entry["context"] == results[0].context
+        assert "context" not in retriever.format_results_json(
+            retriever.search("q", n_results=2)
+        )[0]
+        with pytest.raises(ValueError, match="expand"):
+            retriever.search("q", expand=-1)
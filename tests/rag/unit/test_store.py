@@ -0,0 +1,626 @@
+"""Unit tests for vector store backends and metadata filters."""
+
+import json
+
+import pytest
+
+
+def _vectors(*rows):
+    return [list(map(float, row)) for row in rows]
+
+
+class TestFilters:
+    """Tests for Chroma-style where filter evaluation."""
+
+    def test_equality_shorthand(self):
+        """Test plain values match by equality."""
+        from cortext_rag.filters import compile_where
+
+        predicate = compile_where({"source_path": "a.md"})
+        assert predicate({"source_path": "a.md"})
+        assert not predicate({"source_path": "b.md"})
+        assert not predicate({})
+
+    def test_operators_and_combinators(self):
+        """Test comparison operators inside $and/$or."""
+        from cortext_rag.filters import compile_where
+
+        predicate = compile_where(
+            {
+                "$and": [
+                    {"chunk_index": {"$gte": 1}},
+                    {"$or": [{"kind": {"$in": ["a", "b"]}}, {"path": {"$contains": "x"}}]},
+                ]
+            }
+        )
+        assert predicate({"chunk_index": 2, "kind": "a"})
+        assert predicate({"chunk_index": 1, "kind": "z", "path": "/x/y"})
+        assert not predicate({"chunk_index": 0, "kind": "a"})
+        assert not predicate({"chunk_index": 3, "kind": "z", "path": "/y"})
+
+    def test_unknown_operator(self):
+        """Test unsupported operators are rejected."""
+        from cortext_rag.filters import compile_where
+
+        with pytest.raises(ValueError, match="Unsupported filter operator"):
+            compile_where({"field": {"$regex": ".*"}})
+
+
+class TestNumpyBackend:
+    """Tests for the memory-mapped NumPy backend."""
+
+    def _backend(self, tmp_path):
+        from cortext_rag.backends.numpy_flat import NumpyBackend
+
+        return NumpyBackend(tmp_path, "test")
+
+    def test_add_and_query(self, tmp_path):
+        """Test nearest neighbors are ranked by cosine similarity."""
+        backend = self._backend(tmp_path)
+        backend.add(
+            ids=["a", "b", "c"],
+            embeddings=_vectors([1, 0, 0], [0, 1, 0], [1, 1, 0]),
+            documents=["alpha", "beta", "gamma"],
+            metadatas=[{"source_path": p} for p in ("a.md", "b.md", "c.md")],
+        )
+
+        results = backend.query([[2.0, 0.1, 0.0]], n_results=2)
+
+        assert results["ids"] == [["a", "c"]]
+        assert results["documents"] == [["alpha", "gamma"]]
+        assert results["scores"][0][0] == pytest.approx(0.99875, abs=1e-4)
+        assert results["scores"][0][0] > results["scores"][0][1]
+        assert backend.count() == 3
+
+    def test_query_with_filter(self, tmp_path):
+        """Test where filters restrict the candidates."""
+        backend = self._backend(tmp_path)
+        backend.add(
+            ids=["a", "b"],
+            embeddings=_vectors([1, 0], [0, 1]),
+            documents=["alpha", "beta"],
+            metadatas=[{"source_path": "a.md"}, {"source_path": "b.md"}],
+        )
+
+        results = backend.query([[1.0, 0.0]], n_results=5, where={"source_path": "b.md"})
+
+        assert results["ids"] == [["b"]]
+
+    def test_delete_and_upsert(self, tmp_path):
+        """Test deleted rows disappear and re-added ids replace old rows."""
+        backend = self._backend(tmp_path)
+        backend.add(
+            ids=["a", "b"],
+            embeddings=_vectors([1, 0], [0, 1]),
+            documents=["alpha", "beta"],
+            metadatas=[{"source_path": "a.md"}, {"source_path": "b.md"}],
+        )
+        backend.delete(where={"source_path": "a.md"})
+        backend.add(
+            ids=["b"],
+            embeddings=_vectors([1, 0]),
+            documents=["beta v2"],
+            metadatas=[{"source_path": "b.md"}],
+        )
+
+        assert backend.count() == 1
+        results = backend.get(ids=["a", "b"], include=["documents", "embeddings"])
+        assert results["ids"] == ["b"]
+        assert results["documents"] == ["beta v2"]
+        assert results["embeddings"][0] == pytest.approx([1.0, 0.0])
+
+    def test_delete_by_ids_and_filter(self, tmp_path):
+        """Test deleting by ids and a filter only removes rows matching both."""
+        backend = self._backend(tmp_path)
+        backend.add(
+            ids=["a", "b", "c"],
+            embeddings=_vectors([1, 0], [0, 1], [1, 1]),
+            documents=["alpha", "beta", "gamma"],
+            metadatas=[{"source_path": p} for p in ("a.md", "b.md", "a.md")],
+        )
+
+        backend.delete(ids=["a", "b"], where={"source_path": "a.md"})
+
+        assert backend.get()["ids"] == ["b", "c"]
+
+    def test_persistence_across_instances(self, tmp_path):
+        """Test a second instance (e.g. another process) sees the data."""
+        writer = self._backend(tmp_path)
+        writer.add(
+            ids=["a"],
+            embeddings=_vectors([0, 1]),
+            documents=["alpha"],
+            metadatas=[{"source_path": "a.md"}],
+        )
+
+        reader = self._backend(tmp_path)
+        assert reader.query([[0.0, 1.0]], n_results=1)["ids"] == [["a"]]
+
+        writer.delete(ids=["a"])
+        assert reader.count() == 0
+
+    def test_segments_are_merged(self, tmp_path):
+        """Test many small writes are folded into fewer segments."""
+        from cortext_rag.backends.numpy_flat import MAX_SEGMENTS
+
+        backend = self._backend(tmp_path)
+        for i in range(MAX_SEGMENTS + 3):
+            backend.add(
+                ids=[f"id-{i}"],
+                embeddings=_vectors([1, i]),
+                documents=[f"doc {i}"],
+                metadatas=[{"source_path": f"{i}.md"}],
+            )
+
+        manifest = json.loads((tmp_path / "test" / "manifest.json").read_text())
+        assert len(manifest["segments"]) <= MAX_SEGMENTS
+        assert backend.count() == MAX_SEGMENTS + 3
+        # Merged segments are kept for readers until their grace period ends
+        assert len(list((tmp_path / "test").glob("seg-*"))) == len(
+            manifest["segments"]
+        ) + len(manifest["retired"])
+        assert backend.get(ids=["id-0"])["documents"] == ["doc 0"]
+
+    def test_reader_of_previous_manifest_after_merge(self, tmp_path, mocker):
+        """Test merged segments stay readable until vacuum removes them."""
+        from cortext_rag.backends import numpy_flat
+
+        writer = self._backend(tmp_path)
+        for name in ("a", "b"):
+            writer.add(ids=[name], embeddings=_vectors([1, 0]), documents=[name], metadatas=[{}])
+        reader = self._backend(tmp_path)
+        previous = reader._load_manifest()
+
+        writer.rebuild()
+        writer.add(ids=["c"], embeddings=_vectors([0, 1]), documents=["c"], metadatas=[{}])
+
+        # Rows located through the previous manifest are still on disk
+        locations = [(entry["name"], 0) for entry in previous["segments"]]
+        assert reader._collect(locations, ["documents", "metadatas"])["documents"] == [
+            "a",
+            "b",
+        ]
+
+        mocker.patch.object(numpy_flat, "RETIRE_GRACE", 0.0)
+        writer.vacuum()
+
+        manifest = json.loads((tmp_path / "test" / "manifest.json").read_text())
+        assert manifest["retired"] == {}
+        assert len(list((tmp_path / "test").glob("seg-*"))) == 2
+        assert sorted(reader.get()["ids"]) == ["a", "b", "c"]
+
+    def test_dimension_mismatch(self, tmp_path):
+        """Test vectors of another dimension are rejected."""
+        backend = self._backend(tmp_path)
+        backend.add(ids=["a"], embeddings=_vectors([1, 0]), documents=["a"], metadatas=[{}])
+
+        with pytest.raises(ValueError, match="dimension"):
+            backend.add(
+                ids=["b"], embeddings=_vectors([1, 0, 0]), documents=["b"], metadatas=[{}]
+            )
+
+    def test_rebuild_merges_segments(self, tmp_path):
+        """Test rebuild leaves one segment with only live rows."""
+        backend = self._backend(tmp_path)
+        for name in ("a", "b", "c"):
+            backend.add(ids=[name], embeddings=_vectors([1, 0]), documents=[name], metadatas=[{}])
+        backend.delete(ids=["b"])
+
+        assert backend.rebuild() == 2
+
+        manifest = json.loads((tmp_path / "test" / "manifest.json").read_text())
+        assert len(manifest["segments"]) == 1
+        assert manifest["deleted"] == {}
+        assert sorted(backend.get()["ids"]) == ["a", "c"]
+
+    @pytest.mark.parametrize("quantization", ["binary", "int8"])
+    def test_quantized_prefilter(self, tmp_path, quantization):
+        """Test quantized search reranks candidates to the exact top results."""
+        import numpy as np
+
+        from cortext_rag.backends.numpy_flat import NumpyBackend
+
+        rng = np.random.default_rng(0)
+        centers = rng.standard_normal((10, 64))
+        vectors = centers[rng.integers(0, 10, 500)] + 0.3 * rng.standard_normal((500, 64))
+        exact = self._backend(tmp_path)
+        exact.add(
+            ids=[str(i) for i in range(500)],
+            embeddings=vectors.tolist(),
+            documents=[f"doc {i}" for i in range(500)],
+            metadatas=[{"even": i % 2 == 0} for i in range(500)],
+        )
+        quantized = NumpyBackend(tmp_path, "test", quantization=quantization, oversample=8)
+
+        for query in vectors[:5].tolist():
+            expected = exact.query([query], n_results=5)
+            results = quantized.query([query], n_results=5)
+            assert results["ids"][0][0] == expected["ids"][0][0]
+            assert results["scores"][0][0] == pytest.approx(expected["scores"][0][0])
+
+        filtered = quantized.query([vectors[1].tolist()], n_results=3, where={"even": True})
+        assert all(int(i) % 2 == 0 for i in filtered["ids"][0])
+
+        # Searches encode older segments in memory; writers save the codes
+        codes_files = (tmp_path / "test").glob(f"seg-*/{quantization}.npy")
+        assert not list(codes_files)
+        quantized.rebuild()
+        (segment,) = quantized._load_manifest()["segments"]
+        assert (tmp_path / "test" / segment["name"] / f"{quantization}.npy").exists()
+        results = quantized.query([vectors[0].tolist()], n_results=5)
+        assert results["ids"][0][0] == exact.query([vectors[0].tolist()], n_results=5)["ids"][0][0]
+
+    def test_quantized_codes_written_with_segment(self, tmp_path):
+        """Test a quantized backend saves the side index when adding vectors."""
+        from cortext_rag.backends.numpy_flat import NumpyBackend
+
+        backend = NumpyBackend(tmp_path, "test", quantization="int8")
+        backend.add(ids=["a"], embeddings=_vectors([1, 0]), documents=["a"], metadatas=[{}])
+
+        (segment,) = backend._load_manifest()["segments"]
+        assert sorted(p.name for p in (tmp_path / "test" / segment["name"]).glob("int8*")) == [
+            "int8.npy",
+            "int8_scale.npy",
+        ]
+
+    def test_clear(self, tmp_path):
+        """Test clear removes all vectors."""
+        backend = self._backend(tmp_path)
+        backend.add(ids=["a"], embeddings=_vectors([1, 0]), documents=["a"], metadatas=[{}])
+        backend.clear()
+
+        assert backend.count() == 0
+        assert backend.query([[1.0, 0.0]], n_results=3)["ids"] == [[]]
+
+
+class TestVectorStoreBackends:
+    """Tests for backend selection in VectorStore."""
+
+    def test_numpy_backend_from_config(self, sample_workspace):
+        """Test the workspace config selects the NumPy backend."""
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.models import Chunk
+        from cortext_rag.store import VectorStore
+
+        registry_path = sample_workspace / ".workspace" / "registry.json"
+        registry = json.loads(registry_path.read_text())
+        registry["rag"] = {"backend": "numpy"}
+        registry_path.write_text(json.dumps(registry))
+
+        store = VectorStore(sample_workspace)
+        assert store.config.backend == "numpy"
+        assert store.db_path.name == "vectors"
+
+        chunks = [
+            Chunk(text=f"chunk {i}", source_path="doc.md", chunk_index=i, total_chunks=2)
+            for i in range(2)
+        ]
+        store.add_chunks(chunks, _vectors([0, 1], [1, 0]), "doc.md")
+
+        assert store.get_source_embeddings("doc.md") == [
+            pytest.approx([0.0, 1.0]),
+            pytest.approx([1.0, 0.0]),
+        ]
+        results = store.search([1.0, 0.0], n_results=1)
+        assert results[0].chunk.chunk_index == 1
+        assert store.get_stats()["num_documents"] == 1
+
+        store.reassign_source("doc.md", "copy.md")
+        assert store.get_source_embeddings("doc.md") == []
+        assert len(store.get_source_embeddings("copy.md")) == 2
+
+        assert RAGConfig.load(sample_workspace).backend == "numpy"
+
+    def test_unknown_backend(self):
+        """Test unknown backend names are rejected."""
+        from cortext_rag.config import RAGConfig
+
+        with pytest.raises(ValueError, match="backend"):
+            RAGConfig.from_dict({"backend": "faiss"})
+
+    def test_required_packages_follow_backend(self):
+        """Test chromadb is only required by the Chroma backend."""
+        from cortext_rag.config import RAGConfig
+
+        assert "chromadb" in RAGConfig().required_packages
+        assert RAGConfig(backend="numpy").required_packages == ("fastembed", "numpy")
+
+    def test_chroma_options_from_config(self, tmp_path):
+        """Test HNSW settings are passed to the Chroma backend."""
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.store import VectorStore
+
+        config = RAGConfig.from_dict({"distance": "ip", "hnsw_m": 32, "hnsw_search_ef": 200})
+        store = VectorStore(tmp_path, config=config)
+
+        assert store.backend.index_metadata == {
+            "hnsw:space": "ip",
+            "hnsw:M": 32,
+            "hnsw:construction_ef": 100,
+            "hnsw:search_ef": 200,
+        }
+        with pytest.raises(ValueError, match="distance"):
+            RAGConfig.from_dict({"distance": "manhattan"})
+
+    def test_quantization_options_from_config(self, tmp_path):
+        """Test quantization settings are passed to the NumPy backend."""
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.store import VectorStore
+
+        config = RAGConfig.from_dict(
+            {"backend": "numpy", "quantization": "int8", "quantization_oversample": 4}
+        )
+        store = VectorStore(tmp_path, config=config)
+
+        assert store.backend.quantization == "int8"
+        assert store.backend.oversample == 4
+        with pytest.raises(ValueError, match="quantization"):
+            RAGConfig.from_dict({"quantization": "pq"})
+
+
+class TestShardedStore:
+    """Tests for per-conversation-type shards."""
+
+    def _store(self, workspace):
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.models import Chunk
+        from cortext_rag.store import VectorStore
+
+        store = VectorStore(
+            workspace, config=RAGConfig(backend="numpy", shard_by_type=True)
+        )
+        for i, (conversation_type, vector) in enumerate(
+            [("debug", [1, 0]), ("plan", [0.9, 0.1]), (None, [0.8, 0.2])]
+        ):
+            metadata = {"conversation_type": conversation_type} if conversation_type else {}
+            chunk = Chunk(
+                text=f"chunk {i}",
+                source_path=f"doc{i}.md",
+                chunk_index=0,
+                total_chunks=1,
+                metadata=metadata,
+            )
+            store.add_chunks([chunk], _vectors(vector), chunk.source_path)
+        return store
+
+    def test_chunks_routed_to_shards(self, sample_workspace):
+        """Test each type is stored in its own collection."""
+        store = self._store(sample_workspace)
+
+        stats = store.get_stats()
+
+        assert stats["total_chunks"] == 3
+        assert stats["shards"] == {"brainstorm": 0, "debug": 1, "plan": 1, "_other": 1}
+        assert (store.db_path / "cortext_chunks__debug" / "manifest.json").exists()
+
+    def test_sample_spans_shards(self, sample_workspace):
+        """Test samples are drawn at random from every shard by size."""
+        import numpy as np
+
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.models import Chunk
+        from cortext_rag.store import VectorStore
+
+        store = VectorStore(
+            sample_workspace, config=RAGConfig(backend="numpy", shard_by_type=True)
+        )
+        for conversation_type, rows, sign in [("debug", 900, 1.0), ("plan", 100, -1.0)]:
+            chunks = [
+                Chunk(
+                    text=f"{conversation_type} {i}",
+                    source_path=f"{conversation_type}.md",
+                    chunk_index=i,
+                    total_chunks=rows,
+                    metadata={"conversation_type": conversation_type},
+                )
+                for i in range(rows)
+            ]
+            # First component tells the shard apart, second the row
+            vectors = [[sign, i / rows] for i in range(rows)]
+            store.add_chunks(chunks, vectors, f"{conversation_type}.md")
+
+        sample = np.asarray(store.sample_embeddings(100, seed=0))
+
+        assert len(sample) == 100
+        assert (sample[:, 0] < 0).sum() == 10
+        debug_rows = sample[sample[:, 0] > 0]
+        # Not just the first rows of the first shard
+        assert (debug_rows[:, 1] / debug_rows[:, 0]).max() > 0.5
+        assert len(store.sample_embeddings(5000)) == 1000
+
+    def test_fan_out_and_filtered_search(self, sample_workspace):
+        """Test unfiltered searches merge shards and type filters hit one."""
+        store = self._store(sample_workspace)
+
+        merged = store.search([1.0, 0.0], n_results=2)
+        assert [r.chunk.source_path for r in merged] == ["doc0.md", "doc1.md"]
+        assert merged[0].score >= merged[1].score
+
+        filtered = store.search(
+            [1.0, 0.0], n_results=5, where={"conversation_type": "plan"}
+        )
+        assert [r.chunk.source_path for r in filtered] == ["doc1.md"]
+
+    def test_clear_one_type(self, sample_workspace):
+        """Test clearing a type leaves the other shards untouched."""
+        store = self._store(sample_workspace)
+
+        store.clear("debug")
+
+        assert store.get_stats()["shards"] == {
+            "brainstorm": 0,
+            "debug": 0,
+            "plan": 1,
+            "_other": 1,
+        }
+        assert store.reindex("plan") == 1
+
+    def test_reassign_moves_shard(self, sample_workspace):
+        """Test reassigned chunks follow the new path's type."""
+        store = self._store(sample_workspace)
+
+        store.reassign_source("doc0.md", "copy.md", fields={"conversation_type": "plan"})
+
+        assert store.get_stats()["shards"]["debug"] == 0
+        results = store.search([1.0, 0.0], n_results=5, where={"conversation_type": "plan"})
+        assert {r.chunk.source_path for r in results} == {"copy.md", "doc1.md"}
+
+
+class TestDocumentVectors:
+    """Tests for the per-document vectors behind similar-document lookups."""
+
+    def _store(self, tmp_path):
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.store import VectorStore
+
+        return VectorStore(tmp_path, config=RAGConfig(backend="numpy"))
+
+    def _chunks(self, source_path, words):
+        from cortext_rag.models import Chunk
+
+        chunks, start = [], 0
+        for i, count in enumerate(words):
+            chunks.append(
+                Chunk(
+                    text=f"{source_path} chunk {i}",
+                    source_path=source_path,
+                    chunk_index=i,
+                    total_chunks=len(words),
+                    metadata={"start_word": start, "end_word": start + count},
+                )
+            )
+            start += count
+        return chunks
+
+    def test_length_weighted_mean(self, tmp_path):
+        """Test long chunks dominate the document vector."""
+        store = self._store(tmp_path)
+        store.add_chunks(self._chunks("a.md", [10, 90]), _vectors([1, 0], [0, 1]), "a.md")
+        store.add_chunks(self._chunks("b.md", [100]), _vectors([1, 0]), "b.md")
+        store.add_chunks(self._chunks("c.md", [100]), _vectors([0.1, 1]), "c.md")
+
+        results = store.similar_documents("a.md", n_results=5)
+
+        assert [r.chunk.source_path for r in results] == ["c.md", "b.md"]
+        assert results[0].chunk.chunk_index == 0
+        assert "doc_norm" not in results[0].chunk.metadata
+
+    def test_streamed_batches_fold_in(self, tmp_path):
+        """Test adding a document in batches gives the same vector."""
+        chunks = self._chunks("a.md", [10, 30, 60])
+        vectors = _vectors([1, 0], [0, 1], [1, 1])
+
+        whole = self._store(tmp_path / "whole")
+        whole.add_chunks(chunks, vectors, "a.md")
+        batched = self._store(tmp_path / "batched")
+        batched.add_chunks(chunks[:1], vectors[:1], "a.md")
+        batched.add_chunks(chunks[1:], vectors[1:], "a.md")
+
+        expected = whole.documents.get(ids=["a.md"], include=["embeddings", "documents"])
+        actual = batched.documents.get(ids=["a.md"], include=["embeddings", "documents"])
+        assert actual["embeddings"][0] == pytest.approx(expected["embeddings"][0], abs=1e-6)
+        assert actual["documents"] == ["a.md chunk 0"]
+
+    def test_follow_deletes_moves_and_reindex(self, tmp_path):
+        """Test document vectors track deleted and moved sources."""
+        store = self._store(tmp_path)
+        store.add_chunks(self._chunks("a.md", [10]), _vectors([1, 0]), "a.md")
+        store.add_chunks(self._chunks("b.md", [10]), _vectors([1, 0.1]), "b.md")
+
+        store.reassign_source("b.md", "copy.md")
+        assert [r.chunk.source_path for r in store.similar_documents("a.md")] == ["copy.md"]
+
+        store.delete_by_source("copy.md")
+        assert store.similar_documents("a.md") == []
+
+        store.documents.clear()
+        store.reindex()
+        assert store.get_stats()["document_vectors"] == 1
+
+
+class TestTieredStore:
+    """Tests for the hot and cold tiers."""
+
+    def _store(self, workspace, tiering=True):
+        from cortext_rag.config import RAGConfig
+        from cortext_rag.store import VectorStore
+
+        return VectorStore(workspace, config=RAGConfig(backend="numpy", tiering=tiering))
+
+    def _add(self, store, path, vector, **metadata):
+        from cortext_rag.models import Chunk
+
+        chunk = Chunk(
+            text=f"{path.name} text",
+            source_path=str(path),
+            chunk_index=0,
+            total_chunks=1,
+            metadata=metadata,
+        )
+        store.update_chunks([chunk], _vectors(vector), chunk.source_path)
+
+    def _fill(self, store, workspace):
+        from datetime import date
+
+        today = int(date.today().strftime("%Y%m%d"))
+        self._add(store, workspace / "conv" / "recent.md", [1, 0], conversation_date=today)
+        self._add(store, workspace / "old.md", [0.9, 0.1], conversation_date=20200101)
+        self._add(store, workspace / "notes.md", [0, 1])
+
+    def test_chunks_routed_by_date(self, tmp_path):
+        """Test old conversations go cold and recent or undated ones stay hot."""
+        store = self._store(tmp_path)
+        self._fill(store, tmp_path)
+
+        tiers = store.get_stats()["tiers"]
+
+        assert (tiers["hot"], tiers["cold"]) == (2, 1)
+        assert (store.db_path / "cortext_chunks__cold" / "manifest.json").exists()
+        assert store._backend_for(None).in_memory
+
+    def test_cold_tier_searched_when_needed(self, tmp_path, mocker):
+        """Test the cold tier is queried only for weak results or old dates."""
+        from cortext_rag.store import _cold_shard
+
+        store = self._store(tmp_path)
+        self._fill(store, tmp_path)
+        cold_query = mocker.spy(store._backend_for(_cold_shard(None)), "query")
+
+        results = store.search([1.0, 0.0], n_results=1)
+        assert [r.chunk.text for r in results] == ["recent.md text"]
+        cold_query.assert_not_called()
+
+        # Too few hot results
+        results = store.search([1.0, 0.0], n_results=3)
+        assert [r.chunk.text for r in results][:2] == ["recent.md text", "old.md text"]
+        assert cold_query.call_count == 1
+
+        # A date range reaching past the hot window
+        store.search([1.0, 0.0], n_results=1, where={"conversation_date": {"$lte": 20991231}})
+        assert cold_query.call_count == 2
+
+    def test_archive_persists_across_embeds(self, tmp_path):
+        """Test archived conversations move cold and stay there when re-embedded."""
+        store = self._store(tmp_path)
+        self._fill(store, tmp_path)
+
+        assert store.archive(str(tmp_path / "conv")) == 1
+        assert store.get_stats()["tiers"]["cold"] == 2
+
+        self._add(store, tmp_path / "conv" / "recent.md", [1, 0])
+        assert store.get_stats()["tiers"]["cold"] == 2
+        results = store.search([1.0, 0.0], n_results=1)
+        assert results[0].chunk.metadata["archived"] is True
+
+    def test_retier_applies_settings(self, tmp_path):
+        """Test retier moves stored chunks when tiering is turned on and off."""
+        self._fill(self._store(tmp_path, tiering=False), tmp_path)
+
+        store = self._store(tmp_path)
+        assert store.retier() == 1
+        assert store.get_stats()["tiers"]["cold"] == 1
+        assert store.retier() == 0
+
+        untiered = self._store(tmp_path, tiering=False)
+        assert untiered.retier() == 1
+        assert untiered.get_stats()["total_chunks"] == 3